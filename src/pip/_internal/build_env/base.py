@@ -58,6 +58,14 @@ class BuildEnvironment(ContextManager[None], metaclass=abc.ABCMeta):
     @abc.abstractmethod
     def __init__(self, installer: BuildEnvironmentInstaller): ...
 
+    def get_environ(self) -> dict[str, str]:
+        """Return the environment variables set while in this environment.
+
+        Subprocesses can be run with these instead of entering the environment,
+        which changes os.environ for the whole process.
+        """
+        return {}
+
     def check_requirements(
         self, reqs: Iterable[str]
     ) -> tuple[set[tuple[str, str]], set[str]]:
@@ -102,19 +102,20 @@ class VenvBuildEnvironment(BuildEnvironment):
                 f"Python executable failed to copy to {self.python_executable}"
             )
 
-    def __enter__(self) -> None:
+    def get_environ(self) -> dict[str, str]:
         # We want backend calls to be able to use binaries installed as if this
         # virtual environment was "activated".
-        self._save_env = {
-            name: os.environ.get(name, None) for name in ("PATH", "PYTHONPATH")
-        }
-
         new_path = [self._bin_path]
-        if old_path := self._save_env["PATH"]:
+        if old_path := os.environ.get("PATH"):
             new_path.extend(old_path.split(os.pathsep))
         # However, we don't want a pre-existing PYTHONPATH to influence the
         # backend calls.
-        os.environ.update({"PATH": os.pathsep.join(new_path), "PYTHONPATH": ""})
+        return {"PATH": os.pathsep.join(new_path), "PYTHONPATH": ""}
+
+    def __enter__(self) -> None:
+        environ = self.get_environ()
+        self._save_env = {name: os.environ.get(name, None) for name in environ}
+        os.environ.update(environ)
 
     def __exit__(
         self,
@@ -90,26 +90,24 @@ class VirtualBuildEnvironment(BuildEnvironment):
                     site.addsitedir(path)
                 """).format(system_sites=system_sites, lib_dirs=self.lib_dirs))
 
-    def __enter__(self) -> None:
-        self._save_env = {
-            name: os.environ.get(name, None)
-            for name in ("PATH", "PYTHONNOUSERSITE", "PYTHONPATH")
-        }
-
+    def get_environ(self) -> dict[str, str]:
         path = self._bin_dirs[:]
-        old_path = self._save_env["PATH"]
+        old_path = os.environ.get("PATH")
         if old_path:
             path.extend(old_path.split(os.pathsep))
 
         pythonpath = [self._site_dir]
 
-        os.environ.update(
-            {
-                "PATH": os.pathsep.join(path),
-                "PYTHONNOUSERSITE": "1",
-                "PYTHONPATH": os.pathsep.join(pythonpath),
-            }
-        )
+        return {
+            "PATH": os.pathsep.join(path),
+            "PYTHONNOUSERSITE": "1",
+            "PYTHONPATH": os.pathsep.join(pythonpath),
+        }
+
+    def __enter__(self) -> None:
+        environ = self.get_environ()
+        self._save_env = {name: os.environ.get(name, None) for name in environ}
+        os.environ.update(environ)
 
     def __exit__(
         self,
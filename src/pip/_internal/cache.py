@@ -6,19 +6,29 @@ import hashlib
 import json
 import logging
 import os
+import tempfile
+import time
+import zipfile
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from pip._vendor.packaging.tags import Tag, interpreter_name, interpreter_version
 from pip._vendor.packaging.utils import canonicalize_name
 
-from pip._internal.exceptions import InvalidWheelFilename
+from pip._internal.exceptions import InstallationError, InvalidWheelFilename
 from pip._internal.models.direct_url import DirectUrl
 from pip._internal.models.link import Link
-from pip._internal.models.wheel import Wheel
+from pip._internal.models.wheel import get_wheel
+from pip._internal.utils.filesystem import write_file_atomically
+from pip._internal.utils.hashes import Hashes
+from pip._internal.utils.misc import ensure_dir, hash_file, read_chunks, rmtree
 from pip._internal.utils.temp_dir import TempDirectory, tempdir_kinds
+from pip._internal.utils.unpacking import unzip_file
 from pip._internal.utils.urls import path_to_url
 
+if TYPE_CHECKING:
+    from hashlib import _Hash
+
 logger = logging.getLogger(__name__)
 
 ORIGIN_JSON_NAME = "origin.json"
@@ -143,7 +153,7 @@ class SimpleWheelCache(Cache):
         supported_tags_set = set(supported_tags)
         for wheel_name, wheel_dir in self._get_candidates(link, canonical_package_name):
             try:
-                wheel = Wheel(wheel_name)
+                wheel = get_wheel(wheel_name)
             except InvalidWheelFilename:
                 continue
             if wheel.name != canonical_package_name:
@@ -292,3 +302,370 @@ class WheelCache(Cache):
                         download_info.url,
                     )
         origin_path.write_text(download_info.to_json(), encoding="utf-8")
+
+
+class _DigestCache:
+    """An abstract class - keeps each entry of a cache in a subdirectory of
+    the cache, at a path made from a hex digest identifying the entry.
+
+    :param cache_dir: The root of the cache. If empty, nothing is cached.
+    """
+
+    subdirectory: str
+
+    def __init__(self, cache_dir: str) -> None:
+        assert not cache_dir or os.path.isabs(cache_dir)
+        self.cache_dir = cache_dir or None
+
+    @property
+    def directory(self) -> str:
+        assert self.cache_dir
+        return os.path.join(self.cache_dir, self.subdirectory)
+
+    def _get_path_for_digest(self, digest: str, *names: str) -> str:
+        # Nest the directories like the wheel cache, so that none of them
+        # holds too many entries.
+        parts = [digest[:2], digest[2:4], digest[4:6], digest[6:]]
+        return os.path.join(self.directory, *parts, *names)
+
+    def _get_path_for_key(self, key: str) -> str:
+        return self._get_path_for_digest(hashlib.sha224(key.encode()).hexdigest())
+
+    def _write(self, path: str, contents: bytes) -> None:
+        """Write the entry at path, or log why it could not be written."""
+        try:
+            # Inherit the read/write permissions of the cache directory
+            # to enable multi-user cache use-cases.
+            write_file_atomically(path, contents, self.directory)
+        except OSError as e:
+            # The cache is an optimization, carry on without it.
+            logger.debug("Could not write cache entry %s: %s", path, e)
+
+    def _write_json(self, path: str, data: Any) -> None:
+        self._write(path, json.dumps(data, separators=(",", ":")).encode("utf-8"))
+
+
+class MetadataCache(_DigestCache):
+    """A cache of the core metadata of distribution files.
+
+    Entries are keyed by the sha256 of the distribution file they describe,
+    which fully determines its metadata, so they never go stale. Reading an
+    entry marks it as recently used, so that :meth:`trim` removes the least
+    recently used entries first.
+
+    :param cache_dir: The root of the cache.
+    """
+
+    subdirectory = "metadata"
+
+    def get_path_for_link(self, link: Link) -> str | None:
+        """Return the file to store the metadata of link in, if it can be
+        cached, i.e. if the sha256 of the file it points to is known.
+        """
+        if not self.cache_dir or link.is_file:
+            return None
+        sha256 = link.get_hash("sha256")
+        if sha256 is None:
+            return None
+        # Keep the filename so that entries can be matched by project name.
+        return self._get_path_for_digest(sha256, f"{link.filename}.metadata")
+
+    def get(self, link: Link) -> bytes | None:
+        """Return the cached metadata of link, if any."""
+        path = self.get_path_for_link(link)
+        if path is None:
+            return None
+        try:
+            with open(path, "rb") as f:
+                contents = f.read()
+            os.utime(path)
+        except OSError:
+            return None
+        return contents
+
+    def set(self, link: Link, contents: bytes) -> None:
+        """Record the metadata of link, if it can be cached."""
+        path = self.get_path_for_link(link)
+        if path is None or os.path.exists(path):
+            return
+        self._write(path, contents)
+
+    def trim(self, max_size: int) -> list[str]:
+        """Remove the least recently used entries until the cache takes at
+        most max_size bytes. Return the paths of the removed entries.
+        """
+        entries = []
+        for root, _, files in os.walk(self.directory):
+            for filename in files:
+                path = os.path.join(root, filename)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        removed = []
+        size = 0
+        for _, entry_size, path in sorted(entries, reverse=True):
+            size += entry_size
+            if size <= max_size:
+                continue
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                continue
+            removed.append(path)
+        return removed
+
+
+class IndexPageCache(_DigestCache):
+    """A cache of the links parsed from package index pages.
+
+    Entries are keyed by the URL of the page and record the validator (e.g.
+    the ETag) of the response they were parsed from. An entry is only returned
+    for a response with the same validator, and is replaced when the page
+    changes.
+
+    :param cache_dir: The root of the cache.
+    """
+
+    subdirectory = "index-pages"
+
+    def get_path_for_url(self, url: str) -> str:
+        return self._get_path_for_key(url)
+
+    def get(self, url: str, validator: str) -> list[Any] | None:
+        """Return the links recorded for the page at url, if they were parsed
+        from a response with the same validator.
+        """
+        if not self.cache_dir:
+            return None
+        try:
+            with open(self.get_path_for_url(url), "rb") as f:
+                data = json.load(f)
+            if data["validator"] == validator:
+                return data["links"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return None
+
+    def set(self, url: str, validator: str, links: list[Any]) -> None:
+        """Record the links parsed from the page at url."""
+        if not self.cache_dir:
+            return
+        data = {"validator": validator, "links": links}
+        self._write_json(self.get_path_for_url(url), data)
+
+
+class NotFoundCache(_DigestCache):
+    """A record of the index pages which were recently not found.
+
+    Most projects are missing from most extra indexes, and error responses
+    aren't kept by the HTTP cache, so each run would otherwise ask every
+    index again. Entries are keyed by the URL of the page, and are only
+    trusted for a short time, so that newly published projects are found.
+
+    :param cache_dir: The root of the cache. If empty, nothing is recorded.
+    :param ttl: How long, in seconds, a page is assumed to still be missing.
+    """
+
+    subdirectory = "not-found"
+
+    def __init__(self, cache_dir: str, ttl: float = 5 * 60) -> None:
+        super().__init__(cache_dir)
+        self.ttl = ttl
+
+    def get_path_for_url(self, url: str) -> str:
+        return self._get_path_for_key(url)
+
+    def is_missing(self, url: str) -> bool:
+        """Whether the page at url was not found less than ttl seconds ago."""
+        if not self.cache_dir:
+            return False
+        try:
+            with open(self.get_path_for_url(url), "rb") as f:
+                data = json.load(f)
+            age = time.time() - data["time"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+        return 0 <= age < self.ttl
+
+    def add(self, url: str) -> None:
+        """Record that the page at url was not found."""
+        if not self.cache_dir:
+            return
+        self._write_json(self.get_path_for_url(url), {"time": time.time()})
+
+
+class ResolutionCache(_DigestCache):
+    """A cache of the results of dependency resolutions.
+
+    Entries are keyed by a description of everything the resolution depends
+    on except the contents of the index pages it consulted. Those are
+    recorded in the entry by version, and must be checked by the caller
+    before using it.
+
+    :param cache_dir: The root of the cache. If empty, nothing is recorded.
+    """
+
+    subdirectory = "resolutions"
+
+    def get_path_for_key(self, key: str) -> str:
+        return self._get_path_for_key(key)
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return the result recorded for key, if any."""
+        if not self.cache_dir:
+            return None
+        try:
+            with open(self.get_path_for_key(key), "rb") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict):
+            return None
+        return data
+
+    def set(self, key: str, data: dict[str, Any]) -> None:
+        """Record the result of the resolution described by key."""
+        if not self.cache_dir:
+            return
+        self._write_json(self.get_path_for_key(key), data)
+
+
+class FileHashCache(_DigestCache):
+    """A record of the hashes of local files, so that files which have not
+    changed since they were hashed don't need to be hashed again.
+
+    Entries are keyed by the absolute path of the file, and record its size,
+    modification and change times and inode along with the hex digests
+    computed so far. The digests are only trusted while all of these match
+    the file.
+
+    :param cache_dir: The root of the cache. If empty, files are always
+        hashed.
+    """
+
+    subdirectory = "file-hashes"
+
+    def get_path_for_file(self, path: str) -> str:
+        return self._get_path_for_key(os.path.abspath(path))
+
+    @staticmethod
+    def _stat_key(stat: os.stat_result) -> list[int]:
+        return [stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns, stat.st_ino]
+
+    def _get(self, path: str, stat_key: list[int]) -> dict[str, str]:
+        if not self.cache_dir:
+            return {}
+        try:
+            with open(self.get_path_for_file(path), "rb") as f:
+                data = json.load(f)
+            if data["stat"] == stat_key:
+                return dict(data["hashes"])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return {}
+
+    def _set(self, path: str, stat_key: list[int], hashes: dict[str, str]) -> None:
+        if not self.cache_dir:
+            return
+        data = {"stat": stat_key, "hashes": hashes}
+        self._write_json(self.get_path_for_file(path), data)
+
+    def get(self, path: str) -> dict[str, str]:
+        """Return the hex digests recorded for the file at path, by hash name,
+        if it has not changed since.
+        """
+        if not self.cache_dir:
+            return {}
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return {}
+        return self._get(path, self._stat_key(stat))
+
+    def hash_file(self, path: str, hashers: dict[str, _Hash]) -> None:
+        """Feed the contents of the file at path to hashers, and record their
+        digests along with the ones already recorded for the file.
+        """
+        with open(path, "rb") as f:
+            stat_key = self._stat_key(os.fstat(f.fileno()))
+            for chunk in read_chunks(f):
+                for hasher in hashers.values():
+                    hasher.update(chunk)
+            # Don't record digests of a file which changed while being read.
+            if self._stat_key(os.fstat(f.fileno())) != stat_key:
+                return
+        recorded = self._get(path, stat_key)
+        recorded.update((name, hasher.hexdigest()) for name, hasher in hashers.items())
+        self._set(path, stat_key, recorded)
+
+    def check_against_path(self, hashes: Hashes, path: str) -> None:
+        """Check hashes against the file at path, like
+        Hashes.check_against_path(), trusting the digests recorded for the file
+        if it has not changed since.
+        """
+        if hashes.has_one_of(self.get(path)):
+            return
+        hashers = hashes.make_hashers()
+        self.hash_file(path, hashers)
+        hashes.check_against_hashers(hashers)
+
+    def sha256(self, path: str) -> str:
+        """Return the sha256 hex digest of the file at path."""
+        digest = self.get(path).get("sha256")
+        if digest is None:
+            hashers = {"sha256": hashlib.sha256()}
+            self.hash_file(path, hashers)
+            digest = hashers["sha256"].hexdigest()
+        return digest
+
+
+class UnpackedWheelStore(_DigestCache):
+    """A store of unpacked wheels, to install them without extracting them.
+
+    Entries are keyed by the sha256 of the wheel file, so they never go stale,
+    and hold the files of the wheel as they are laid out in the archive. The
+    files are meant to be cloned or copied into the places a wheel is
+    installed to, so they must never be modified.
+
+    :param cache_dir: The root of the cache.
+    """
+
+    subdirectory = "unpacked-wheels"
+
+    def get_path_for_wheel(self, wheel_path: str) -> str:
+        """Return the directory to unpack the wheel at wheel_path into."""
+        sha256 = hash_file(wheel_path)[0].hexdigest()
+        # Keep the filename so that entries can be matched by project name.
+        return self._get_path_for_digest(sha256, os.path.basename(wheel_path))
+
+    def unpack(self, wheel_path: str) -> str | None:
+        """Return the directory holding the unpacked files of the wheel at
+        wheel_path, unpacking it first if needed.
+
+        Return None if the wheel cannot be stored.
+        """
+        if not self.cache_dir:
+            return None
+        path = self.get_path_for_wheel(wheel_path)
+        if os.path.isdir(path):
+            return path
+        try:
+            parent = os.path.dirname(path)
+            ensure_dir(parent)
+            # Unpack next to the entry and move it in place at once, so that
+            # concurrent installs never see a partially unpacked wheel.
+            tmp_dir = tempfile.mkdtemp(prefix=".unpack-", dir=parent)
+            try:
+                unzip_file(wheel_path, tmp_dir, flatten=False)
+                os.rename(tmp_dir, path)
+            finally:
+                if os.path.isdir(tmp_dir):
+                    rmtree(tmp_dir)
+        except (OSError, InstallationError, zipfile.BadZipFile) as e:
+            # The wheel is installed from its file instead.
+            logger.debug("Could not store unpacked %s: %s", wheel_path, e)
+        # Another process may have stored the wheel first.
+        return path if os.path.isdir(path) else None
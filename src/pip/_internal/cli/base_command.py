@@ -33,6 +33,7 @@ from pip._internal.exceptions import (
     NetworkConnectionError,
     PreviousBuildDirError,
 )
+from pip._internal.metadata import environment_snapshots
 from pip._internal.utils.filesystem import check_path_owner
 from pip._internal.utils.logging import BrokenStdoutLoggingError, setup_logging
 from pip._internal.utils.misc import get_prog, normalize_path
@@ -212,6 +213,15 @@ class Command(CommandContextMixIn):
                 ", ".join(sorted(always_enabled_features)),
             )
 
+        if (
+            options.http_cache_max_size is not None
+            and "single-file-http-cache" not in options.features_enabled
+        ):
+            logger.warning(
+                "--http-cache-max-size is ignored without "
+                "--use-feature=single-file-http-cache."
+            )
+
         # Make sure that the --python argument isn't specified after the
         # subcommand. We can tell, because if --python was specified,
         # we should only reach this point if we're running in the created
@@ -252,6 +262,11 @@ class Command(CommandContextMixIn):
                 )
                 options.cache_dir = None
 
+        if options.cache_dir:
+            self.enter_context(
+                environment_snapshots(os.path.join(options.cache_dir, "environments"))
+            )
+
         return self._run_wrapper(level_number, options, args)
 
     def handler_map(self) -> dict[str, Callable[[Values, list[str]], None]]:
@@ -34,7 +34,7 @@ from pip._internal.models.release_control import ReleaseControl
 from pip._internal.models.target_python import TargetPython
 from pip._internal.utils.datetime import parse_iso_datetime
 from pip._internal.utils.hashes import STRONG_HASHES
-from pip._internal.utils.misc import strtobool
+from pip._internal.utils.misc import parse_size, strtobool
 
 logger = logging.getLogger(__name__)
 
@@ -306,6 +306,77 @@ progress_bar: Callable[..., Option] = partial(
     ),
 )
 
+
+def _handle_positive_int(
+    option: Option, opt_str: str, value: int, parser: OptionParser
+) -> None:
+    """
+    This is an optparse.Option callback for integer options that must be at
+    least one, like the number of parallel jobs.
+    """
+    if value < 1:
+        msg = f"invalid value: {value!r}: must be a positive integer"
+        raise_option_error(parser, option=option, msg=msg)
+    setattr(parser.values, option.dest, value)
+
+
+def _handle_size(
+    option: Option, opt_str: str, value: str, parser: OptionParser
+) -> None:
+    """
+    This is an optparse.Option callback for options taking a size, given in
+    bytes, kB, MB or GB.
+    """
+    try:
+        size = parse_size(value)
+    except ValueError as exc:
+        raise_option_error(parser, option=option, msg=str(exc))
+    setattr(parser.values, option.dest, size)
+
+
+download_concurrency: Callable[..., Option] = partial(
+    Option,
+    "--download-concurrency",
+    dest="download_concurrency",
+    metavar="n",
+    type="int",
+    action="callback",
+    callback=_handle_positive_int,
+    default=1,
+    help=(
+        "Maximum number of distribution files to download at the same time, "
+        "once the dependencies have been resolved. (default: %default)"
+    ),
+)
+
+download_segments: Callable[..., Option] = partial(
+    Option,
+    "--download-segments",
+    dest="download_segments",
+    metavar="n",
+    type="int",
+    action="callback",
+    callback=_handle_positive_int,
+    default=1,
+    help=(
+        "Download files larger than --segmented-download-threshold as n byte "
+        "ranges at the same time, if the server supports range requests. "
+        "(default: %default)"
+    ),
+)
+
+segmented_download_threshold: Callable[..., Option] = partial(
+    Option,
+    "--segmented-download-threshold",
+    dest="segmented_download_threshold",
+    metavar="size",
+    type="str",
+    action="callback",
+    callback=_handle_size,
+    default=100 * 1000 * 1000,
+    help="The size above which --download-segments applies. (default: 100MB)",
+)
+
 log: Callable[..., Option] = partial(
     PipOption,
     "--log",
@@ -991,6 +1062,23 @@ no_cache: Callable[..., Option] = partial(
     help="Disable the cache.",
 )
 
+
+http_cache_max_size: Callable[..., Option] = partial(
+    Option,
+    "--http-cache-max-size",
+    dest="http_cache_max_size",
+    metavar="size",
+    type="str",
+    action="callback",
+    callback=_handle_size,
+    default=None,
+    help=(
+        "Remove the least recently used responses from the HTTP cache once "
+        "it takes more than <size> (e.g. 500MB). Requires "
+        "--use-feature=single-file-http-cache."
+    ),
+)
+
 no_deps: Callable[..., Option] = partial(
     Option,
     "--no-deps",
@@ -1055,6 +1143,19 @@ only_deps: Callable[..., Option] = partial(
     ),
 )
 
+resolver_profile: Callable[..., Option] = partial(
+    PipOption,
+    "--resolver-profile",
+    dest="resolver_profile",
+    metavar="file",
+    type="path",
+    default=None,
+    help=(
+        "Write the timings and other details of the dependency resolution to "
+        "the given file, as JSON."
+    ),
+)
+
 
 def _handle_dependency_group(
     option: Option, opt: str, value: str, parser: OptionParser
@@ -1125,6 +1226,69 @@ check_build_deps: Callable[..., Option] = partial(
 )
 
 
+build_jobs: Callable[..., Option] = partial(
+    Option,
+    "--build-jobs",
+    dest="build_jobs",
+    metavar="n",
+    type="int",
+    action="callback",
+    callback=_handle_positive_int,
+    default=1,
+    help="Maximum number of wheels to build at the same time. (default: %default)",
+)
+
+
+compile_jobs: Callable[..., Option] = partial(
+    Option,
+    "--compile-jobs",
+    dest="compile_jobs",
+    metavar="n",
+    type="int",
+    action="callback",
+    callback=_handle_positive_int,
+    default=1,
+    help=(
+        "Maximum number of processes to use to compile Python source files "
+        "to bytecode. (default: %default)"
+    ),
+)
+
+
+install_jobs: Callable[..., Option] = partial(
+    Option,
+    "--install-jobs",
+    dest="install_jobs",
+    metavar="n",
+    type="int",
+    action="callback",
+    callback=_handle_positive_int,
+    default=1,
+    help=(
+        "Maximum number of packages to install at the same time. Packages are "
+        "only installed together when none of them depends on another. "
+        "(default: %default)"
+    ),
+)
+
+
+lookup_jobs: Callable[..., Option] = partial(
+    Option,
+    "--lookup-jobs",
+    dest="lookup_jobs",
+    metavar="n",
+    type="int",
+    action="callback",
+    callback=_handle_positive_int,
+    default=1,
+    help=(
+        "Maximum number of requests to make to the package indexes at the same "
+        "time, when a project is looked up on several indexes, or with "
+        "pip list --outdated or --uptodate. (default: %default)"
+    ),
+)
+
+
 use_pep517: Any = partial(
     Option,
     "--use-pep517",
@@ -1274,6 +1438,18 @@ no_require_hashes: Callable[..., Option] = partial(
 )
 
 
+force_hash_check: Callable[..., Option] = partial(
+    Option,
+    "--force-hash-check",
+    dest="force_hash_check",
+    action="store_true",
+    default=False,
+    help="Hash every local file that is checked against hashes, instead of "
+    "trusting the hashes recorded in the cache for files that have not "
+    "changed since they were last hashed.",
+)
+
+
 list_path: Callable[..., Option] = partial(
     PipOption,
     "--path",
@@ -1328,7 +1504,12 @@ use_new_feature: Callable[..., Option] = partial(
     choices=[
         "fast-deps",
         "inprocess-build-deps",
+        "prefetch-index-pages",
+        "prefetch-metadata",
+        "resolution-cache",
+        "single-file-http-cache",
         "venv-isolation",
+        "wheel-store",
     ]
     + ALWAYS_ENABLED_FEATURES,
     help="Enable new functionality, that may be backward incompatible.",
@@ -1375,6 +1556,7 @@ general_group: dict[str, Any] = {
         client_cert,
         cache_dir,
         no_cache,
+        http_cache_max_size,
         disable_pip_version_check,
         no_color,
         no_python_version_warning,
@@ -100,14 +100,28 @@ class SessionCommandMixin(CommandContextMixIn):
         else:
             ssl_context = None
 
+        single_file_cache = "single-file-http-cache" in options.features_enabled
+        if not cache_dir:
+            http_cache_dir = None
+        elif single_file_cache:
+            http_cache_dir = os.path.join(cache_dir, "http-single-file")
+        else:
+            http_cache_dir = os.path.join(cache_dir, "http-v2")
+
         session = PipSession(
-            cache=os.path.join(cache_dir, "http-v2") if cache_dir else None,
+            cache=http_cache_dir,
             retries=retries if retries is not None else options.retries,
             resume_retries=options.resume_retries,
+            download_segments=getattr(options, "download_segments", 1),
+            segmented_download_threshold=getattr(
+                options, "segmented_download_threshold", 0
+            ),
             trusted_hosts=options.trusted_hosts,
             index_urls=self._get_index_urls(options),
             ssl_context=ssl_context,
             refresh_package=getattr(options, "refresh_package", set()),
+            single_file_cache=single_file_cache,
+            cache_max_size=getattr(options, "http_cache_max_size", None),
         )
 
         # Handle custom ca-bundles from the user
@@ -20,7 +20,14 @@ from pip._internal.build_env import (
     InprocessBuildEnvironmentInstaller,
     SubprocessBuildEnvironmentInstaller,
 )
-from pip._internal.cache import WheelCache
+from pip._internal.cache import (
+    FileHashCache,
+    IndexPageCache,
+    MetadataCache,
+    NotFoundCache,
+    ResolutionCache,
+    WheelCache,
+)
 from pip._internal.cli import cmdoptions
 from pip._internal.cli.cmdoptions import make_target_python
 from pip._internal.cli.index_command import IndexGroupCommand
@@ -238,11 +245,19 @@ class RequirementCommand(IndexGroupCommand):
             build_tracker=build_tracker,
             session=session,
             progress_bar=options.progress_bar,
+            download_concurrency=options.download_concurrency,
             finder=finder,
             require_hashes=options.require_hashes,
             use_user_site=use_user_site,
             lazy_wheel=lazy_wheel,
             verbosity=verbosity,
+            prefetch_metadata="prefetch-metadata" in options.features_enabled,
+            metadata_cache=MetadataCache(options.cache_dir),
+            file_hash_cache=(
+                None
+                if getattr(options, "force_hash_check", False)
+                else FileHashCache(options.cache_dir)
+            ),
             legacy_resolver=legacy_resolver,
             allow_editables=allow_editables,
         )
@@ -288,6 +303,12 @@ class RequirementCommand(IndexGroupCommand):
                 force_reinstall=force_reinstall,
                 upgrade_strategy=upgrade_strategy,
                 py_version_info=py_version_info,
+                resolution_cache=(
+                    ResolutionCache(options.cache_dir)
+                    if "resolution-cache" in options.features_enabled
+                    else None
+                ),
+                profile_path=options.resolver_profile,
             )
         import pip._internal.resolution.legacy.resolver
 
@@ -487,7 +508,14 @@ class RequirementCommand(IndexGroupCommand):
         :param ignore_requires_python: Whether to ignore incompatible
             "Requires-Python" values in links. Defaults to False.
         """
-        link_collector = LinkCollector.create(session, options=options)
+        link_collector = LinkCollector.create(
+            session,
+            options=options,
+            prefetch_index_pages="prefetch-index-pages" in options.features_enabled,
+            index_page_cache=IndexPageCache(options.cache_dir),
+            not_found_cache=NotFoundCache(options.cache_dir),
+            index_jobs=options.lookup_jobs,
+        )
         selection_prefs = SelectionPreferences(
             allow_yanked=True,
             format_control=options.format_control,
@@ -19,7 +19,11 @@ from pip._vendor.rich.measure import Measurement
 from pip._vendor.rich.text import Text
 
 from pip._internal.utils.compat import WINDOWS
-from pip._internal.utils.logging import get_console, get_indentation
+from pip._internal.utils.logging import (
+    get_console,
+    get_indentation,
+    is_logging_deferred,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -134,8 +138,13 @@ def open_spinner(message: str) -> Generator[SpinnerInterface, None, None]:
     # through the logging system, but it acts like it has level INFO,
     # i.e. it's only displayed if we're at level INFO or better.
     # Non-interactive spinner goes through the logging system, so it is always
-    # in sync with logging configuration.
-    if sys.stdout.isatty() and logger.getEffectiveLevel() <= logging.INFO:
+    # in sync with logging configuration. It is also used when the logs of
+    # this thread are deferred, as they are then output later on.
+    if (
+        sys.stdout.isatty()
+        and logger.getEffectiveLevel() <= logging.INFO
+        and not is_logging_deferred()
+    ):
         spinner: SpinnerInterface = InteractiveSpinner(message)
     else:
         spinner = NonInteractiveSpinner(message)
@@ -227,6 +236,9 @@ def hidden_cursor(file: IO[str]) -> Generator[None, None, None]:
     # See https://github.com/pypa/pip/issues/3418
     elif not file.isatty() or logger.getEffectiveLevel() > logging.INFO:
         yield
+    # Nor if the logs of this thread are deferred, as no spinner is shown.
+    elif is_logging_deferred():
+        yield
     else:
         file.write(HIDE_CURSOR)
         try:
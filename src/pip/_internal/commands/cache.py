@@ -1,21 +1,24 @@
+import glob
 import os
 import textwrap
 from collections.abc import Callable
 from optparse import Values
 
+from pip._internal.cache import MetadataCache
 from pip._internal.cli.base_command import Command
 from pip._internal.cli.status_codes import ERROR, SUCCESS
 from pip._internal.exceptions import CommandError, PipError
+from pip._internal.network.cache import SingleFileCache
 from pip._internal.utils import filesystem
 from pip._internal.utils.logging import getLogger
-from pip._internal.utils.misc import format_size
+from pip._internal.utils.misc import format_size, parse_size, rmtree
 
 logger = getLogger(__name__)
 
 
 class CacheCommand(Command):
     """
-    Inspect and manage pip's wheel cache.
+    Inspect and manage pip's wheel and dependency metadata cache.
 
     Subcommands:
 
@@ -24,6 +27,10 @@ class CacheCommand(Command):
     - list: List filenames of packages stored in the cache.
     - remove: Remove one or more package from the cache.
     - purge: Remove all items from the cache.
+    - trim-metadata: Remove the least recently used dependency metadata
+      until the metadata cache takes at most ``<size>`` (e.g. ``50MB``).
+    - trim-http: Remove the least recently used HTTP responses until the
+      single file HTTP cache takes at most ``<size>``.
 
     ``<pattern>`` can be a glob expression or a package name.
     """
@@ -35,6 +42,8 @@ class CacheCommand(Command):
         %prog list [<pattern>] [--format=[human, abspath]]
         %prog remove <pattern>
         %prog purge
+        %prog trim-metadata <size>
+        %prog trim-http <size>
     """
 
     def add_options(self) -> None:
@@ -56,6 +65,8 @@ class CacheCommand(Command):
             "list": self.list_cache_items,
             "remove": self.remove_cache_items,
             "purge": self.purge_cache,
+            "trim-metadata": self.trim_metadata_cache,
+            "trim-http": self.trim_http_cache,
         }
 
     def run(self, options: Values, args: list[str]) -> int:
@@ -96,6 +107,8 @@ class CacheCommand(Command):
 
         num_http_files = len(self._find_http_files(options))
         num_packages = len(self._find_wheels(options, "*"))
+        num_metadata_files = len(self._find_metadata_files(options, "*"))
+        num_unpacked_wheels = len(self._find_unpacked_wheels(options, "*"))
 
         http_cache_location = self._cache_dir(options, "http-v2")
         old_http_cache_location = self._cache_dir(options, "http")
@@ -103,8 +116,23 @@ class CacheCommand(Command):
         http_cache_size = filesystem.format_size(
             filesystem.directory_size(http_cache_location)
             + filesystem.directory_size(old_http_cache_location)
+            + filesystem.directory_size(self._cache_dir(options, "http-single-file"))
+            + filesystem.directory_size(self._cache_dir(options, "index-pages"))
+            + filesystem.directory_size(self._cache_dir(options, "not-found"))
         )
         wheels_cache_size = filesystem.format_directory_size(wheels_cache_location)
+        metadata_cache_location = self._cache_dir(options, "metadata")
+        metadata_cache_size = filesystem.format_directory_size(metadata_cache_location)
+        unpacked_wheels_location = self._cache_dir(options, "unpacked-wheels")
+        unpacked_wheels_size = filesystem.format_directory_size(
+            unpacked_wheels_location
+        )
+        resolutions_location = self._cache_dir(options, "resolutions")
+        resolutions_size = filesystem.format_directory_size(resolutions_location)
+        file_hashes_location = self._cache_dir(options, "file-hashes")
+        file_hashes_size = filesystem.format_directory_size(file_hashes_location)
+        environments_location = self._cache_dir(options, "environments")
+        environments_size = filesystem.format_directory_size(environments_location)
 
         message = (
             textwrap.dedent("""
@@ -115,6 +143,18 @@ class CacheCommand(Command):
                     Locally built wheels location: {wheels_cache_location}
                     Locally built wheels size: {wheels_cache_size}
                     Number of locally built wheels: {package_count}
+                    Dependency metadata location: {metadata_cache_location}
+                    Dependency metadata size: {metadata_cache_size}
+                    Number of dependency metadata files: {num_metadata_files}
+                    Unpacked wheels location: {unpacked_wheels_location}
+                    Unpacked wheels size: {unpacked_wheels_size}
+                    Number of unpacked wheels: {num_unpacked_wheels}
+                    Resolution results location: {resolutions_location}
+                    Resolution results size: {resolutions_size}
+                    Local file hashes location: {file_hashes_location}
+                    Local file hashes size: {file_hashes_size}
+                    Installed environment snapshots location: {environments_location}
+                    Installed environment snapshots size: {environments_size}
                 """)  # noqa: E501
             .format(
                 http_cache_location=http_cache_location,
@@ -124,6 +164,18 @@ class CacheCommand(Command):
                 wheels_cache_location=wheels_cache_location,
                 package_count=num_packages,
                 wheels_cache_size=wheels_cache_size,
+                metadata_cache_location=metadata_cache_location,
+                metadata_cache_size=metadata_cache_size,
+                num_metadata_files=num_metadata_files,
+                unpacked_wheels_location=unpacked_wheels_location,
+                unpacked_wheels_size=unpacked_wheels_size,
+                num_unpacked_wheels=num_unpacked_wheels,
+                resolutions_location=resolutions_location,
+                resolutions_size=resolutions_size,
+                file_hashes_location=file_hashes_location,
+                file_hashes_size=file_hashes_size,
+                environments_location=environments_location,
+                environments_size=environments_size,
             )
             .strip()
         )
@@ -170,16 +222,26 @@ class CacheCommand(Command):
             raise CommandError("Please provide a pattern")
 
         files = self._find_wheels(options, args[0])
+        files += self._find_metadata_files(options, args[0])
 
         no_matching_msg = "No matching packages"
         if args[0] == "*":
             # Only fetch http files if no specific pattern given
             files += self._find_http_files(options)
+            # Nor the hashes recorded for local files, which aren't packages.
+            files += filesystem.find_files(self._cache_dir(options, "file-hashes"), "*")
+            # Results of resolutions may name any package.
+            files += filesystem.find_files(self._cache_dir(options, "resolutions"), "*")
+            # Nor the snapshots of installed environments.
+            files += filesystem.find_files(
+                self._cache_dir(options, "environments"), "*"
+            )
         else:
             # Add the pattern to the log message
             no_matching_msg += f' for pattern "{args[0]}"'
 
-        if not files:
+        unpacked_wheels = self._find_unpacked_wheels(options, args[0])
+        if not files and not unpacked_wheels:
             logger.warning(no_matching_msg)
 
         bytes_removed = 0
@@ -187,15 +249,51 @@ class CacheCommand(Command):
             bytes_removed += os.stat(filename).st_size
             os.unlink(filename)
             logger.verbose("Removed %s", filename)
+        for unpacked_wheel in unpacked_wheels:
+            bytes_removed += int(filesystem.directory_size(unpacked_wheel))
+            rmtree(unpacked_wheel)
+            logger.verbose("Removed %s", unpacked_wheel)
 
         http_dirs = filesystem.subdirs_without_files(self._cache_dir(options, "http"))
         http_v2_dirs = filesystem.subdirs_without_files(
             self._cache_dir(options, "http-v2")
         )
+        http_single_file_dirs = filesystem.subdirs_without_files(
+            self._cache_dir(options, "http-single-file")
+        )
         wheel_dirs = filesystem.subdirs_without_wheels(
             self._cache_dir(options, "wheels")
         )
-        dirs = [*http_dirs, *http_v2_dirs, *wheel_dirs]
+        index_page_dirs = filesystem.subdirs_without_files(
+            self._cache_dir(options, "index-pages")
+        )
+        not_found_dirs = filesystem.subdirs_without_files(
+            self._cache_dir(options, "not-found")
+        )
+        metadata_dirs = filesystem.subdirs_without_files(
+            self._cache_dir(options, "metadata")
+        )
+        file_hash_dirs = filesystem.subdirs_without_files(
+            self._cache_dir(options, "file-hashes")
+        )
+        unpacked_wheel_dirs = filesystem.subdirs_without_files(
+            self._cache_dir(options, "unpacked-wheels")
+        )
+        resolution_dirs = filesystem.subdirs_without_files(
+            self._cache_dir(options, "resolutions")
+        )
+        dirs = [
+            *http_dirs,
+            *http_v2_dirs,
+            *http_single_file_dirs,
+            *index_page_dirs,
+            *not_found_dirs,
+            *wheel_dirs,
+            *metadata_dirs,
+            *file_hash_dirs,
+            *unpacked_wheel_dirs,
+            *resolution_dirs,
+        ]
 
         for subdir in dirs:
             try:
@@ -214,7 +312,7 @@ class CacheCommand(Command):
             logger.verbose("Removed legacy selfcheck.json file")
 
         logger.info("Files removed: %s (%s)", len(files), format_size(bytes_removed))
-        logger.info("Directories removed: %s", len(dirs))
+        logger.info("Directories removed: %s", len(dirs) + len(unpacked_wheels))
 
     def purge_cache(self, options: Values, args: list[str]) -> None:
         if args:
@@ -222,14 +320,58 @@ class CacheCommand(Command):
 
         return self.remove_cache_items(options, ["*"])
 
+    def trim_metadata_cache(self, options: Values, args: list[str]) -> None:
+        max_size = self._get_max_size(args)
+
+        metadata_cache = MetadataCache(options.cache_dir)
+        self._trim(metadata_cache.directory, metadata_cache.trim, max_size)
+
+    def trim_http_cache(self, options: Values, args: list[str]) -> None:
+        max_size = self._get_max_size(args)
+
+        http_cache = SingleFileCache(self._cache_dir(options, "http-single-file"))
+        self._trim(http_cache.directory, http_cache.trim, max_size)
+
+    def _get_max_size(self, args: list[str]) -> int:
+        if len(args) > 1:
+            raise CommandError("Too many arguments")
+
+        if not args:
+            raise CommandError("Please provide a size")
+
+        try:
+            return parse_size(args[0])
+        except ValueError:
+            raise CommandError(f"Invalid size: {args[0]}")
+
+    def _trim(
+        self, directory: str, trim: Callable[[int], list[str]], max_size: int
+    ) -> None:
+        size_before = filesystem.directory_size(directory)
+        files = trim(max_size)
+        for filename in files:
+            logger.verbose("Removed %s", filename)
+        bytes_removed = size_before - filesystem.directory_size(directory)
+
+        logger.info("Files removed: %s (%s)", len(files), format_size(bytes_removed))
+
     def _cache_dir(self, options: Values, subdir: str) -> str:
         return os.path.join(options.cache_dir, subdir)
 
     def _find_http_files(self, options: Values) -> list[str]:
         old_http_dir = self._cache_dir(options, "http")
         new_http_dir = self._cache_dir(options, "http-v2")
-        return filesystem.find_files(old_http_dir, "*") + filesystem.find_files(
-            new_http_dir, "*"
+        single_file_http_dir = self._cache_dir(options, "http-single-file")
+        # The links parsed from cached index pages go along with them, as do
+        # the records of pages which weren't found.
+        index_page_dir = self._cache_dir(options, "index-pages")
+        not_found_dir = self._cache_dir(options, "not-found")
+        return (
+            filesystem.find_files(old_http_dir, "*")
+            + filesystem.find_files(new_http_dir, "*")
+            + filesystem.find_files(single_file_http_dir, "*")
+            + filesystem.find_files(index_page_dir, "*")
+            + filesystem.find_files(not_found_dir, "*")
         )
 
     def _find_wheels(self, options: Values, pattern: str) -> list[str]:
@@ -254,3 +396,23 @@ class CacheCommand(Command):
         pattern = pattern + ("*.whl" if "-" in pattern else "-*.whl")
 
         return filesystem.find_files(wheel_dir, pattern)
+
+    def _find_metadata_files(self, options: Values, pattern: str) -> list[str]:
+        metadata_dir = self._cache_dir(options, "metadata")
+
+        # Metadata files are named after the distribution file they describe,
+        # so match them the same way as wheels.
+        pattern = pattern + ("*.metadata" if "-" in pattern else "-*.metadata")
+
+        return filesystem.find_files(metadata_dir, pattern)
+
+    def _find_unpacked_wheels(self, options: Values, pattern: str) -> list[str]:
+        store_dir = self._cache_dir(options, "unpacked-wheels")
+
+        # Unpacked wheels are directories named after the wheel, nested under
+        # the parts of its hash, so match them the same way as wheels.
+        pattern = pattern + ("*.whl" if "-" in pattern else "-*.whl")
+
+        return glob.glob(
+            os.path.join(glob.escape(store_dir), "*", "*", "*", "*", pattern)
+        )
@@ -9,6 +9,7 @@ from typing import Any
 from pip._vendor.packaging.utils import canonicalize_name
 from pip._vendor.packaging.version import Version
 
+from pip._internal.cache import IndexPageCache, NotFoundCache
 from pip._internal.cli import cmdoptions
 from pip._internal.cli.req_command import IndexGroupCommand
 from pip._internal.cli.status_codes import ERROR, SUCCESS
@@ -103,7 +104,12 @@ class IndexCommand(IndexGroupCommand):
         """
         Create a package finder appropriate to the index command.
         """
-        link_collector = LinkCollector.create(session, options=options)
+        link_collector = LinkCollector.create(
+            session,
+            options=options,
+            index_page_cache=IndexPageCache(options.cache_dir),
+            not_found_cache=NotFoundCache(options.cache_dir),
+        )
 
         # Pass allow_yanked=False to ignore yanked versions.
         selection_prefs = SelectionPreferences(
@@ -25,7 +25,7 @@ from pip._vendor.rich import print_json
 # wheel to execute arbitrary code on install by replacing
 # self_outdated_check.
 import pip._internal.self_outdated_check  # noqa: F401
-from pip._internal.cache import WheelCache
+from pip._internal.cache import UnpackedWheelStore, WheelCache
 from pip._internal.cli import cmdoptions
 from pip._internal.cli.cmdoptions import make_target_python
 from pip._internal.cli.req_command import (
@@ -167,6 +167,7 @@ class InstallCommand(RequirementCommand):
         self.cmd_opts.add_option(cmdoptions.requirements_from_scripts())
         self.cmd_opts.add_option(cmdoptions.no_deps())
         self.cmd_opts.add_option(cmdoptions.only_deps())
+        self.cmd_opts.add_option(cmdoptions.resolver_profile())
 
         self.cmd_opts.add_option(cmdoptions.editable())
         self.cmd_opts.add_option(
@@ -289,6 +290,7 @@ class InstallCommand(RequirementCommand):
         self.cmd_opts.add_option(cmdoptions.no_build_isolation())
         self.cmd_opts.add_option(cmdoptions.use_pep517())
         self.cmd_opts.add_option(cmdoptions.check_build_deps())
+        self.cmd_opts.add_option(cmdoptions.build_jobs())
         self.cmd_opts.add_option(cmdoptions.override_externally_managed())
 
         self.cmd_opts.add_option(cmdoptions.config_settings())
@@ -308,6 +310,9 @@ class InstallCommand(RequirementCommand):
             help="Do not compile Python source files to bytecode",
         )
 
+        self.cmd_opts.add_option(cmdoptions.compile_jobs())
+        self.cmd_opts.add_option(cmdoptions.install_jobs())
+
         self.cmd_opts.add_option(
             "--no-warn-script-location",
             action="store_false",
@@ -324,7 +329,12 @@ class InstallCommand(RequirementCommand):
         )
         self.cmd_opts.add_option(cmdoptions.require_hashes())
         self.cmd_opts.add_option(cmdoptions.no_require_hashes())
+        self.cmd_opts.add_option(cmdoptions.force_hash_check())
         self.cmd_opts.add_option(cmdoptions.progress_bar())
+        self.cmd_opts.add_option(cmdoptions.download_concurrency())
+        self.cmd_opts.add_option(cmdoptions.lookup_jobs())
+        self.cmd_opts.add_option(cmdoptions.download_segments())
+        self.cmd_opts.add_option(cmdoptions.segmented_download_threshold())
         self.cmd_opts.add_option(cmdoptions.root_user_action())
 
         index_opts = cmdoptions.make_option_group(
@@ -525,12 +535,18 @@ class InstallCommand(RequirementCommand):
                 wheel_cache=wheel_cache,
                 verify=True,
                 allow_editables=True,
+                jobs=options.build_jobs,
             )
 
             if build_failures:
                 raise InstallWheelBuildError(build_failures)
 
-            to_install = resolver.get_installation_order(requirement_set)
+            install_levels: list[list[InstallRequirement]] | None = None
+            if options.install_jobs > 1:
+                install_levels = resolver.get_installation_levels(requirement_set)
+                to_install = [req for level in install_levels for req in level]
+            else:
+                to_install = resolver.get_installation_order(requirement_set)
 
             # Check for conflicts in the package set we're installing.
             conflicts: ConflictDetails | None = None
@@ -553,6 +569,10 @@ class InstallCommand(RequirementCommand):
             finally:
                 _prevent_further_imports()
 
+            wheel_store = None
+            if "wheel-store" in options.features_enabled and options.cache_dir:
+                wheel_store = UnpackedWheelStore(options.cache_dir)
+
             installed = install_given_reqs(
                 to_install,
                 root=options.root_path,
@@ -562,6 +582,10 @@ class InstallCommand(RequirementCommand):
                 use_user_site=options.use_user_site,
                 pycompile=options.compile,
                 progress_bar=options.progress_bar,
+                compile_jobs=options.compile_jobs,
+                levels=install_levels,
+                install_jobs=options.install_jobs,
+                wheel_store=wheel_store,
             )
 
             lib_locations = get_lib_location_guesses(
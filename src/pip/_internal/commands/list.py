@@ -4,6 +4,7 @@ import contextlib
 import json
 import logging
 from collections.abc import Generator, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from email.parser import Parser
 from optparse import Values
 from typing import TYPE_CHECKING, cast
@@ -18,6 +19,7 @@ from pip._internal.exceptions import CommandError
 from pip._internal.metadata import BaseDistribution, get_environment
 from pip._internal.metadata.base import stdlib_pkgs
 from pip._internal.models.selection_prefs import SelectionPreferences
+from pip._internal.utils.logging import DeferredRecord, defer_logging, replay_logging
 from pip._internal.utils.misc import tabulate, write_output
 
 if TYPE_CHECKING:
@@ -125,6 +127,7 @@ class ListCommand(IndexGroupCommand):
             default=True,
         )
         self.cmd_opts.add_option(cmdoptions.list_exclude())
+        self.cmd_opts.add_option(cmdoptions.lookup_jobs())
         index_opts = cmdoptions.make_option_group(cmdoptions.index_group, self.parser)
 
         selection_opts = cmdoptions.make_option_group(
@@ -151,10 +154,17 @@ class ListCommand(IndexGroupCommand):
         Create a package finder appropriate to this list command.
         """
         # Lazy import the heavy index modules as most list invocations won't need 'em.
+        from pip._internal.cache import IndexPageCache, NotFoundCache
         from pip._internal.index.collector import LinkCollector
         from pip._internal.index.package_finder import PackageFinder
 
-        link_collector = LinkCollector.create(session, options=options)
+        link_collector = LinkCollector.create(
+            session,
+            options=options,
+            index_page_cache=IndexPageCache(options.cache_dir),
+            not_found_cache=NotFoundCache(options.cache_dir),
+            index_jobs=options.lookup_jobs,
+        )
 
         # Pass allow_yanked=False to ignore yanked versions.
         selection_prefs = SelectionPreferences(
@@ -280,9 +290,34 @@ class ListCommand(IndexGroupCommand):
                 dist.latest_filetype = typ
                 return dist
 
-            for dist in map(latest_info, packages):
-                if dist is not None:
-                    yield dist
+            if options.lookup_jobs == 1 or len(packages) <= 1:
+                for dist in map(latest_info, packages):
+                    if dist is not None:
+                        yield dist
+                return
+
+            def latest_info_deferring_logs(
+                dist: _DistWithLatestInfo,
+            ) -> tuple[list[DeferredRecord], _DistWithLatestInfo | None]:
+                records: list[DeferredRecord] = []
+                with defer_logging(records):
+                    return records, latest_info(dist)
+
+            # The finder and the session are shared by the lookups, which
+            # mostly wait on the network. Results, and the logs of each lookup,
+            # are output in the same order as the packages.
+            executor = ThreadPoolExecutor(
+                max_workers=options.lookup_jobs, thread_name_prefix="pip-list"
+            )
+            try:
+                for records, result in executor.map(
+                    latest_info_deferring_logs, packages
+                ):
+                    replay_logging(records)
+                    if result is not None:
+                        yield result
+            finally:
+                executor.shutdown(cancel_futures=True)
 
     def output_package_listing(
         self, packages: _ProcessedDists, options: Values
@@ -63,6 +63,7 @@ class LockCommand(RequirementCommand):
         self.cmd_opts.add_option(cmdoptions.build_constraints())
         self.cmd_opts.add_option(cmdoptions.no_deps())
         self.cmd_opts.add_option(cmdoptions.only_deps())
+        self.cmd_opts.add_option(cmdoptions.resolver_profile())
 
         self.cmd_opts.add_option(cmdoptions.editable())
 
@@ -77,7 +78,12 @@ class LockCommand(RequirementCommand):
 
         self.cmd_opts.add_option(cmdoptions.require_hashes())
         self.cmd_opts.add_option(cmdoptions.no_require_hashes())
+        self.cmd_opts.add_option(cmdoptions.force_hash_check())
         self.cmd_opts.add_option(cmdoptions.progress_bar())
+        self.cmd_opts.add_option(cmdoptions.download_concurrency())
+        self.cmd_opts.add_option(cmdoptions.lookup_jobs())
+        self.cmd_opts.add_option(cmdoptions.download_segments())
+        self.cmd_opts.add_option(cmdoptions.segmented_download_threshold())
 
         index_opts = cmdoptions.make_option_group(
             cmdoptions.index_group,
@@ -54,6 +54,7 @@ class WheelCommand(RequirementCommand):
         self.cmd_opts.add_option(cmdoptions.no_build_isolation())
         self.cmd_opts.add_option(cmdoptions.use_pep517())
         self.cmd_opts.add_option(cmdoptions.check_build_deps())
+        self.cmd_opts.add_option(cmdoptions.build_jobs())
         self.cmd_opts.add_option(cmdoptions.constraints())
         self.cmd_opts.add_option(cmdoptions.build_constraints())
         self.cmd_opts.add_option(cmdoptions.editable())
@@ -63,7 +64,12 @@ class WheelCommand(RequirementCommand):
         self.cmd_opts.add_option(cmdoptions.ignore_requires_python())
         self.cmd_opts.add_option(cmdoptions.no_deps())
         self.cmd_opts.add_option(cmdoptions.only_deps())
+        self.cmd_opts.add_option(cmdoptions.resolver_profile())
         self.cmd_opts.add_option(cmdoptions.progress_bar())
+        self.cmd_opts.add_option(cmdoptions.download_concurrency())
+        self.cmd_opts.add_option(cmdoptions.lookup_jobs())
+        self.cmd_opts.add_option(cmdoptions.download_segments())
+        self.cmd_opts.add_option(cmdoptions.segmented_download_threshold())
 
         self.cmd_opts.add_option(
             "--no-verify",
@@ -77,6 +83,7 @@ class WheelCommand(RequirementCommand):
 
         self.cmd_opts.add_option(cmdoptions.require_hashes())
         self.cmd_opts.add_option(cmdoptions.no_require_hashes())
+        self.cmd_opts.add_option(cmdoptions.force_hash_check())
 
         index_opts = cmdoptions.make_option_group(
             cmdoptions.index_group,
@@ -156,6 +163,7 @@ class WheelCommand(RequirementCommand):
             wheel_cache=wheel_cache,
             verify=(not options.no_verify),
             allow_editables=False,
+            jobs=options.build_jobs,
         )
         for req in build_successes:
             assert req.link and req.link.is_wheel
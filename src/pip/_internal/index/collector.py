@@ -5,22 +5,30 @@ The main purpose of this module is to expose LinkCollector.collect_sources().
 from __future__ import annotations
 
 import collections
+import datetime
 import email.message
 import functools
+import html
 import itertools
 import json
 import logging
 import os
+import re
+import threading
 import urllib.parse
 from collections.abc import Callable, Iterable, MutableMapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from html.parser import HTMLParser
 from optparse import Values
 from typing import (
+    TYPE_CHECKING,
+    Any,
     NamedTuple,
     Protocol,
 )
 
+from pip._vendor.packaging.tags import Tag, parse_tag
 from pip._vendor.packaging.utils import canonicalize_name
 from pip._vendor.requests import Response
 from pip._vendor.requests.exceptions import RetryError
@@ -33,8 +41,9 @@ from pip._internal.exceptions import (
     SSLMissingError,
     SSLVerificationError,
 )
-from pip._internal.models.link import Link
+from pip._internal.models.link import Link, MetadataFile
 from pip._internal.models.search_scope import SearchScope
+from pip._internal.network.cache import is_from_cache
 from pip._internal.network.session import PipSession
 from pip._internal.network.utils import raise_for_status
 from pip._internal.utils.filetypes import is_archive_file
@@ -44,10 +53,21 @@ from pip._internal.vcs import vcs
 
 from .sources import CandidatesFromPage, LinkSource, build_source
 
+if TYPE_CHECKING:
+    from pip._internal.cache import IndexPageCache, NotFoundCache
+
 logger = logging.getLogger(__name__)
 
 ResponseHeaders = MutableMapping[str, str]
 
+# The number of index pages fetched at the same time in background threads.
+_PREFETCH_WORKERS = 8
+
+# The version recorded in LinkCollector.fetched_pages for pages which were not
+# found on their index. Other versions are validators, and None means that the
+# version of the page can't be identified.
+PAGE_NOT_FOUND = "not-found"
+
 
 def _match_vcs_scheme(url: str) -> str | None:
     """Look for VCS schemes in the URL.
@@ -194,39 +214,83 @@ class CacheablePageContent:
 
 
 class ParseLinks(Protocol):
-    def __call__(self, page: IndexContent) -> Iterable[Link]: ...
+    def __call__(
+        self, page: IndexContent, supported_tags: frozenset[Tag] | None = None
+    ) -> Iterable[Link]: ...
 
 
 def with_cached_index_content(fn: ParseLinks) -> ParseLinks:
     """
     Given a function that parses an Iterable[Link] from an IndexContent, cache the
-    function's result (keyed by CacheablePageContent), unless the IndexContent
-    `page` has `page.cache_link_parsing == False`.
+    function's result (keyed by CacheablePageContent and the supported tags),
+    unless the IndexContent `page` has `page.cache_link_parsing == False`.
     """
 
     @functools.cache
-    def wrapper(cacheable_page: CacheablePageContent) -> list[Link]:
-        return list(fn(cacheable_page.page))
+    def wrapper(
+        cacheable_page: CacheablePageContent, supported_tags: frozenset[Tag] | None
+    ) -> list[Link]:
+        return list(fn(cacheable_page.page, supported_tags))
 
     @functools.wraps(fn)
-    def wrapper_wrapper(page: IndexContent) -> list[Link]:
+    def wrapper_wrapper(
+        page: IndexContent, supported_tags: frozenset[Tag] | None = None
+    ) -> list[Link]:
         if page.cache_link_parsing:
-            return wrapper(CacheablePageContent(page))
-        return list(fn(page))
+            return wrapper(CacheablePageContent(page), supported_tags)
+        return list(fn(page, supported_tags))
 
     return wrapper_wrapper
 
 
+# Wheel filenames made of characters which URL cleaning leaves alone.
+_SIMPLE_WHEEL_FILENAME_RE = re.compile(r"[\w.+!-]+\.whl", re.ASCII)
+
+
+def _is_unsupported_wheel_url(url: str, supported_tags: frozenset[Tag]) -> bool:
+    """Return whether url certainly points to a wheel incompatible with all of
+    supported_tags.
+
+    This is meant to be checked before building a Link: such links are always
+    rejected by LinkEvaluator.evaluate_link(). Anything unusual, like a
+    percent-encoded "/" or an egg fragment, is left for the evaluator to
+    decide.
+    """
+    if "egg=" in url:
+        return False
+    path = url.partition("#")[0].partition("?")[0]
+    filename = path.rpartition("/")[2]
+    if "%" in filename:
+        filename = urllib.parse.unquote(filename)
+    if not _SIMPLE_WHEEL_FILENAME_RE.fullmatch(filename):
+        return False
+    parts = filename[:-4].split("-")
+    if len(parts) not in (5, 6):
+        return False
+    return parse_tag("-".join(parts[-3:])).isdisjoint(supported_tags)
+
+
 @with_cached_index_content
-def parse_links(page: IndexContent) -> Iterable[Link]:
+def parse_links(
+    page: IndexContent, supported_tags: frozenset[Tag] | None = None
+) -> Iterable[Link]:
     """
     Parse a Simple API's Index Content, and yield its anchor elements as Link objects.
+
+    If supported_tags is given, wheels that are not compatible with any of
+    these tags are skipped without building a Link for them.
     """
 
     content_type_l = page.content_type.lower()
     if content_type_l.startswith("application/vnd.pypi.simple.v1+json"):
         data = json.loads(page.content)
         for file in data.get("files", []):
+            if supported_tags is not None:
+                file_url = file.get("url")
+                if isinstance(file_url, str) and _is_unsupported_wheel_url(
+                    file_url, supported_tags
+                ):
+                    continue
             link = Link.from_json(file, page.url)
             if link is None:
                 continue
@@ -235,11 +299,21 @@ def parse_links(page: IndexContent) -> Iterable[Link]:
 
     parser = HTMLLinkParser(page.url)
     encoding = page.encoding or "utf-8"
-    parser.feed(page.content.decode(encoding))
+    text = page.content.decode(encoding)
+    start_tags = _find_simple_start_tags(text)
+    if start_tags is None:
+        parser.feed(text)
+    else:
+        for tag, attrs in start_tags:
+            parser.handle_starttag(tag, attrs)
 
     url = page.url
     base_url = parser.base_url or url
     for anchor in parser.anchors:
+        if supported_tags is not None:
+            href = anchor.get("href")
+            if href and _is_unsupported_wheel_url(href, supported_tags):
+                continue
         link = Link.from_element(anchor, page_url=url, base_url=base_url)
         if link is None:
             continue
@@ -255,6 +329,10 @@ class IndexContent:
     :param cache_link_parsing: whether links parsed from this page's url
                                should be cached. PyPI index urls should
                                have this set to False, for example.
+    :param validator: identifies this version of the page (from the ETag or
+                      Last-Modified response headers), if possible.
+    :param from_cache: whether the response was served from the HTTP cache,
+                       possibly after revalidation.
     """
 
     content: bytes
@@ -262,6 +340,8 @@ class IndexContent:
     encoding: str | None
     url: str
     cache_link_parsing: bool = True
+    validator: str | None = None
+    from_cache: bool = False
 
     def __str__(self) -> str:
         return redact_auth_from_url(self.url)
@@ -295,6 +375,91 @@ class HTMLLinkParser(HTMLParser):
         return None
 
 
+# The markup found in simple repository pages, which _find_simple_start_tags()
+# can parse: a document type declaration, and start and end tags with simple
+# attribute names.
+_SIMPLE_HTML_TAG_RE = re.compile(
+    r"""
+    <(?:
+        ![Dd][Oo][Cc][Tt][Yy][Pp][Ee][^<>]*>
+      | (?P<end>/)?(?P<tag>[a-zA-Z][a-zA-Z0-9]*)
+        (?P<attrs>(?:
+            [ \t\n\r\f]+[a-zA-Z_:][-a-zA-Z0-9_:.]*
+            (?:[ \t\n\r\f]*=[ \t\n\r\f]*
+                (?:"[^"]*"|'[^']*'|[^ \t\n\r\f"'=<>`]+))?
+        )*)
+        [ \t\n\r\f]*/?>
+    )
+    """,
+    re.VERBOSE,
+)
+_SIMPLE_HTML_ATTR_RE = re.compile(
+    r"""
+    ([a-zA-Z_:][-a-zA-Z0-9_:.]*)
+    (?:[ \t\n\r\f]*(=)[ \t\n\r\f]*
+        (?:"([^"]*)"|'([^']*)'|([^ \t\n\r\f"'=<>`]+)))?
+    """,
+    re.VERBOSE,
+)
+# Elements whose content is not parsed as markup by HTMLParser.
+_RAW_TEXT_ELEMENTS = frozenset(
+    ["iframe", "noembed", "noframes", "noscript", "plaintext", "script", "style", "xmp"]
+)
+_ESCAPABLE_RAW_TEXT_ELEMENTS = frozenset(["textarea", "title"])
+
+
+def _find_simple_start_tags(
+    text: str,
+) -> list[tuple[str, list[tuple[str, str | None]]]] | None:
+    """Find the "a" and "base" start tags of an HTML page, with their
+    attributes as HTMLParser would report them.
+
+    This is much faster than HTMLParser for the limited markup of simple
+    repository pages. None is returned if the page contains anything else
+    (e.g. comments or scripts), in which case HTMLParser must be used.
+    """
+    tags = _SIMPLE_HTML_TAG_RE.findall(text)
+    # Any "<" outside of these tags is unusual markup.
+    markup_count = len(tags) + sum(attrs.count("<") for _, _, attrs in tags)
+    if markup_count != text.count("<"):
+        return None
+
+    start_tags: list[tuple[str, list[tuple[str, str | None]]]] = []
+    # The escapable raw text element whose end tag must come next.
+    raw_text_element = None
+    for end, tag, attrs_text in tags:
+        if not tag:
+            # The document type declaration.
+            continue
+        tag = tag.lower()
+        if raw_text_element is not None:
+            if tag != raw_text_element or not end:
+                return None
+            raw_text_element = None
+        elif end:
+            continue
+        elif tag == "a" or tag == "base":
+            attrs: list[tuple[str, str | None]] = []
+            for name, has_value, *values in _SIMPLE_HTML_ATTR_RE.findall(attrs_text):
+                if not has_value:
+                    attrs.append((name.lower(), None))
+                    continue
+                # Only one of the double quoted, single quoted and unquoted
+                # forms of the value is matched.
+                value = "".join(values)
+                if "&" in value:
+                    value = html.unescape(value)
+                attrs.append((name.lower(), value))
+            start_tags.append((tag, attrs))
+        elif tag in _ESCAPABLE_RAW_TEXT_ELEMENTS:
+            raw_text_element = tag
+        elif tag in _RAW_TEXT_ELEMENTS:
+            return None
+    if raw_text_element is not None:
+        return None
+    return start_tags
+
+
 def _handle_get_simple_fail(
     link: Link,
     reason: str | Exception,
@@ -305,6 +470,16 @@ def _handle_get_simple_fail(
     meth("Could not fetch URL %s: %s - skipping", link, reason)
 
 
+def _get_validator_from_headers(headers: ResponseHeaders) -> str | None:
+    """Identify the version of a page from its ETag or Last-Modified headers."""
+    etag = headers.get("ETag")
+    last_modified = headers.get("Last-Modified")
+    if not etag and not last_modified:
+        return None
+    # The same URL may serve both JSON and HTML pages.
+    return f"{headers.get('Content-Type')}|{etag}|{last_modified}"
+
+
 def _make_index_content(
     response: Response, cache_link_parsing: bool = True
 ) -> IndexContent:
@@ -315,6 +490,50 @@ def _make_index_content(
         encoding=encoding,
         url=response.url,
         cache_link_parsing=cache_link_parsing,
+        validator=_get_validator_from_headers(response.headers),
+        from_cache=is_from_cache(response),
+    )
+
+
+def link_to_json(link: Link) -> list[Any]:
+    """Record the attributes of a link parsed from an index page."""
+    metadata_file_data: bool | dict[str, str] = False
+    if link.metadata_file_data is not None:
+        metadata_file_data = link.metadata_file_data.hashes or True
+    upload_time = None
+    if link.upload_time is not None:
+        upload_time = link.upload_time.isoformat()
+    return [
+        link.url,
+        link.requires_python,
+        link.yanked_reason,
+        metadata_file_data,
+        upload_time,
+        link.get_hashes(),
+    ]
+
+
+def link_from_json(data: list[Any], page_url: str | None) -> Link:
+    """Rebuild a link recorded by link_to_json()."""
+    url, requires_python, yanked_reason, metadata_info, upload_time, hashes = data
+    if isinstance(metadata_info, dict):
+        metadata_file_data: MetadataFile | None = MetadataFile(metadata_info)
+    elif metadata_info:
+        metadata_file_data = MetadataFile(None)
+    else:
+        metadata_file_data = None
+    return Link(
+        url,
+        comes_from=page_url,
+        requires_python=requires_python,
+        yanked_reason=yanked_reason,
+        metadata_file_data=metadata_file_data,
+        upload_time=(
+            None
+            if upload_time is None
+            else datetime.datetime.fromisoformat(upload_time)
+        ),
+        hashes=hashes,
     )
 
 
@@ -323,7 +542,13 @@ def _get_index_content(
     *,
     session: PipSession,
     force_revalidate: bool = False,
+    not_found_cache: NotFoundCache | None = None,
 ) -> IndexContent | None:
+    """
+    :param not_found_cache: Where to record the page if it is not found, and
+        which pages to skip as they were recently not found, unless
+        force_revalidate is True.
+    """
     url = link.url.split("#", 1)[0]
 
     # Check for VCS schemes that do not support lookup as web pages.
@@ -349,6 +574,14 @@ def _get_index_content(
         url = urllib.parse.urljoin(url, "index.html")
         logger.debug(" file: URL is directory, getting %s", url)
 
+    if (
+        not_found_cache is not None
+        and not force_revalidate
+        and not_found_cache.is_missing(url)
+    ):
+        logger.debug("Skipping page %s, which was recently not found", link)
+        return None
+
     try:
         resp = _get_simple_response(
             url, session=session, force_revalidate=force_revalidate
@@ -369,6 +602,13 @@ def _get_index_content(
             exc.content_type,
         )
     except (RetryError, NetworkConnectionError) as exc:
+        if (
+            not_found_cache is not None
+            and isinstance(exc, NetworkConnectionError)
+            and exc.response is not None
+            and exc.response.status_code == 404
+        ):
+            not_found_cache.add(url)
         _handle_get_simple_fail(link, exc)
     except (SSLVerificationError, SSLMissingError) as exc:
         reason = f"There was a problem confirming the ssl certificate: {exc.context}"
@@ -401,9 +641,42 @@ class LinkCollector:
         self,
         session: PipSession,
         search_scope: SearchScope,
+        prefetch_index_pages: bool = False,
+        index_page_cache: IndexPageCache | None = None,
+        not_found_cache: NotFoundCache | None = None,
+        index_jobs: int = 1,
     ) -> None:
+        """
+        :param prefetch_index_pages: Whether prefetch() should fetch index
+            pages in background threads. If False, prefetch() does nothing.
+        :param index_page_cache: Where to record the links parsed from index
+            pages, to reuse them while the pages are unchanged.
+        :param not_found_cache: Where to record the index pages which are not
+            found, to skip them for a while.
+        :param index_jobs: The maximum number of pages fetched at the same time
+            by fetch_concurrently() and check_pages(). If 1, they fetch pages
+            one after another.
+        """
         self.search_scope = search_scope
         self.session = session
+        self.prefetch_index_pages = prefetch_index_pages
+        self.index_page_cache = index_page_cache
+        self.not_found_cache = not_found_cache
+        self.index_jobs = index_jobs
+
+        self._prefetch_executor: ThreadPoolExecutor | None = None
+        # Pages being prefetched, by URL, until they are asked for, along
+        # with the tags their links are filtered with.
+        self._prefetched: dict[
+            str, tuple[frozenset[Tag] | None, Future[list[Link] | None]]
+        ] = {}
+        self._prefetch_started: set[str] = set()
+        # The pages requested through fetch_response() so far, by URL, with
+        # the project they were fetched for and their version (see
+        # PAGE_NOT_FOUND). Pages may be fetched by several threads, so the
+        # dict is only accessed with the lock held.
+        self.fetched_pages: dict[str, tuple[str | None, str | None]] = {}
+        self._fetched_pages_lock = threading.Lock()
 
     @classmethod
     def create(
@@ -411,11 +684,23 @@ class LinkCollector:
         session: PipSession,
         options: Values,
         suppress_no_index: bool = False,
+        prefetch_index_pages: bool = False,
+        index_page_cache: IndexPageCache | None = None,
+        not_found_cache: NotFoundCache | None = None,
+        index_jobs: int = 1,
     ) -> LinkCollector:
         """
         :param session: The Session to use to make requests.
         :param suppress_no_index: Whether to ignore the --no-index option
             when constructing the SearchScope object.
+        :param prefetch_index_pages: Whether to allow fetching index pages
+            in the background, ahead of them being needed.
+        :param index_page_cache: Where to record the links parsed from index
+            pages, to reuse them while the pages are unchanged.
+        :param not_found_cache: Where to record the index pages which are not
+            found, to skip them for a while.
+        :param index_jobs: The maximum number of pages to fetch at the same
+            time, when they are all needed.
         """
         index_urls = [options.index_url] + options.extra_index_urls
         if options.no_index and not suppress_no_index:
@@ -436,6 +721,10 @@ class LinkCollector:
         link_collector = LinkCollector(
             session=session,
             search_scope=search_scope,
+            prefetch_index_pages=prefetch_index_pages,
+            index_page_cache=index_page_cache,
+            not_found_cache=not_found_cache,
+            index_jobs=index_jobs,
         )
         return link_collector
 
@@ -457,11 +746,199 @@ class LinkCollector:
             package_name is not None
             and canonicalize_name(package_name) in force_revalidate
         )
-        return _get_index_content(
+        # Only projects missing from an index are worth remembering, a
+        # missing find-links page is a configuration error.
+        not_found_cache = None
+        if package_name is not None and (
+            location.url in self.search_scope.get_index_urls_locations(package_name)
+        ):
+            not_found_cache = self.not_found_cache
+        index_content = _get_index_content(
             location,
             session=self.session,
             force_revalidate=should_force_revalidate,
+            not_found_cache=not_found_cache,
         )
+        if index_content is not None:
+            version = index_content.validator
+        elif not_found_cache is not None and not_found_cache.is_missing(location.url):
+            version = PAGE_NOT_FOUND
+        else:
+            version = None
+        with self._fetched_pages_lock:
+            self.fetched_pages[location.url] = (package_name, version)
+        return index_content
+
+    def get_fetched_pages(self) -> list[tuple[str, str | None, str | None]]:
+        """Return the URL of each page in fetched_pages, with the project it
+        was fetched for and its version.
+        """
+        with self._fetched_pages_lock:
+            return [(url, *page) for url, page in self.fetched_pages.items()]
+
+    def check_pages(self, pages: Iterable[tuple[str, str | None, str]]) -> bool:
+        """
+        Fetch pages again, and tell whether they all still have the same
+        version.
+
+        :param pages: The URL of each page, with the project it is fetched for
+            and its expected version, as recorded in fetched_pages.
+        """
+
+        def is_unchanged(page: tuple[str, str | None, str]) -> bool:
+            url, package_name, version = page
+            self.fetch_response(Link(url, cache_link_parsing=False), package_name)
+            with self._fetched_pages_lock:
+                return self.fetched_pages[url][1] == version
+
+        if self.index_jobs <= 1:
+            return all(map(is_unchanged, pages))
+        executor = ThreadPoolExecutor(
+            max_workers=self.index_jobs, thread_name_prefix="pip-check-page"
+        )
+        try:
+            return all(executor.map(is_unchanged, pages))
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def fetch_links(
+        self,
+        location: Link,
+        package_name: str | None = None,
+        supported_tags: frozenset[Tag] | None = None,
+    ) -> list[Link] | None:
+        """
+        Fetch a page and parse the package links it contains.
+
+        If the page was prefetched, wait for and return that result instead of
+        fetching it again. Return None if the page could not be fetched.
+
+        :param supported_tags: If given, skip the wheels which are not
+            compatible with any of these tags (see parse_links()).
+        """
+        prefetched = self._prefetched.pop(location.url, None)
+        if prefetched is not None and prefetched[0] == supported_tags:
+            return prefetched[1].result()
+        return self._fetch_links(location, package_name, supported_tags)
+
+    def _fetch_links(
+        self,
+        location: Link,
+        package_name: str | None,
+        supported_tags: frozenset[Tag] | None,
+    ) -> list[Link] | None:
+        index_response = self.fetch_response(location, package_name=package_name)
+        if index_response is None:
+            return None
+        if self.index_page_cache is None or index_response.validator is None:
+            return list(parse_links(index_response, supported_tags))
+        # Links embed the page URL when they are relative, so pages fetched
+        # with credentials in their URL are not written to disk.
+        if "@" in urllib.parse.urlsplit(index_response.url).netloc:
+            return list(parse_links(index_response, supported_tags))
+
+        url = index_response.url
+        if index_response.from_cache:
+            # The page is the same as when it was last fetched, so its links
+            # can be reused without parsing it.
+            cached = self.index_page_cache.get(url, index_response.validator)
+            if cached is not None:
+                try:
+                    return [
+                        link_from_json(data, url)
+                        for data in cached
+                        if supported_tags is None
+                        or not _is_unsupported_wheel_url(data[0], supported_tags)
+                    ]
+                except (TypeError, ValueError, IndexError):
+                    logger.debug("Ignoring invalid cached links of %s", url)
+        # Record every link of the page, whatever tags are asked for now.
+        links = list(parse_links(index_response))
+        self.index_page_cache.set(
+            url, index_response.validator, [link_to_json(link) for link in links]
+        )
+        if supported_tags is None:
+            return links
+        return [
+            link
+            for link in links
+            if not _is_unsupported_wheel_url(link.url, supported_tags)
+        ]
+
+    def prefetch(
+        self, project_name: str, supported_tags: frozenset[Tag] | None = None
+    ) -> None:
+        """
+        Start fetching and parsing the index pages for project_name in the
+        background, so a later fetch_links() call likely finds them ready.
+
+        Only pages served over HTTPS are prefetched, other locations are
+        either local or subject to a secure origin check on use.
+        """
+        if not self.prefetch_index_pages:
+            return
+        self._start_fetching(
+            self.search_scope.get_index_urls_locations(project_name),
+            project_name,
+            supported_tags,
+        )
+
+    def fetch_concurrently(
+        self, project_name: str, supported_tags: frozenset[Tag] | None = None
+    ) -> None:
+        """
+        Start fetching and parsing the index pages for project_name from all
+        the index URLs at the same time, unless index_jobs is 1.
+
+        fetch_links() still returns the pages in whatever order they are asked
+        for, so the candidates are found in the same priority order as when
+        fetching the pages one after another, but the time spent waiting is
+        that of the slowest index rather than the sum of all of them. Like
+        prefetch(), this only applies to pages served over HTTPS.
+        """
+        if self.index_jobs <= 1:
+            return
+        urls = self.search_scope.get_index_urls_locations(project_name)
+        if len(urls) > 1:
+            self._start_fetching(urls, project_name, supported_tags)
+
+    def _start_fetching(
+        self,
+        urls: Iterable[str],
+        project_name: str,
+        supported_tags: frozenset[Tag] | None,
+    ) -> None:
+        for url in urls:
+            if not url.startswith("https:") or url in self._prefetch_started:
+                continue
+            if self._prefetch_executor is None:
+                self._prefetch_executor = ThreadPoolExecutor(
+                    max_workers=(
+                        max(self.index_jobs, _PREFETCH_WORKERS)
+                        if self.prefetch_index_pages
+                        else self.index_jobs
+                    ),
+                    thread_name_prefix="pip-prefetch",
+                )
+            self._prefetch_started.add(url)
+            location = Link(url, cache_link_parsing=False)
+            self._prefetched[url] = (
+                supported_tags,
+                self._prefetch_executor.submit(
+                    self._fetch_links, location, project_name, supported_tags
+                ),
+            )
+
+    def cancel_prefetch(self) -> None:
+        """Stop prefetching, discarding the pages which weren't fetched yet."""
+        if self._prefetch_executor is None:
+            return
+        self._prefetch_executor.shutdown(wait=False, cancel_futures=True)
+        self._prefetch_executor = None
+        for url, (_, future) in list(self._prefetched.items()):
+            if future.cancelled():
+                del self._prefetched[url]
+                self._prefetch_started.discard(url)
 
     def collect_sources(
         self,
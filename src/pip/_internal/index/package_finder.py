@@ -7,11 +7,13 @@ import enum
 import functools
 import itertools
 import logging
+import operator
 import re
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from typing import (
     TYPE_CHECKING,
+    Any,
 )
 
 from pip._vendor.packaging import specifiers
@@ -27,7 +29,7 @@ from pip._internal.exceptions import (
     InvalidWheelFilename,
     UnsupportedWheel,
 )
-from pip._internal.index.collector import LinkCollector, parse_links
+from pip._internal.index.collector import LinkCollector
 from pip._internal.metadata import select_backend
 from pip._internal.models.candidate import InstallationCandidate
 from pip._internal.models.format_control import FormatControl
@@ -36,7 +38,7 @@ from pip._internal.models.release_control import ReleaseControl
 from pip._internal.models.search_scope import SearchScope
 from pip._internal.models.selection_prefs import SelectionPreferences
 from pip._internal.models.target_python import TargetPython
-from pip._internal.models.wheel import Wheel
+from pip._internal.models.wheel import get_wheel
 from pip._internal.req import InstallRequirement
 from pip._internal.utils._log import getLogger
 from pip._internal.utils.filetypes import WHEEL_EXTENSION
@@ -55,6 +57,7 @@ __all__ = ["FormatControl", "BestCandidateResult", "PackageFinder"]
 logger = getLogger(__name__)
 
 BuildTag = tuple[()] | tuple[int, str]
+CandidateGroupKey = tuple[int, int, int, _BaseVersion]
 CandidateSortingKey = tuple[int, int, int, _BaseVersion, int | None, BuildTag]
 
 
@@ -201,7 +204,7 @@ class LinkEvaluator:
                 return (LinkType.format_unsupported, "macosx10 one")
             if ext == WHEEL_EXTENSION:
                 try:
-                    wheel = Wheel(link.filename)
+                    wheel = get_wheel(link.filename)
                 except InvalidWheelFilename:
                     return (
                         LinkType.format_invalid,
@@ -380,30 +383,68 @@ class CandidatePreferences:
     release_control: ReleaseControl | None = None
 
 
-@dataclass(frozen=True)
 class BestCandidateResult:
     """A collection of candidates, returned by `PackageFinder.find_best_candidate`.
 
     This class is only intended to be instantiated by CandidateEvaluator's
     `compute_best_candidate()` method.
 
+    The applicable candidates are ranked lazily, one version at a time and
+    most preferred first, so that finding the best candidate doesn't need the
+    wheel tags of every file of the project to be ranked.
+
     :param all_candidates: A sequence of all available candidates found.
-    :param applicable_candidates: The applicable candidates.
-    :param best_candidate: The most preferred candidate found, or None
-        if no applicable candidates were found.
+    :param applicable_candidates: The applicable candidates, in any order.
+    :param evaluator: The CandidateEvaluator used to rank the applicable
+        candidates.
     """
 
-    all_candidates: list[InstallationCandidate]
-    applicable_candidates: list[InstallationCandidate]
-    best_candidate: InstallationCandidate | None
+    def __init__(
+        self,
+        all_candidates: list[InstallationCandidate],
+        applicable_candidates: list[InstallationCandidate],
+        evaluator: CandidateEvaluator,
+    ) -> None:
+        assert set(applicable_candidates) <= set(all_candidates)
+
+        self.all_candidates = all_candidates
+        self._evaluator = evaluator
+        self._pending_groups = evaluator.iter_ranked_groups(applicable_candidates)
+        self._ranked_groups: list[list[InstallationCandidate]] = []
+
+    def _get_group(self, index: int) -> list[InstallationCandidate] | None:
+        while len(self._ranked_groups) <= index:
+            group = next(self._pending_groups, None)
+            if group is None:
+                return None
+            self._ranked_groups.append(group)
+        return self._ranked_groups[index]
+
+    def iter_applicable(self) -> Iterator[InstallationCandidate]:
+        """Iterate through the applicable candidates, most preferred first."""
+        for index in itertools.count():
+            group = self._get_group(index)
+            if group is None:
+                return
+            yield from reversed(group)
 
-    def __post_init__(self) -> None:
-        assert set(self.applicable_candidates) <= set(self.all_candidates)
+    @property
+    def applicable_candidates(self) -> list[InstallationCandidate]:
+        """The applicable candidates, from least to most preferred.
 
-        if self.best_candidate is None:
-            assert not self.applicable_candidates
-        else:
-            assert self.best_candidate in self.applicable_candidates
+        This ranks all of them, prefer `iter_applicable()` where possible.
+        """
+        candidates = list(self.iter_applicable())
+        candidates.reverse()
+        return candidates
+
+    @functools.cached_property
+    def best_candidate(self) -> InstallationCandidate | None:
+        """The most preferred candidate, or None if no candidate is applicable."""
+        group = self._get_group(0)
+        if group is None:
+            return None
+        return self._evaluator.sort_best_candidate(group)
 
 
 class CandidateEvaluator:
@@ -446,6 +487,7 @@ class CandidateEvaluator:
             prefer_binary=prefer_binary,
             release_control=release_control,
             hashes=hashes,
+            tag_priorities=target_python.get_tag_priorities(),
         )
 
     def __init__(
@@ -456,10 +498,13 @@ class CandidateEvaluator:
         prefer_binary: bool = False,
         release_control: ReleaseControl | None = None,
         hashes: Hashes | None = None,
+        tag_priorities: dict[Tag, int] | None = None,
     ) -> None:
         """
         :param supported_tags: The PEP 425 tags supported by the target
             Python in order of preference (most preferred first).
+        :param tag_priorities: An optional mapping from each of the
+            supported tags to its index, shared between evaluators.
         """
         self._release_control = release_control
         self._hashes = hashes
@@ -470,9 +515,9 @@ class CandidateEvaluator:
         # Since the index of the tag in the _supported_tags list is used
         # as a priority, precompute a map from tag to index/priority to be
         # used in wheel.find_most_preferred_tag.
-        self._wheel_tag_preferences = {
-            tag: idx for idx, tag in enumerate(supported_tags)
-        }
+        if tag_priorities is None:
+            tag_priorities = {tag: idx for idx, tag in enumerate(supported_tags)}
+        self._wheel_tag_preferences = tag_priorities
 
     def get_applicable_candidates(
         self,
@@ -481,6 +526,15 @@ class CandidateEvaluator:
         """
         Return the applicable candidates from a list of candidates.
         """
+        return sorted(self._filter_applicable(candidates), key=self._sort_key)
+
+    def _filter_applicable(
+        self,
+        candidates: list[InstallationCandidate],
+    ) -> list[InstallationCandidate]:
+        """
+        Return the applicable candidates, in the order they were given.
+        """
         # Using None infers from the specifier instead.
         if self._release_control is not None:
             allow_prereleases = self._release_control.allows_prereleases(
@@ -505,13 +559,44 @@ class CandidateEvaluator:
                 else c.version
             ),
         )
-        filtered_applicable_candidates = filter_unallowed_hashes(
+        return filter_unallowed_hashes(
             candidates=list(applicable_candidates),
             hashes=self._hashes,
             project_name=self._project_name,
         )
 
-        return sorted(filtered_applicable_candidates, key=self._sort_key)
+    def _group_key(self, candidate: InstallationCandidate) -> CandidateGroupKey:
+        """
+        Return the part of the sorting key that doesn't depend on wheel tags.
+
+        This is a prefix of `_sort_key()`, so candidates can be ranked one
+        group at a time without parsing wheel filenames up front.
+        """
+        link = candidate.link
+        has_allowed_hash = int(link.is_hash_allowed(self._hashes))
+        yank_value = -1 * int(link.is_yanked)  # -1 for yanked.
+        binary_preference = int(self._prefer_binary and link.is_wheel)
+        return (has_allowed_hash, yank_value, binary_preference, candidate.version)
+
+    def iter_ranked_groups(
+        self,
+        candidates: list[InstallationCandidate],
+    ) -> Iterator[list[InstallationCandidate]]:
+        """
+        Yield the candidates grouped by `_group_key()`, most preferred first.
+
+        Each group is sorted by `_sort_key()` only when it is reached, so the
+        concatenation of the groups in reverse is exactly
+        ``sorted(candidates, key=self._sort_key)``.
+        """
+        keyed = sorted(
+            ((self._group_key(c), c) for c in candidates), key=operator.itemgetter(0)
+        )
+        groups = itertools.groupby(keyed, operator.itemgetter(0))
+        for group in reversed([list(g) for _, g in groups]):
+            # Every candidate of the group has the same _group_key(), so only
+            # the rest of _sort_key() needs computing.
+            yield sorted((c for _, c in group), key=self._tag_key)
 
     def _sort_key(self, candidate: InstallationCandidate) -> CandidateSortingKey:
         """
@@ -543,14 +628,19 @@ class CandidateEvaluator:
               comparison operators, but then different sdist links
               with the same version, would have to be considered equal
         """
+        return (*self._group_key(candidate), *self._tag_key(candidate))
+
+    def _tag_key(self, candidate: InstallationCandidate) -> tuple[int, BuildTag]:
+        """
+        Return the part of the sorting key that depends on wheel tags.
+        """
         valid_tags = self._supported_tags
         support_num = len(valid_tags)
         build_tag: BuildTag = ()
-        binary_preference = 0
         link = candidate.link
         if link.is_wheel:
             # can raise InvalidWheelFilename
-            wheel = Wheel(link.filename)
+            wheel = get_wheel(link.filename)
             try:
                 pri = -(
                     wheel.find_most_preferred_tag(
@@ -562,21 +652,10 @@ class CandidateEvaluator:
                     f"{wheel.filename} is not a supported wheel for this platform. It "
                     "can't be sorted."
                 )
-            if self._prefer_binary:
-                binary_preference = 1
             build_tag = wheel.build_tag
         else:  # sdist
             pri = -(support_num)
-        has_allowed_hash = int(link.is_hash_allowed(self._hashes))
-        yank_value = -1 * int(link.is_yanked)  # -1 for yanked.
-        return (
-            has_allowed_hash,
-            yank_value,
-            binary_preference,
-            candidate.version,
-            pri,
-            build_tag,
-        )
+        return (pri, build_tag)
 
     def sort_best_candidate(
         self,
@@ -597,15 +676,13 @@ class CandidateEvaluator:
     ) -> BestCandidateResult:
         """
         Compute and return a `BestCandidateResult` instance.
-        """
-        applicable_candidates = self.get_applicable_candidates(candidates)
-
-        best_candidate = self.sort_best_candidate(applicable_candidates)
 
+        The applicable candidates are ranked lazily by the result.
+        """
         return BestCandidateResult(
             candidates,
-            applicable_candidates=applicable_candidates,
-            best_candidate=best_candidate,
+            applicable_candidates=self._filter_applicable(candidates),
+            evaluator=self,
         )
 
 
@@ -655,6 +732,9 @@ class PackageFinder:
         # the error message when resolution fails.
         self._requires_python_skipped: set[str] = set()
 
+        # The supported tags, hashable so that they can key parsed pages.
+        self._link_filter_tags: frozenset[Tag] | None = None
+
         # Cache of the result of finding candidates
         self._all_candidates: dict[str, list[InstallationCandidate]] = {}
         self._best_candidates: dict[
@@ -853,6 +933,19 @@ class PackageFinder:
 
         return candidates
 
+    def _get_link_filter_tags(self) -> frozenset[Tag] | None:
+        """Return the tags index pages can be filtered with while parsing.
+
+        Links to wheels that match none of these tags are always rejected by
+        LinkEvaluator, so they are skipped early, unless debug logging is on
+        and the reasons they are skipped must be logged.
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            return None
+        if self._link_filter_tags is None:
+            self._link_filter_tags = frozenset(self._target_python.get_unsorted_tags())
+        return self._link_filter_tags
+
     def process_project_url(
         self, project_url: Link, link_evaluator: LinkEvaluator
     ) -> list[InstallationCandidate]:
@@ -860,14 +953,14 @@ class PackageFinder:
             "Fetching project page and analyzing links: %s",
             project_url,
         )
-        index_response = self._link_collector.fetch_response(
-            project_url, package_name=link_evaluator.project_name
+        page_links = self._link_collector.fetch_links(
+            project_url,
+            package_name=link_evaluator.project_name,
+            supported_tags=self._get_link_filter_tags(),
         )
-        if index_response is None:
+        if page_links is None:
             return []
 
-        page_links = list(parse_links(index_response))
-
         with indent_log():
             package_links = self.evaluate_links(
                 link_evaluator,
@@ -876,6 +969,67 @@ class PackageFinder:
 
         return package_links
 
+    def prefetch_index_pages(self, project_name: str) -> None:
+        """Start fetching the index pages for project_name in the background,
+        if enabled and the candidates of the project aren't known yet.
+        """
+        if project_name in self._all_candidates:
+            return
+        if canonicalize_name(project_name) in self._locked_links:
+            return
+        self._link_collector.prefetch(
+            project_name, supported_tags=self._get_link_filter_tags()
+        )
+
+    def cancel_prefetch(self) -> None:
+        """Discard the index pages that were requested but not yet fetched."""
+        self._link_collector.cancel_prefetch()
+
+    def get_fetched_index_pages(self) -> list[tuple[str, str | None, str | None]]:
+        """Return the URL of each index page fetched so far, with the project
+        it was fetched for and its version, or None if the version of the page
+        can't be identified (e.g. it has no ETag or Last-Modified header).
+        """
+        return self._link_collector.get_fetched_pages()
+
+    def check_index_pages(self, pages: Iterable[tuple[str, str | None, str]]) -> bool:
+        """Tell whether index pages returned by get_fetched_index_pages() are
+        unchanged, fetching them again.
+        """
+        return self._link_collector.check_pages(pages)
+
+    def describe_selection(self) -> dict[str, Any]:
+        """Describe everything affecting which candidates are found and
+        preferred, in a form that can be serialized to JSON.
+        """
+        release_control = self._candidate_prefs.release_control
+        uploaded_prior_to = self._uploaded_prior_to
+        return {
+            "index_urls": self.index_urls,
+            "find_links": self.find_links,
+            "tags": [str(tag) for tag in self._target_python.get_sorted_tags()],
+            "py_version_info": self._target_python.py_version_info,
+            "allow_yanked": self._allow_yanked,
+            "ignore_requires_python": self._ignore_requires_python,
+            "prefer_binary": self._candidate_prefs.prefer_binary,
+            "release_control": (
+                None
+                if release_control is None
+                else [
+                    sorted(release_control.all_releases),
+                    sorted(release_control.only_final),
+                ]
+            ),
+            "no_binary": sorted(self.format_control.no_binary),
+            "only_binary": sorted(self.format_control.only_binary),
+            "uploaded_prior_to": (
+                None if uploaded_prior_to is None else uploaded_prior_to.isoformat()
+            ),
+            "locked_links": {
+                name: link.url for name, link in sorted(self._locked_links.items())
+            },
+        }
+
     def find_all_candidates(self, project_name: str) -> list[InstallationCandidate]:
         """Find all available InstallationCandidate for project_name
 
@@ -908,6 +1062,11 @@ class PackageFinder:
             ]
             return self._all_candidates[project_name]
 
+        # With several indexes, wait for all of their pages at once rather
+        # than one after another.
+        self._link_collector.fetch_concurrently(
+            project_name, supported_tags=self._get_link_filter_tags()
+        )
         collected_sources = self._link_collector.collect_sources(
             project_name=project_name,
             candidates_from_page=functools.partial(
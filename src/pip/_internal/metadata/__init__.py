@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING, Literal, Protocol, cast
 from pip._internal.utils.deprecation import deprecated
 from pip._internal.utils.misc import strtobool
 
+from ._snapshot import environment_snapshots
 from .base import BaseDistribution, BaseEnvironment, FilesystemWheel, MemoryWheel, Wheel
 
 if TYPE_CHECKING:
@@ -20,6 +21,7 @@ __all__ = [
     "FilesystemWheel",
     "MemoryWheel",
     "Wheel",
+    "environment_snapshots",
     "get_default_environment",
     "get_environment",
     "get_wheel_distribution",
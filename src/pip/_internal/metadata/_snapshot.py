@@ -0,0 +1,211 @@
+"""Snapshots of the metadata of installed distributions.
+
+Commands that look at a whole environment (e.g. ``pip list``, ``pip freeze``
+and ``pip check``) spend most of their time parsing the METADATA file of every
+installed distribution. A snapshot records the few values pip needs from each
+``.dist-info`` directory of a location, so they can be reused by later runs
+for as long as the directory is unchanged.
+
+Only the locations of the default environment are snapshotted, since those are
+the ones looked at again by later runs. Locations in the temporary directory,
+such as those of build environments, are not.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import sys
+import tempfile
+from collections.abc import Callable, Generator
+
+from pip._internal.utils.filesystem import write_file_atomically
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+
+# Files in the .dist-info directory whose contents are kept in a snapshot.
+SNAPSHOT_FILES = ("direct_url.json", "INSTALLER", "REQUESTED", "WHEEL")
+
+_snapshot_directory: str | None = None
+_location_snapshots: dict[str, LocationSnapshot] = {}
+
+
+@dataclasses.dataclass(frozen=True)
+class DistributionSnapshot:
+    """The values pip reads from a single ``.dist-info`` directory."""
+
+    stamp: tuple[int, ...]
+    raw_name: str
+    raw_version: str
+    requires_dist: list[str]
+    provides_extra: list[str]
+    # Contents of SNAPSHOT_FILES, None if the file does not exist.
+    files: dict[str, str | None]
+
+
+def _get_stamp(info_location: pathlib.Path) -> tuple[int, ...] | None:
+    """Identify the state of a .dist-info directory.
+
+    A new file in the directory changes its mtime, and rewriting the METADATA
+    file changes at least one of its mtime, size and inode.
+    """
+    if info_location.suffix != ".dist-info":
+        return None
+    try:
+        info_stat = os.stat(info_location)
+        metadata_stat = os.stat(info_location / "METADATA")
+    except OSError:
+        return None
+    return (
+        info_stat.st_mtime_ns,
+        metadata_stat.st_mtime_ns,
+        metadata_stat.st_size,
+        metadata_stat.st_ino,
+    )
+
+
+class LocationSnapshot:
+    """Snapshot of the distributions installed at one location."""
+
+    def __init__(
+        self,
+        location: str,
+        path: str,
+        entries: dict[str, DistributionSnapshot],
+    ) -> None:
+        self.location = location
+        self.path = path
+        self._entries = entries
+        self._modified = False
+
+    @classmethod
+    def load(cls, location: str, path: str) -> LocationSnapshot:
+        entries = {}
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data["version"] == SNAPSHOT_VERSION and data["location"] == location:
+                for name, fields in data["distributions"].items():
+                    fields["stamp"] = tuple(fields["stamp"])
+                    entries[name] = DistributionSnapshot(**fields)
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            # A missing or unreadable snapshot is rebuilt from scratch.
+            entries = {}
+        return cls(location, path, entries)
+
+    def get(
+        self,
+        info_location: pathlib.Path,
+        create: Callable[[tuple[int, ...]], DistributionSnapshot],
+    ) -> DistributionSnapshot | None:
+        """Return the snapshot of a .dist-info directory in this location.
+
+        Entries that are missing or out of date are created by calling
+        ``create`` with the current stamp of the directory. None is returned if
+        the directory cannot be snapshotted.
+        """
+        stamp = _get_stamp(info_location)
+        if stamp is None:
+            return None
+        entry = self._entries.get(info_location.name)
+        if entry is None or entry.stamp != stamp:
+            entry = create(stamp)
+            self._entries[info_location.name] = entry
+            self._modified = True
+        return entry
+
+    def save(self) -> None:
+        """Write the snapshot, forgetting distributions no longer installed."""
+        if not self._modified:
+            return
+        try:
+            names = set(os.listdir(self.location))
+            data = {
+                "version": SNAPSHOT_VERSION,
+                "location": self.location,
+                "distributions": {
+                    name: dataclasses.asdict(entry)
+                    for name, entry in sorted(self._entries.items())
+                    if name in names
+                },
+            }
+            write_file_atomically(self.path, json.dumps(data).encode("utf-8"))
+        except OSError as e:
+            # The next run reads the metadata again.
+            logger.debug("Could not save snapshot of %s: %s", self.location, e)
+            return
+        self._modified = False
+
+
+def _is_long_lived(location: str) -> bool:
+    """Whether a normalized location is in the default environment, and not in
+    the temporary directory.
+    """
+    temp_dir = os.path.normcase(os.path.abspath(tempfile.gettempdir()))
+    if location == temp_dir or location.startswith(temp_dir + os.sep):
+        return False
+    return any(os.path.normcase(os.path.abspath(p)) == location for p in sys.path)
+
+
+def _remove_stale_snapshots(directory: str) -> None:
+    """Remove the snapshots of locations which no longer exist."""
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return
+    for name in names:
+        path = os.path.join(directory, name)
+        try:
+            with open(path, encoding="utf-8") as f:
+                location = json.load(f)["location"]
+            if not os.path.isdir(location):
+                os.unlink(path)
+                logger.debug("Removed snapshot of %s", location)
+        except (OSError, ValueError, KeyError, TypeError):
+            continue
+
+
+def get_location_snapshot(location: str) -> LocationSnapshot | None:
+    """Return the snapshot of a location, if snapshots are enabled and the
+    location is long-lived.
+    """
+    if _snapshot_directory is None or not os.path.isdir(location):
+        return None
+    location = os.path.normcase(os.path.abspath(location))
+    if not _is_long_lived(location):
+        return None
+    snapshot = _location_snapshots.get(location)
+    if snapshot is None:
+        key = hashlib.sha224(location.encode()).hexdigest()
+        path = os.path.join(_snapshot_directory, f"{key}.json")
+        snapshot = _location_snapshots[location] = LocationSnapshot.load(location, path)
+    return snapshot
+
+
+@contextlib.contextmanager
+def environment_snapshots(directory: str) -> Generator[None, None, None]:
+    """Use snapshots stored in ``directory`` while in the context, and save
+    the ones that were updated when leaving it.
+
+    Snapshots of locations which no longer exist are removed whenever one is
+    saved.
+    """
+    global _snapshot_directory
+    _snapshot_directory = directory
+    try:
+        yield
+    finally:
+        _snapshot_directory = None
+        snapshots = [s for s in _location_snapshots.values() if s._modified]
+        _location_snapshots.clear()
+        for snapshot in snapshots:
+            snapshot.save()
+        if snapshots:
+            _remove_stale_snapshots(directory)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import email.message
+import functools
 import importlib.metadata
 import pathlib
 import zipfile
@@ -13,9 +14,13 @@ from typing import (
 from pip._vendor.packaging.requirements import Requirement
 from pip._vendor.packaging.utils import NormalizedName, canonicalize_name
 from pip._vendor.packaging.version import Version
-from pip._vendor.packaging.version import parse as parse_version
 
 from pip._internal.exceptions import InstallationError, InvalidWheel, UnsupportedWheel
+from pip._internal.metadata._snapshot import (
+    SNAPSHOT_FILES,
+    DistributionSnapshot,
+    LocationSnapshot,
+)
 from pip._internal.metadata.base import (
     BaseDistribution,
     BaseEntryPoint,
@@ -23,7 +28,7 @@ from pip._internal.metadata.base import (
     Wheel,
 )
 from pip._internal.utils.misc import normalize_path
-from pip._internal.utils.packaging import get_requirement
+from pip._internal.utils.packaging import get_requirement, get_version
 from pip._internal.utils.temp_dir import TempDirectory
 from pip._internal.utils.wheel import parse_wheel, read_wheel_metadata_file
 
@@ -105,10 +110,12 @@ class Distribution(BaseDistribution):
         dist: importlib.metadata.Distribution,
         info_location: BasePath | None,
         installed_location: BasePath | None,
+        location_snapshot: LocationSnapshot | None = None,
     ) -> None:
         self._dist = dist
         self._info_location = info_location
         self._installed_location = installed_location
+        self._location_snapshot = location_snapshot
 
     @classmethod
     def from_directory(cls, directory: str) -> BaseDistribution:
@@ -142,6 +149,26 @@ class Distribution(BaseDistribution):
             raise InvalidWheel(wheel.location, name) from e
         return cls(dist, dist.info_location, pathlib.PurePosixPath(wheel.location))
 
+    @functools.cached_property
+    def _snapshot(self) -> DistributionSnapshot | None:
+        if self._location_snapshot is None or not isinstance(
+            self._info_location, pathlib.Path
+        ):
+            return None
+        return self._location_snapshot.get(self._info_location, self._take_snapshot)
+
+    def _take_snapshot(self, stamp: tuple[int, ...]) -> DistributionSnapshot:
+        return DistributionSnapshot(
+            stamp=stamp,
+            raw_name=super().raw_name,
+            raw_version=self.metadata["Version"],
+            requires_dist=[str(req) for req in super().iter_raw_dependencies()],
+            provides_extra=[
+                str(extra) for extra in self.metadata.get_all("Provides-Extra", [])
+            ],
+            files={name: self._dist.read_text(name) for name in SNAPSHOT_FILES},
+        )
+
     @property
     def location(self) -> str | None:
         if self._info_location is None:
@@ -171,16 +198,29 @@ class Distribution(BaseDistribution):
                 parse_name_and_version_from_info_directory(self._dist)[1]
                 or self._dist.version
             )
-            return parse_version(version)
+            return get_version(version)
         except TypeError:
             raise BadMetadata(self._dist, reason="invalid metadata entry `version`")
 
     @property
     def raw_version(self) -> str:
+        if self._snapshot is not None:
+            return self._snapshot.raw_version
         return self.metadata["Version"]
 
+    @property
+    def raw_name(self) -> str:
+        if self._snapshot is not None:
+            return self._snapshot.raw_name
+        return super().raw_name
+
+    def _read_text(self, path: InfoPath) -> str | None:
+        if str(path) in SNAPSHOT_FILES and self._snapshot is not None:
+            return self._snapshot.files[str(path)]
+        return self._dist.read_text(str(path))
+
     def is_file(self, path: InfoPath) -> bool:
-        return self._dist.read_text(str(path)) is not None
+        return self._read_text(path) is not None
 
     def iter_distutils_script_names(self) -> Iterator[str]:
         # A distutils installation is always "flat" (not in e.g. egg form), so
@@ -192,7 +232,7 @@ class Distribution(BaseDistribution):
             yield child.name
 
     def read_text(self, path: InfoPath) -> str:
-        content = self._dist.read_text(str(path))
+        content = self._read_text(path)
         if content is None:
             raise FileNotFoundError(path)
         return content
@@ -221,15 +261,21 @@ class Distribution(BaseDistribution):
             return email.message.Message()
         return cast(email.message.Message, metadata)
 
+    def iter_raw_dependencies(self) -> Iterable[str]:
+        if self._snapshot is not None:
+            return self._snapshot.requires_dist
+        return super().iter_raw_dependencies()
+
     def iter_provided_extras(self) -> Iterable[NormalizedName]:
-        return [
-            canonicalize_name(extra)
-            for extra in self.metadata.get_all("Provides-Extra", [])
-        ]
+        if self._snapshot is not None:
+            extras = self._snapshot.provides_extra
+        else:
+            extras = self.metadata.get_all("Provides-Extra", [])
+        return [canonicalize_name(extra) for extra in extras]
 
     def iter_dependencies(self, extras: Collection[str] = ()) -> Iterable[Requirement]:
         contexts: Sequence[dict[str, str]] = [{"extra": e} for e in extras]
-        for req_string in self.metadata.get_all("Requires-Dist", []):
+        for req_string in self.iter_raw_dependencies():
             # strip() because email.message.Message.get_all() may return a leading \n
             # in case a long header was wrapped.
             req = get_requirement(req_string.strip())
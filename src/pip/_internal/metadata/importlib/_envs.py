@@ -15,6 +15,7 @@ from pip._vendor.packaging.utils import (
     parse_wheel_filename,
 )
 
+from pip._internal.metadata._snapshot import get_location_snapshot
 from pip._internal.metadata.base import BaseDistribution, BaseEnvironment
 from pip._internal.utils.filetypes import WHEEL_EXTENSION
 
@@ -86,12 +87,13 @@ class _DistributionFinder:
 
         The path can be either a directory, or a ZIP archive.
         """
+        snapshot = get_location_snapshot(location)
         for dist, info_location in self._find_impl(location):
             if info_location is None:
                 installed_location: BasePath | None = None
             else:
                 installed_location = info_location.parent
-            yield Distribution(dist, info_location, installed_location)
+            yield Distribution(dist, info_location, installed_location, snapshot)
 
     def find_legacy_editables(self, location: str) -> Iterator[BaseDistribution]:
         """Read location in egg-link files and return distributions in there.
@@ -1,9 +1,9 @@
 from dataclasses import dataclass
 
 from pip._vendor.packaging.version import Version
-from pip._vendor.packaging.version import parse as parse_version
 
 from pip._internal.models.link import Link
+from pip._internal.utils.packaging import get_version
 
 
 @dataclass(frozen=True, slots=True)
@@ -19,7 +19,7 @@ class InstallationCandidate:
         self, name: str, version: str, link: Link, locked: bool = False
     ) -> None:
         object.__setattr__(self, "name", name)
-        object.__setattr__(self, "version", parse_version(version))
+        object.__setattr__(self, "version", get_version(version))
         object.__setattr__(self, "link", link)
         object.__setattr__(self, "locked", locked)
 
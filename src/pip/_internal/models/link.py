@@ -7,6 +7,7 @@ import logging
 import os
 import posixpath
 import re
+import sys
 import urllib.parse
 from collections.abc import Mapping
 from dataclasses import dataclass
@@ -246,6 +247,7 @@ class Link:
         "_parsed_url",
         "_url",
         "_path",
+        "_basename",
         "_hashes",
         "comes_from",
         "requires_python",
@@ -307,6 +309,9 @@ class Link:
         self._url = url
         # The .path property is hot, so calculate its value ahead of time.
         self._path = urllib.parse.unquote(self._parsed_url.path)
+        # The last path component is needed over and over while candidates
+        # are ranked, but only for some links, so it's computed on demand.
+        self._basename: str | None = None
 
         link_hash = LinkHash.find_hash_url_fragment(url)
         hashes_from_link = {} if link_hash is None else link_hash.as_dict()
@@ -316,7 +321,8 @@ class Link:
             self._hashes = {**hashes, **hashes_from_link}
 
         self.comes_from = comes_from
-        self.requires_python = requires_python if requires_python else None
+        # Most links of a page share the same few Requires-Python specifiers.
+        self.requires_python = sys.intern(requires_python) if requires_python else None
         self.yanked_reason = yanked_reason
         self.metadata_file_data = metadata_file_data
         self.upload_time = upload_time
@@ -467,9 +473,14 @@ class Link:
     def redacted_url(self) -> str:
         return redact_auth_from_url(self.url)
 
+    def _get_basename(self) -> str:
+        if self._basename is None:
+            self._basename = posixpath.basename(self._path.rstrip("/"))
+        return self._basename
+
     @property
     def filename(self) -> PathComponent:
-        name = _to_path_component(posixpath.basename(self.path.rstrip("/")))
+        name = _to_path_component(self._get_basename())
         if name:
             return name
 
@@ -496,7 +507,7 @@ class Link:
         return self._path
 
     def splitext(self) -> tuple[str, str]:
-        return splitext(posixpath.basename(self.path.rstrip("/")))
+        return splitext(self._get_basename())
 
     @property
     def ext(self) -> str:
@@ -556,6 +567,14 @@ class Link:
     def hash_name(self) -> str | None:
         return next(iter(self._hashes), None)
 
+    def get_hashes(self) -> dict[str, str]:
+        """Return the known hashes of the file, by hash name."""
+        return dict(self._hashes)
+
+    def get_hash(self, name: str) -> str | None:
+        """Return the hash of the given type recorded for this link, if any."""
+        return self._hashes.get(name)
+
     @property
     def show_url(self) -> str:
         return posixpath.basename(self._url.split("#", 1)[0].split("?", 1)[0])
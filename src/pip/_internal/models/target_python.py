@@ -23,6 +23,7 @@ class TargetPython:
         "py_version_info",
         "_valid_tags",
         "_valid_tags_set",
+        "_tag_priorities",
     ]
 
     def __init__(
@@ -65,6 +66,7 @@ class TargetPython:
         # This is used to cache the return value of get_(un)sorted_tags.
         self._valid_tags: list[Tag] | None = None
         self._valid_tags_set: set[Tag] | None = None
+        self._tag_priorities: dict[Tag, int] | None = None
 
     def format_given(self) -> str:
         """
@@ -120,3 +122,17 @@ class TargetPython:
             self._valid_tags_set = set(self.get_sorted_tags())
 
         return self._valid_tags_set
+
+    def get_tag_priorities(self) -> dict[Tag, int]:
+        """Return a mapping from each supported tag to its index in
+        get_sorted_tags(), where lower is more preferred.
+
+        The same mapping is returned every time, so wheels can remember their
+        priority for it.
+        """
+        if self._tag_priorities is None:
+            self._tag_priorities = {
+                tag: idx for idx, tag in enumerate(self.get_sorted_tags())
+            }
+
+        return self._tag_priorities
@@ -4,6 +4,7 @@ name that have meaning.
 
 from __future__ import annotations
 
+import functools
 from collections.abc import Iterable
 
 from pip._vendor.packaging.tags import Tag
@@ -29,6 +30,10 @@ class Wheel:
         self.name, _version, self.build_tag, self.file_tags = wheel_info
         self.version = str(_version)
 
+        # The result of find_most_preferred_tag() for the last tag_to_priority
+        # mapping it was given.
+        self._preferred_tag: tuple[dict[Tag, int], int] | None = None
+
     def get_formatted_file_tags(self) -> list[str]:
         """Return the wheel's tags as a sorted list of strings."""
         return sorted(str(tag) for tag in self.file_tags)
@@ -68,9 +73,17 @@ class Wheel:
         :raises ValueError: If none of the wheel's file tags match one of
             the supported tags.
         """
-        return min(
+        # Wheels shared through get_wheel() are ranked against the same
+        # mapping over and over, so remember the last result.
+        if self._preferred_tag is not None:
+            last_mapping, priority = self._preferred_tag
+            if last_mapping is tag_to_priority:
+                return priority
+        priority = min(
             tag_to_priority[tag] for tag in self.file_tags if tag in tag_to_priority
         )
+        self._preferred_tag = (tag_to_priority, priority)
+        return priority
 
     def supported(self, tags: Iterable[Tag]) -> bool:
         """Return whether the wheel is compatible with one of the given tags.
@@ -78,3 +91,12 @@ class Wheel:
         :param tags: the PEP 425 tags to check the wheel against.
         """
         return not self.file_tags.isdisjoint(tags)
+
+
+@functools.lru_cache(maxsize=10000)
+def get_wheel(filename: str) -> Wheel:
+    """Construct a Wheel object with caching"""
+    # The same wheel filename is parsed when its link is evaluated, when its
+    # candidate is ranked and when it is prepared. Sharing the Wheel object
+    # also shares the tag priority it remembers.
+    return Wheel(filename)
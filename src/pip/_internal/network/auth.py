@@ -12,6 +12,7 @@ import os
 import shutil
 import subprocess
 import sysconfig
+import threading
 import typing
 import urllib.parse
 from abc import ABC, abstractmethod
@@ -256,6 +257,10 @@ class MultiDomainBasicAuth(AuthBase):
         # request authenticates, the caller should call
         # ``save_credentials`` to save these.
         self._credentials_to_save: Credentials | None = None
+        # Requests may be sent from several threads at once (e.g. when index
+        # pages are prefetched), make sure only one of them asks for
+        # credentials at a time.
+        self._lock = threading.Lock()
 
     @property
     def keyring_provider(self) -> KeyRingBaseProvider:
@@ -502,41 +507,52 @@ class MultiDomainBasicAuth(AuthBase):
         if resp.status_code != 401:
             return resp
 
-        # Look for credentials for the (possibly redirected) URL. Credentials
-        # embedded in the URL -- e.g. carried in the ``Location`` of a
-        # cross-origin redirect, whose ``Authorization`` header requests strips
-        # -- are always honoured, since recovering them needs no user
-        # interaction. Keyring is only consulted when it is enabled, because it
-        # may require interaction and is therefore disabled under --no-input.
-        username, password = self._get_new_credentials(
-            resp.url,
-            allow_netrc=False,
-            allow_keyring=self.use_keyring,
-        )
+        parsed = urllib.parse.urlparse(resp.url)
 
-        # We are not able to prompt the user so simply return the response
-        if not self.prompting and not username and not password:
-            return resp
+        with self._lock:
+            # Another thread may have obtained credentials for this host
+            # since this request was sent without any, reuse them.
+            known = self.passwords.get(parsed.netloc)
+            if known is not None and "Authorization" not in resp.request.headers:
+                username, password = known
+                save = False
+            else:
+                # Look for credentials for the (possibly redirected) URL.
+                # Credentials embedded in the URL -- e.g. carried in the
+                # ``Location`` of a cross-origin redirect, whose
+                # ``Authorization`` header requests strips -- are always
+                # honoured, since recovering them needs no user interaction.
+                # Keyring is only consulted when it is enabled, because it may
+                # require interaction and is therefore disabled under
+                # --no-input.
+                username, password = self._get_new_credentials(
+                    resp.url,
+                    allow_netrc=False,
+                    allow_keyring=self.use_keyring,
+                )
 
-        parsed = urllib.parse.urlparse(resp.url)
+                # We are not able to prompt the user so simply return the
+                # response
+                if not self.prompting and not username and not password:
+                    return resp
 
-        # Prompt the user for a new username and password
-        save = False
-        if not username and not password:
-            username, password, save = self._prompt_for_password(parsed.netloc)
+                # Prompt the user for a new username and password
+                save = False
+                if not username and not password:
+                    username, password, save = self._prompt_for_password(parsed.netloc)
 
-        # Store the new username and password to use for future requests
-        self._credentials_to_save = None
-        if username is not None and password is not None:
-            self.passwords[parsed.netloc] = (username, password)
-
-            # Prompt to save the password to keyring
-            if save and self._should_save_password_to_keyring():
-                self._credentials_to_save = Credentials(
-                    url=parsed.netloc,
-                    username=username,
-                    password=password,
-                )
+            # Store the new username and password to use for future requests
+            self._credentials_to_save = None
+            if username is not None and password is not None:
+                self.passwords[parsed.netloc] = (username, password)
+
+                # Prompt to save the password to keyring
+                if save and self._should_save_password_to_keyring():
+                    self._credentials_to_save = Credentials(
+                        url=parsed.netloc,
+                        username=username,
+                        password=password,
+                    )
 
         # Consume content and release the original connection to allow our new
         #   request to reuse the same one.
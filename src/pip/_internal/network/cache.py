@@ -2,16 +2,21 @@
 
 from __future__ import annotations
 
+import io
 import os
 import shutil
+import struct
+import threading
 from collections.abc import Callable, Generator
 from contextlib import contextmanager
 from datetime import datetime
 from typing import Any, BinaryIO
 
+from pip._vendor import msgpack
 from pip._vendor.cachecontrol.cache import SeparateBodyBaseCache
 from pip._vendor.cachecontrol.caches import SeparateBodyFileCache
 from pip._vendor.requests.models import Response
+from pip._vendor.requests.structures import CaseInsensitiveDict
 
 from pip._internal.utils.filesystem import (
     adjacent_tmp_file,
@@ -126,3 +131,266 @@ class SafeFileCache(SeparateBodyBaseCache):
         """Set the body of the cache entry from a file object."""
         path = self._get_cache_path(key) + ".body"
         self._write_from_io(path, body_file)
+
+
+def _get_validators(metadata: bytes) -> tuple[str | None, ...] | None:
+    """Return the validators of the response described by cachecontrol's
+    metadata, or None if it has none or can't be read.
+    """
+    if not metadata.startswith(b"cc=4,"):
+        return None
+    try:
+        data = msgpack.loads(metadata[5:], raw=False)
+        headers = CaseInsensitiveDict(data["response"]["headers"])
+    except Exception:
+        return None
+    etag = headers.get("ETag")
+    last_modified = headers.get("Last-Modified")
+    if etag is None and last_modified is None:
+        return None
+    return etag, last_modified, headers.get("Content-Length")
+
+
+class SingleFileCache(SafeFileCache):
+    """
+    A file based cache which stores the metadata and the body of an entry
+    together in a single file.
+
+    Entries are spread over 256 directories rather than nested five levels
+    deep, and are always replaced as a whole, so that looking up, writing or
+    evicting an entry touches a single file. Metadata describing another
+    response than the stored body, i.e. with other validators, discards the
+    body until the new one is set, so that a reader never sees a body that
+    goes with other metadata.
+
+    When max_size is given, the least recently used entries are removed as soon
+    as the cache grows past it. The modification time of an entry records when it
+    was last used, since access times are often not kept up to date by
+    filesystems.
+    """
+
+    _MAGIC = b"pip-http"
+    # Magic, flags, and length of the metadata, which is followed by the body.
+    _HEADER = struct.Struct(">8sBQ")
+    _HAS_METADATA = 1
+    _HAS_BODY = 2
+    _COMPLETE = _HAS_METADATA | _HAS_BODY
+
+    # The file recording the approximate size of the cache, so that the
+    # entries only need to be listed when it may have grown past max_size.
+    _SIZE_FILE = "size"
+    # When trimming, remove a bit more than needed so that the next few runs
+    # do not need to trim again.
+    _TRIM_RATIO = 0.9
+
+    def __init__(self, directory: str, max_size: int | None = None) -> None:
+        super().__init__(directory)
+        self.max_size = max_size
+        # Entries are written by the threads of the session too.
+        self._bytes_written = 0
+        self._bytes_written_lock = threading.Lock()
+        # get() hands the file it opened over to the get_body() call that
+        # cachecontrol makes right after it.
+        self._opened = threading.local()
+
+    def _get_cache_path(self, name: str) -> str:
+        hashed = SeparateBodyFileCache.encode(name)
+        return os.path.join(self.directory, hashed[:2], hashed)
+
+    def _open_entry(self, key: str) -> tuple[int, bytes, BinaryIO] | None:
+        """Open the entry for key and read its header and metadata.
+
+        Return the flags, the metadata and the file, positioned at the start
+        of the body, or None if there is no valid entry.
+        """
+        try:
+            f = open(self._get_cache_path(key), "rb")
+        except OSError:
+            return None
+        with suppressed_cache_errors():
+            header = f.read(self._HEADER.size)
+            if len(header) == self._HEADER.size and header.startswith(self._MAGIC):
+                _, flags, length = self._HEADER.unpack(header)
+                metadata = f.read(length)
+                if len(metadata) == length:
+                    return flags, metadata, f
+        f.close()
+        return None
+
+    def _take_opened(self, key: str | None = None) -> BinaryIO | None:
+        """Return the file get() opened for key, closing it if it was opened
+        for another key.
+        """
+        opened = getattr(self._opened, "entry", None)
+        self._opened.entry = None
+        if opened is None:
+            return None
+        opened_key, f = opened
+        if opened_key == key:
+            return f
+        f.close()
+        return None
+
+    def get(self, key: str) -> bytes | None:
+        self._take_opened()
+        entry = self._open_entry(key)
+        if entry is None:
+            return None
+        flags, metadata, f = entry
+        if flags != self._COMPLETE:
+            f.close()
+            return None
+        with suppressed_cache_errors():
+            os.utime(self._get_cache_path(key))
+        self._opened.entry = (key, f)
+        return metadata
+
+    def get_body(self, key: str) -> BinaryIO | None:
+        f = self._take_opened(key)
+        if f is not None:
+            return f
+        entry = self._open_entry(key)
+        if entry is None:
+            return None
+        flags, _, f = entry
+        if flags != self._COMPLETE:
+            f.close()
+            return None
+        return f
+
+    def _write_entry(
+        self, key: str, metadata: bytes | None, body: BinaryIO | None
+    ) -> None:
+        """Replace the entry for key, keeping the metadata or the body of the
+        existing entry when they are not given.
+        """
+        existing = self._open_entry(key)
+        existing_flags = 0 if existing is None else existing[0]
+        flags = 0
+        if metadata is not None:
+            flags |= self._HAS_METADATA
+        elif existing is not None and existing_flags & self._HAS_METADATA:
+            flags |= self._HAS_METADATA
+            metadata = existing[1]
+        if body is not None:
+            flags |= self._HAS_BODY
+        elif existing is not None and existing_flags & self._HAS_BODY:
+            # Keep the body if it was stored first, or if the metadata is only
+            # refreshed, as when a response is revalidated.
+            validators = None if metadata is None else _get_validators(metadata)
+            if not existing_flags & self._HAS_METADATA or (
+                validators is not None and validators == _get_validators(existing[1])
+            ):
+                flags |= self._HAS_BODY
+                body = existing[2]
+        metadata = metadata or b""
+
+        def writer(f: BinaryIO) -> None:
+            try:
+                f.write(self._HEADER.pack(self._MAGIC, flags, len(metadata)))
+                f.write(metadata)
+                if body is not None:
+                    shutil.copyfileobj(body, f)
+                with self._bytes_written_lock:
+                    self._bytes_written += f.tell()
+            finally:
+                # The existing entry can't be replaced while it is open on
+                # Windows.
+                if existing is not None:
+                    existing[2].close()
+
+        try:
+            self._write_to_file(self._get_cache_path(key), writer)
+        finally:
+            if existing is not None:
+                existing[2].close()
+        self._check_size()
+
+    def set(
+        self, key: str, value: bytes, expires: int | datetime | None = None
+    ) -> None:
+        self._write_entry(key, value, None)
+
+    def delete(self, key: str) -> None:
+        with suppressed_cache_errors():
+            os.remove(self._get_cache_path(key))
+
+    def set_body(self, key: str, body: bytes) -> None:
+        self._write_entry(key, None, io.BytesIO(body))
+
+    def set_body_from_io(self, key: str, body_file: BinaryIO) -> None:
+        """Set the body of the cache entry from a file object."""
+        self._write_entry(key, None, body_file)
+
+    def trim(self, max_size: int) -> list[str]:
+        """Remove the least recently used entries until the cache takes at
+        most max_size bytes. Return the paths of the removed entries.
+        """
+        removed, _ = self._trim(max_size)
+        return removed
+
+    def _trim(self, max_size: int) -> tuple[list[str], int]:
+        entries = []
+        with suppressed_cache_errors():
+            for shard in os.scandir(self.directory):
+                if not shard.is_dir():
+                    continue
+                with suppressed_cache_errors():
+                    for entry in os.scandir(shard.path):
+                        # Skip temporary files that are still being written.
+                        if entry.name.endswith(".tmp"):
+                            continue
+                        with suppressed_cache_errors():
+                            stat = entry.stat()
+                            entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        removed = []
+        size = 0
+        kept_size = 0
+        for _, entry_size, path in sorted(entries, reverse=True):
+            size += entry_size
+            if size > max_size:
+                try:
+                    os.unlink(path)
+                except OSError:
+                    # The entry is gone already, or is in use on Windows.
+                    pass
+                else:
+                    removed.append(path)
+                    continue
+            kept_size += entry_size
+        return removed, kept_size
+
+    def _read_size(self) -> int | None:
+        try:
+            with open(os.path.join(self.directory, self._SIZE_FILE)) as f:
+                return int(f.read())
+        except (OSError, ValueError):
+            return None
+
+    def _write_size(self, size: int) -> None:
+        self._write(os.path.join(self.directory, self._SIZE_FILE), b"%d" % size)
+
+    def _check_size(self, closing: bool = False) -> None:
+        """Trim the cache as soon as the entries written may have taken it
+        past max_size, and record its size when closing.
+        """
+        if self.max_size is None:
+            return
+        with self._bytes_written_lock:
+            if not self._bytes_written:
+                return
+            # Replaced entries are counted again, so the recorded size is an
+            # overestimate until the next trim records the exact size.
+            size = self._read_size()
+            if size is None or size + self._bytes_written > self.max_size:
+                _, size = self._trim(int(self.max_size * self._TRIM_RATIO))
+                self._write_size(size)
+                self._bytes_written = 0
+            elif closing:
+                self._write_size(size + self._bytes_written)
+                self._bytes_written = 0
+
+    def close(self) -> None:
+        self._take_opened()
+        self._check_size(closing=True)
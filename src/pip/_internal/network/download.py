@@ -4,13 +4,17 @@ from __future__ import annotations
 
 import contextlib
 import email.message
+import hashlib
 import logging
 import mimetypes
 import os
-from collections.abc import Iterable, Mapping
-from dataclasses import dataclass
+import queue
+import threading
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from http import HTTPStatus
-from typing import BinaryIO
+from typing import TYPE_CHECKING, BinaryIO
 
 from pip._vendor.requests import PreparedRequest
 from pip._vendor.requests.models import Response
@@ -18,7 +22,12 @@ from pip._vendor.urllib3 import HTTPResponse as URLlib3Response
 from pip._vendor.urllib3._collections import HTTPHeaderDict
 from pip._vendor.urllib3.exceptions import ProtocolError, ReadTimeoutError
 
-from pip._internal.cli.progress_bars import BarType, get_download_progress_renderer
+from pip._internal.cli.progress_bars import (
+    BarType,
+    ProgressRenderer,
+    get_batch_download_progress_renderer,
+    get_download_progress_renderer,
+)
 from pip._internal.exceptions import (
     ConnectionFailedError,
     ConnectionTimeoutError,
@@ -36,8 +45,13 @@ from pip._internal.models.link import (
 from pip._internal.network.cache import SafeFileCache, is_from_cache
 from pip._internal.network.session import CacheControlAdapter, PipSession
 from pip._internal.network.utils import HEADERS, raise_for_status, response_chunks
+from pip._internal.utils.hashes import Hashes
+from pip._internal.utils.logging import get_indentation, indent_log
 from pip._internal.utils.misc import format_size, redact_auth_from_url, splitext
 
+if TYPE_CHECKING:
+    from hashlib import _Hash
+
 logger = logging.getLogger(__name__)
 
 
@@ -67,6 +81,7 @@ def _log_download(
     progress_bar: BarType,
     total_length: int | None,
     range_start: int | None = 0,
+    chunks: Iterable[bytes] | None = None,
 ) -> Iterable[bytes]:
     if logger.getEffectiveLevel() > logging.INFO:
         url = link.url_without_fragment
@@ -101,7 +116,8 @@ def _log_download(
     else:
         show_progress = False
 
-    chunks = response_chunks(resp)
+    if chunks is None:
+        chunks = response_chunks(resp)
 
     if not show_progress:
         return chunks
@@ -167,6 +183,9 @@ class _FileDownload:
     size: int | None
     bytes_received: int = 0
     reattempts: int = 0
+    # Fed with the data as it is received, including on resumed downloads, so
+    # that the file doesn't need to be read again to check its hash.
+    hashers: dict[str, _Hash] = field(default_factory=dict)
 
     def is_incomplete(self) -> bool:
         return bool(self.size is not None and self.bytes_received < self.size)
@@ -174,12 +193,51 @@ class _FileDownload:
     def write_chunk(self, data: bytes) -> None:
         self.bytes_received += len(data)
         self.output_file.write(data)
+        for hasher in self.hashers.values():
+            hasher.update(data)
 
     def reset_file(self) -> None:
         """Delete any saved data and reset progress to zero."""
         self.output_file.seek(0)
         self.output_file.truncate()
         self.bytes_received = 0
+        self.hashers = {name: hashlib.new(name) for name in self.hashers}
+
+
+@dataclass
+class _Segment:
+    """A byte range of a segmented download, excluding its end."""
+
+    start: int
+    end: int
+    received: int = 0
+
+    @property
+    def position(self) -> int:
+        return self.start + self.received
+
+    def is_complete(self) -> bool:
+        return self.position >= self.end
+
+
+class _SegmentedDownloadError(Exception):
+    """A segment could not be downloaded, or the server ignored the range."""
+
+
+def _split_segments(size: int, count: int) -> list[_Segment]:
+    length = -(-size // count)
+    return [
+        _Segment(start, min(start + length, size)) for start in range(0, size, length)
+    ]
+
+
+def _is_range_response(resp: Response, segment: _Segment, size: int) -> bool:
+    """Check that the server answered with exactly the requested range."""
+    if resp.status_code != HTTPStatus.PARTIAL_CONTENT:
+        return False
+    content_range = resp.headers.get("Content-Range", "")
+    expected = f"bytes {segment.start}-{segment.end - 1}/{size}"
+    return content_range.strip().lower() == expected
 
 
 class Downloader:
@@ -187,24 +245,87 @@ class Downloader:
         self,
         session: PipSession,
         progress_bar: BarType,
+        concurrency: int = 1,
     ) -> None:
         self._session = session
         self._progress_bar = progress_bar
         self._resume_retries = session.resume_retries
+        self._segments = session.download_segments
+        self._segment_threshold = session.segmented_download_threshold
+        self._concurrency = concurrency
         assert (
             self._resume_retries >= 0
         ), "Number of max resume retries must be bigger or equal to zero"
+        assert self._concurrency >= 1, "Download concurrency must be at least one"
+        assert self._segments >= 1, "Download segments must be at least one"
 
     def batch(
-        self, links: Iterable[Link], location: str
+        self,
+        links: Iterable[Link],
+        location: str,
+        hashes: Mapping[Link, Hashes] | None = None,
     ) -> Iterable[tuple[Link, tuple[str, str]]]:
-        """Convenience method to download multiple links."""
-        for link in links:
-            filepath, content_type = self(link, location)
-            yield link, (filepath, content_type)
+        """Convenience method to download multiple links.
 
-    def __call__(self, link: Link, location: str) -> tuple[str, str]:
-        """Download a link and save it under location."""
+        If the downloader was configured with a concurrency greater than one,
+        the links are downloaded by a pool of worker threads sharing the
+        session's connection pool. Results are always yielded in the order of
+        the given links.
+
+        :param hashes: The hashes to check each link's file against, as done
+            by __call__().
+        """
+        links = list(links)
+        hashes = hashes or {}
+        if self._concurrency == 1 or len(links) <= 1:
+            for link in links:
+                filepath, content_type = self(link, location, hashes.get(link))
+                yield link, (filepath, content_type)
+            return
+
+        logger.info(
+            "Downloading %d files (up to %d at a time)",
+            len(links),
+            min(self._concurrency, len(links)),
+        )
+        progress: ProgressRenderer[Future[tuple[str, str]]]
+        progress = get_batch_download_progress_renderer(
+            bar_type=self._progress_bar, total=len(links)
+        )
+        # Only a single live progress display can be active at a time, so the
+        # workers report their progress through the combined progress bar.
+        download = Downloader(self._session, "off")
+        indentation = get_indentation()
+
+        def download_one(link: Link) -> tuple[str, str]:
+            # Logging indentation is thread-local, carry it over to the worker.
+            with indent_log(indentation):
+                return download(link, location, hashes.get(link))
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(self._concurrency, len(links)),
+            thread_name_prefix="pip-download",
+        )
+        try:
+            futures = [executor.submit(download_one, link) for link in links]
+            for future in progress(as_completed(futures)):
+                # Surface the first failure as soon as it happens.
+                future.result()
+            for link, future in zip(links, futures):
+                yield link, future.result()
+        finally:
+            # On failure, don't start any download which hasn't begun yet.
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def __call__(
+        self, link: Link, location: str, hashes: Hashes | None = None
+    ) -> tuple[str, str]:
+        """Download a link and save it under location.
+
+        :param hashes: If given, one of these hashes must match the file, or
+            HashMismatch will be raised. The hashes are computed as the file
+            is downloaded, rather than by reading it again afterwards.
+        """
         resp = self._http_get(link)
         download_size = _get_http_response_size(resp)
 
@@ -213,18 +334,194 @@ class Downloader:
         )
         try:
             with open(filepath, "wb") as content_file:
-                download = _FileDownload(link, content_file, download_size)
-                self._process_response(download, resp)
-                if download.is_incomplete():
-                    self._attempt_resumes_or_redownloads(download, resp)
+                download = _FileDownload(
+                    link,
+                    content_file,
+                    download_size,
+                    hashers=hashes.make_hashers() if hashes else {},
+                )
+                if self._should_segment(resp, download_size):
+                    self._download_segmented(download, resp)
+                else:
+                    self._process_response(download, resp)
+                    if download.is_incomplete():
+                        self._attempt_resumes_or_redownloads(download, resp)
         except IncompleteDownloadError:
             with contextlib.suppress(OSError):
                 os.remove(filepath)
             raise
 
+        if hashes:
+            hashes.check_against_hashers(download.hashers)
+
         content_type = resp.headers.get("Content-Type", "")
         return filepath, content_type
 
+    def _should_segment(self, resp: Response, size: int | None) -> bool:
+        """Whether to download the rest of the response as parallel ranges.
+
+        The ranges are requested with an If-Range validator, so that a file
+        changing on the server can't be stitched together from two versions.
+        """
+        return (
+            self._segments > 1
+            and size is not None
+            and size >= max(self._segment_threshold, self._segments)
+            and resp.status_code == HTTPStatus.OK
+            and resp.headers.get("Accept-Ranges", "").strip().lower() == "bytes"
+            and not is_from_cache(resp)
+            and _get_http_response_etag_or_last_modified(resp) is not None
+        )
+
+    def _download_segmented(self, download: _FileDownload, resp: Response) -> None:
+        """Download a file as several byte ranges at the same time.
+
+        If any of the ranges fails, the file is downloaded again as a whole.
+        """
+        try:
+            self._process_segments(download, resp)
+        except _SegmentedDownloadError as exc:
+            logger.warning(
+                "Segmented download failed (%s), downloading %s as a whole",
+                exc.__cause__ or exc,
+                download.link,
+            )
+            download.reset_file()
+            resp = self._http_get(download.link)
+            download.size = _get_http_response_size(resp)
+            self._process_response(download, resp)
+            if download.is_incomplete():
+                self._attempt_resumes_or_redownloads(download, resp)
+            return
+
+        # Like a resumed download, the file was never received in a single
+        # response, so cachecontrol won't have cached it.
+        self._cache_resumed_download(download, resp)
+
+    def _process_segments(self, download: _FileDownload, resp: Response) -> None:
+        """Receive the segments of a file, and save them in place.
+
+        The first segment is read from the original response, and the others
+        are requested by worker threads. This thread is the only one writing
+        to the file. The hashes are computed in order: data at the start of
+        the unhashed part of the file is hashed as it arrives, and the rest is
+        read back from the file once the data before it is complete.
+        """
+        assert download.size is not None
+        size = download.size
+        segments = _split_segments(size, self._segments)
+        validator = _get_http_response_etag_or_last_modified(resp)
+        assert validator is not None
+        logger.debug("Downloading %s in %d segments", download.link, len(segments))
+
+        # Bound the data held in memory when the disk is slower than the network.
+        results: queue.Queue[tuple[int, bytes | Exception | None]] = queue.Queue(
+            maxsize=4 * len(segments)
+        )
+        stop = threading.Event()
+
+        def put(item: tuple[int, bytes | Exception | None]) -> bool:
+            while not stop.is_set():
+                try:
+                    results.put(item, timeout=0.1)
+                except queue.Full:
+                    continue
+                return True
+            return False
+
+        def fetch(index: int) -> None:
+            segment = segments[index]
+            seg_resp = resp
+            try:
+                if index > 0:
+                    headers = HEADERS.copy()
+                    headers["Range"] = f"bytes={segment.start}-{segment.end - 1}"
+                    headers["If-Range"] = validator
+                    seg_resp = self._http_get(download.link, headers)
+                    if not _is_range_response(seg_resp, segment, size):
+                        raise _SegmentedDownloadError(
+                            f"unexpected response to a range request: "
+                            f"{seg_resp.status_code}"
+                        )
+                remaining = segment.end - segment.start
+                for chunk in response_chunks(seg_resp):
+                    # The first response continues past its segment.
+                    chunk = chunk[:remaining]
+                    remaining -= len(chunk)
+                    if not put((index, chunk)):
+                        return
+                    if not remaining:
+                        break
+                if remaining:
+                    raise _SegmentedDownloadError("connection closed early")
+                put((index, None))
+            except Exception as exc:
+                put((index, exc))
+            finally:
+                seg_resp.close()
+
+        hashed = 0
+        output_file = download.output_file
+
+        def hash_written() -> None:
+            """Hash the data written after the hashed part of the file."""
+            nonlocal hashed
+            for segment in segments:
+                if segment.end <= hashed:
+                    continue
+                if segment.position > hashed:
+                    output_file.flush()
+                    with open(output_file.name, "rb") as f:
+                        f.seek(hashed)
+                        while hashed < segment.position:
+                            data = f.read(min(segment.position - hashed, 1 << 20))
+                            for hasher in download.hashers.values():
+                                hasher.update(data)
+                            hashed += len(data)
+                if not segment.is_complete():
+                    break
+
+        def receive() -> Iterator[bytes]:
+            nonlocal hashed
+            pending = len(segments)
+            while pending:
+                index, item = results.get()
+                if item is None:
+                    pending -= 1
+                    continue
+                if isinstance(item, Exception):
+                    raise _SegmentedDownloadError(item) from item
+                segment = segments[index]
+                output_file.seek(segment.position)
+                output_file.write(item)
+                if segment.position == hashed:
+                    for hasher in download.hashers.values():
+                        hasher.update(item)
+                    hashed += len(item)
+                segment.received += len(item)
+                download.bytes_received += len(item)
+                if segment.is_complete():
+                    hash_written()
+                yield item
+
+        output_file.truncate(size)
+        executor = ThreadPoolExecutor(
+            max_workers=len(segments), thread_name_prefix="pip-download-segment"
+        )
+        try:
+            for index in range(len(segments)):
+                executor.submit(fetch, index)
+            chunks = _log_download(
+                resp, download.link, self._progress_bar, size, chunks=receive()
+            )
+            for _ in chunks:
+                pass
+        finally:
+            stop.set()
+            executor.shutdown(wait=True)
+        output_file.seek(size)
+        assert hashed == size
+
     def _process_response(self, download: _FileDownload, resp: Response) -> None:
         """Download and save chunks from a response."""
         chunks = _log_download(
@@ -312,7 +609,8 @@ class Downloader:
         self, download: _FileDownload, original_response: Response
     ) -> None:
         """
-        Manually cache a file that was successfully downloaded via resume retries.
+        Manually cache a file that was successfully downloaded via resume retries
+        or in segments.
 
         cachecontrol doesn't cache 206 (Partial Content) responses, since they
         are not complete files. This method manually adds the final file to the
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 __all__ = ["HTTPRangeRequestUnsupported", "dist_from_wheel_url"]
 
+import json
+import re
 from bisect import bisect_left, bisect_right
 from collections.abc import Generator
 from contextlib import contextmanager
@@ -11,13 +13,26 @@ from tempfile import NamedTemporaryFile
 from typing import Any
 from zipfile import BadZipFile, ZipFile
 
+from pip._vendor.cachecontrol import CacheControlAdapter
 from pip._vendor.packaging.utils import NormalizedName
 from pip._vendor.requests.models import CONTENT_CHUNK_SIZE, Response
 
 from pip._internal.metadata import BaseDistribution, MemoryWheel, get_wheel_distribution
+from pip._internal.network.cache import SafeFileCache, suppressed_cache_errors
 from pip._internal.network.session import PipSession
 from pip._internal.network.utils import HEADERS, raise_for_status, response_chunks
 
+# The size of the first request, made from the end of the file. This is
+# enough for the central directory and the .dist-info files, which are
+# stored last, of most wheels.
+TAIL_SIZE = 128 * 1024
+
+_CONTENT_RANGE_RE = re.compile(r"bytes (\d+)-(\d+)/(\d+)")
+
+# The ETag and Last-Modified headers of a range response, and the length of the
+# whole file, which must be the same for all the ranges of a file.
+_Validator = tuple[str | None, str | None, int]
+
 
 class HTTPRangeRequestUnsupported(Exception):
     pass
@@ -49,22 +64,33 @@ class LazyZipOverHTTP:
     which is supposed to be fed to ZipFile.  If such requests are not
     supported by the server, raise HTTPRangeRequestUnsupported
     during initialization.
+
+    The first request asks for the last tail_size bytes of the file, which
+    usually hold everything needed to read the wheel's metadata. Responses
+    with an ETag or Last-Modified header are stored in the HTTP cache, if the
+    session has one for the URL. A cached range is only used if it has the
+    same validators as the other ranges read, so that the file isn't put
+    together from different versions of it.
     """
 
     def __init__(
-        self, url: str, session: PipSession, chunk_size: int = CONTENT_CHUNK_SIZE
+        self,
+        url: str,
+        session: PipSession,
+        chunk_size: int = CONTENT_CHUNK_SIZE,
+        tail_size: int = TAIL_SIZE,
     ) -> None:
-        head = session.head(url, headers=HEADERS)
-        raise_for_status(head)
-        assert head.status_code == 200
         self._session, self._url, self._chunk_size = session, url, chunk_size
-        self._length = int(head.headers["Content-Length"])
+        self._cache = _get_cache(session, url)
         self._file = NamedTemporaryFile()
-        self.truncate(self._length)
         self._left: list[int] = []
         self._right: list[int] = []
-        if "bytes" not in head.headers.get("Accept-Ranges", "none"):
-            raise HTTPRangeRequestUnsupported("range request is not supported")
+        self._validator: _Validator | None = None
+        try:
+            self._fetch_tail(tail_size)
+        except BaseException:
+            self._file.close()
+            raise
         self._check_zip()
 
     @property
@@ -97,11 +123,14 @@ class LazyZipOverHTTP:
         all bytes until EOF are returned.  Fewer than
         size bytes may be returned if EOF is reached.
         """
-        download_size = max(size, self._chunk_size)
         start, length = self.tell(), self._length
-        stop = length if size < 0 else min(start + download_size, length)
-        start = max(0, stop - download_size)
-        self._download(start, stop - 1)
+        stop = length if size < 0 else min(start + size, length)
+        # Download whole chunks, so that the many small reads made by ZipFile
+        # while opening a member don't each need a request.
+        start -= start % self._chunk_size
+        stop = min(stop - stop % -self._chunk_size, length)
+        if start < stop:
+            self._download(start, stop - 1)
         return self._file.read(size)
 
     def readable(self) -> bool:
@@ -171,20 +200,88 @@ class LazyZipOverHTTP:
                     break
 
     def _stream_response(
-        self, start: int, end: int, base_headers: dict[str, str] = HEADERS
+        self, byte_range: str, base_headers: dict[str, str] = HEADERS
     ) -> Response:
-        """Return HTTP response to a range request from start to end."""
+        """Return HTTP response to a request for byte_range, e.g. 0-99."""
         headers = base_headers.copy()
-        headers["Range"] = f"bytes={start}-{end}"
-        # TODO: Get range requests to be correctly cached
+        headers["Range"] = f"bytes={byte_range}"
+        # Keep CacheControl from answering with a cached response for the
+        # whole file. Range responses are cached by _fetch() instead.
         headers["Cache-Control"] = "no-cache"
         return self._session.get(self._url, headers=headers, stream=True)
 
+    def _fetch(self, byte_range: str) -> tuple[int, int, int]:
+        """Fetch byte_range of the file and write it at its position.
+
+        Return the start and end (inclusive) of the received range, and the
+        length of the whole file.
+        """
+        key = f"{self._url}#range={byte_range}"
+        if self._cache is not None:
+            cached = _get_cached_range(self._cache, key)
+            if cached is not None:
+                content_range, validator, body = cached
+                start, end, length = _parse_content_range(content_range)
+                if len(body) == end - start + 1 and self._validator in (
+                    None,
+                    validator,
+                ):
+                    self._validator = validator
+                    self._write(start, [body])
+                    return start, end, length
+
+        response = self._stream_response(byte_range)
+        raise_for_status(response)
+        content_range = response.headers.get("Content-Range", "")
+        if response.status_code != 206 or not _CONTENT_RANGE_RE.fullmatch(
+            content_range
+        ):
+            response.close()
+            raise HTTPRangeRequestUnsupported("range request is not supported")
+        start, end, length = _parse_content_range(content_range)
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        validator = (etag, last_modified, length)
+        if self._validator is None:
+            self._validator = validator
+        elif validator != self._validator:
+            response.close()
+            raise HTTPRangeRequestUnsupported("file changed while being read")
+        chunks = list(response_chunks(response, self._chunk_size))
+        self._write(start, chunks)
+        # Without validators, a cached range can't be told apart from a range
+        # of another version of the file.
+        if self._cache is not None and (etag or last_modified):
+            metadata = {
+                "content_range": content_range,
+                "etag": etag,
+                "last_modified": last_modified,
+            }
+            with suppressed_cache_errors():
+                self._cache.set(key, json.dumps(metadata).encode())
+                self._cache.set_body(key, b"".join(chunks))
+        return start, end, length
+
+    def _write(self, start: int, chunks: list[bytes]) -> None:
+        with self._stay():
+            self.seek(start)
+            for chunk in chunks:
+                self._file.write(chunk)
+
+    def _fetch_tail(self, tail_size: int) -> None:
+        """Fetch the end of the file, learning its length along the way."""
+        start, end, self._length = self._fetch(f"-{tail_size}")
+        self.truncate(self._length)
+        self._left, self._right = [start], [end]
+
     def _merge(
         self, start: int, end: int, left: int, right: int
     ) -> Generator[tuple[int, int], None, None]:
         """Return a generator of intervals to be fetched.
 
+        Gaps separated by less than a chunk of downloaded data are fetched
+        together, to save a request at the cost of a few bytes.
+
         Args:
             start (int): Start of needed interval
             end (int): End of needed interval
@@ -194,22 +291,69 @@ class LazyZipOverHTTP:
         lslice, rslice = self._left[left:right], self._right[left:right]
         i = start = min([start] + lslice[:1])
         end = max([end] + rslice[-1:])
+        gaps = []
         for j, k in zip(lslice, rslice):
             if j > i:
-                yield i, j - 1
+                gaps.append((i, j - 1))
             i = k + 1
         if i <= end:
-            yield i, end
+            gaps.append((i, end))
         self._left[left:right], self._right[left:right] = [start], [end]
 
+        if not gaps:
+            return
+        gap_start, gap_end = gaps[0]
+        for j, k in gaps[1:]:
+            if j - gap_end - 1 >= self._chunk_size:
+                yield gap_start, gap_end
+                gap_start = j
+            gap_end = k
+        yield gap_start, gap_end
+
     def _download(self, start: int, end: int) -> None:
         """Download bytes from start to end inclusively."""
-        with self._stay():
-            left = bisect_left(self._right, start)
-            right = bisect_right(self._left, end)
-            for start, end in self._merge(start, end, left, right):
-                response = self._stream_response(start, end)
-                response.raise_for_status()
-                self.seek(start)
-                for chunk in response_chunks(response, self._chunk_size):
-                    self._file.write(chunk)
+        left = bisect_left(self._right, start)
+        right = bisect_right(self._left, end)
+        for start, end in self._merge(start, end, left, right):
+            self._fetch(f"{start}-{end}")
+
+
+def _get_cache(session: PipSession, url: str) -> SafeFileCache | None:
+    """Return the HTTP cache the session uses for url, if any."""
+    adapter = session.get_adapter(url)
+    if isinstance(adapter, CacheControlAdapter) and isinstance(
+        adapter.cache, SafeFileCache
+    ):
+        return adapter.cache
+    return None
+
+
+def _get_cached_range(
+    cache: SafeFileCache, key: str
+) -> tuple[str, _Validator, bytes] | None:
+    """Return the Content-Range, validator and body of a cached range."""
+    with suppressed_cache_errors():
+        metadata = cache.get(key)
+        body_file = cache.get_body(key)
+        if metadata is None or body_file is None:
+            return None
+        with body_file:
+            body = body_file.read()
+        try:
+            fields = json.loads(metadata)
+            content_range = fields["content_range"]
+            _, _, length = _parse_content_range(content_range)
+            validator = (fields["etag"], fields["last_modified"], length)
+        except (ValueError, TypeError, KeyError, HTTPRangeRequestUnsupported):
+            return None
+        return content_range, validator, body
+    return None
+
+
+def _parse_content_range(content_range: str) -> tuple[int, int, int]:
+    """Parse a Content-Range header value into its start, end and length."""
+    match = _CONTENT_RANGE_RE.fullmatch(content_range)
+    if match is None:
+        raise HTTPRangeRequestUnsupported(f"invalid Content-Range: {content_range}")
+    start, end, length = (int(group) for group in match.groups())
+    return start, end, length
@@ -38,7 +38,7 @@ from pip._internal.exceptions import SSLMissingError
 from pip._internal.metadata import get_default_environment
 from pip._internal.models.link import Link
 from pip._internal.network.auth import MultiDomainBasicAuth
-from pip._internal.network.cache import SafeFileCache
+from pip._internal.network.cache import SafeFileCache, SingleFileCache
 from pip._internal.network.utils import raise_connection_error
 
 # Import ssl from compat so the initial import occurs in only one place.
@@ -311,16 +311,26 @@ class PipSession(requests.Session):
         *args: Any,
         retries: int = 0,
         resume_retries: int = 0,
+        download_segments: int = 1,
+        segmented_download_threshold: int = 0,
         cache: str | None = None,
         trusted_hosts: Sequence[str] = (),
         index_urls: list[str] | None = None,
         ssl_context: SSLContext | None = None,
         refresh_package: set[str] | None = None,
+        single_file_cache: bool = False,
+        cache_max_size: int | None = None,
         **kwargs: Any,
     ) -> None:
         """
         :param trusted_hosts: Domains not to emit warnings for when not using
             HTTPS.
+        :param download_segments: The number of byte ranges to download at the
+            same time, for files of at least segmented_download_threshold bytes.
+        :param single_file_cache: Store each HTTP cache entry in a single file,
+            see SingleFileCache.
+        :param cache_max_size: The size past which the least recently used
+            entries are removed from a single file HTTP cache.
         """
         super().__init__(*args, **kwargs)
 
@@ -362,6 +372,8 @@ class PipSession(requests.Session):
             backoff_factor=0.25,
         )  # type: ignore
         self.resume_retries = resume_retries
+        self.download_segments = download_segments
+        self.segmented_download_threshold = segmented_download_threshold
 
         # Our Insecure HTTPAdapter disables HTTPS validation. It does not
         # support caching so we'll use it for all http:// URLs.
@@ -377,13 +389,23 @@ class PipSession(requests.Session):
         # require manual eviction from the cache to fix it.
         self._trusted_host_adapter: InsecureCacheControlAdapter | InsecureHTTPAdapter
         if cache:
+            secure_cache: SafeFileCache
+            trusted_host_cache: SafeFileCache
+            if single_file_cache:
+                # Both adapters share the cache, so its size is tracked once.
+                secure_cache = trusted_host_cache = SingleFileCache(
+                    cache, max_size=cache_max_size
+                )
+            else:
+                secure_cache = SafeFileCache(cache)
+                trusted_host_cache = SafeFileCache(cache)
             secure_adapter: _BaseHTTPAdapter = CacheControlAdapter(
-                cache=SafeFileCache(cache),
+                cache=secure_cache,
                 max_retries=retries,
                 ssl_context=ssl_context,
             )
             self._trusted_host_adapter = InsecureCacheControlAdapter(
-                cache=SafeFileCache(cache),
+                cache=trusted_host_cache,
                 max_retries=retries,
             )
         else:
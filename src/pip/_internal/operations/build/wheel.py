@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import os
+from collections.abc import Mapping
 
 from pip._vendor.pyproject_hooks import BuildBackendHookCaller
 
@@ -15,6 +16,7 @@ def build_wheel_pep517(
     backend: BuildBackendHookCaller,
     metadata_directory: str,
     wheel_directory: str,
+    extra_environ: Mapping[str, str] | None = None,
 ) -> str | None:
     """Build one InstallRequirement using the PEP 517 build process.
 
@@ -25,7 +27,7 @@ def build_wheel_pep517(
         logger.debug("Destination directory: %s", wheel_directory)
 
         runner = runner_with_spinner_message(
-            f"Building wheel for {name} (pyproject.toml)"
+            f"Building wheel for {name} (pyproject.toml)", extra_environ
         )
         with backend.subprocess_runner(runner):
             wheel_name = backend.build_wheel(
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import os
+from collections.abc import Mapping
 
 from pip._vendor.pyproject_hooks import BuildBackendHookCaller, HookMissing
 
@@ -15,6 +16,7 @@ def build_wheel_editable(
     backend: BuildBackendHookCaller,
     metadata_directory: str,
     wheel_directory: str,
+    extra_environ: Mapping[str, str] | None = None,
 ) -> str | None:
     """Build one InstallRequirement using the PEP 660 build process.
 
@@ -25,7 +27,7 @@ def build_wheel_editable(
         logger.debug("Destination directory: %s", wheel_directory)
 
         runner = runner_with_spinner_message(
-            f"Building editable for {name} (pyproject.toml)"
+            f"Building editable for {name} (pyproject.toml)", extra_environ
         )
         with backend.subprocess_runner(runner):
             try:
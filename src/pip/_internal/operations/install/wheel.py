@@ -8,6 +8,7 @@ import contextlib
 import csv
 import importlib
 import logging
+import multiprocessing
 import os.path
 import re
 import shutil
@@ -16,11 +17,14 @@ import textwrap
 import warnings
 from base64 import urlsafe_b64encode
 from collections.abc import Callable, Generator, Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from email.message import Message
 from itertools import chain, filterfalse, starmap
 from pathlib import Path
 from typing import (
     IO,
+    TYPE_CHECKING,
     Any,
     BinaryIO,
     NewType,
@@ -42,7 +46,11 @@ from pip._internal.metadata import (
 )
 from pip._internal.models.direct_url import DIRECT_URL_METADATA_NAME, DirectUrl
 from pip._internal.models.scheme import SCHEME_KEYS, Scheme
-from pip._internal.utils.filesystem import adjacent_tmp_file, replace
+from pip._internal.utils.filesystem import (
+    adjacent_tmp_file,
+    clone_or_copy_file,
+    replace,
+)
 from pip._internal.utils.misc import StreamWrapper, ensure_dir, hash_file, partition
 from pip._internal.utils.unpacking import (
     current_umask,
@@ -52,6 +60,9 @@ from pip._internal.utils.unpacking import (
 )
 from pip._internal.utils.wheel import parse_wheel
 
+if TYPE_CHECKING:
+    from pip._internal.cache import UnpackedWheelStore
+
 
 class File(Protocol):
     src_record_path: RecordPath
@@ -378,6 +389,24 @@ class ZipBackedFile:
             set_extracted_file_to_default_mode_plus_executable(self.dest_path)
 
 
+class StoreBackedFile:
+    """A file of a wheel, installed from its unpacked copy in the store."""
+
+    def __init__(
+        self, src_record_path: RecordPath, dest_path: str, store_path: str
+    ) -> None:
+        self.src_record_path = src_record_path
+        self.dest_path = dest_path
+        self._store_path = store_path
+        self.changed = False
+
+    def save(self) -> None:
+        # See ZipBackedFile.save() for why this is unlinked first.
+        if os.path.exists(self.dest_path):
+            os.unlink(self.dest_path)
+        clone_or_copy_file(self._store_path, self.dest_path)
+
+
 class ScriptFile:
     def __init__(self, file: File) -> None:
         self._file = file
@@ -448,6 +477,8 @@ def _install_wheel(  # noqa: C901, PLR0915 function is too long
     direct_url: DirectUrl | None = None,
     requested: bool = False,
     script_executable: str | None = None,
+    bytecode_compiler: BytecodeCompiler | None = None,
+    wheel_store: UnpackedWheelStore | None = None,
 ) -> None:
     """Install a wheel.
 
@@ -460,6 +491,10 @@ def _install_wheel(  # noqa: C901, PLR0915 function is too long
     :param warn_script_location: Whether to check that scripts are installed
         into a directory on PATH
     :param script_executable: Python executable to use for console scripts
+    :param bytecode_compiler: If given, byte-compilation is left to it instead
+        of being done while installing
+    :param wheel_store: If given, the files of the wheel are linked from its
+        unpacked copy in the store, instead of being extracted
     :raises UnsupportedWheel:
         * when the directory holds an unpacked wheel with incompatible
           Wheel-Version
@@ -502,6 +537,16 @@ def _install_wheel(  # noqa: C901, PLR0915 function is too long
                 message.format(wheel_path, target_path, dest_dir_path)
             )
 
+    unpacked_dir = None
+    if wheel_store is not None:
+        unpacked_dir = wheel_store.unpack(wheel_path)
+
+    def make_file(record_path: RecordPath, dest_path: str, zip_file: ZipFile) -> File:
+        if unpacked_dir is not None:
+            store_path = os.path.join(unpacked_dir, os.path.normpath(record_path))
+            return StoreBackedFile(record_path, dest_path, store_path)
+        return ZipBackedFile(record_path, dest_path, zip_file)
+
     def root_scheme_file_maker(
         zip_file: ZipFile, dest: str
     ) -> Callable[[RecordPath], File]:
@@ -509,7 +554,7 @@ def _install_wheel(  # noqa: C901, PLR0915 function is too long
             normed_path = os.path.normpath(record_path)
             dest_path = os.path.join(dest, normed_path)
             assert_no_path_traversal(dest, dest_path)
-            return ZipBackedFile(record_path, dest_path, zip_file)
+            return make_file(record_path, dest_path, zip_file)
 
         return make_root_scheme_file
 
@@ -543,7 +588,7 @@ def _install_wheel(  # noqa: C901, PLR0915 function is too long
 
             dest_path = os.path.join(scheme_path, dest_subpath)
             assert_no_path_traversal(scheme_path, dest_path)
-            return ZipBackedFile(record_path, dest_path, zip_file)
+            return make_file(record_path, dest_path, zip_file)
 
         return make_data_scheme_file
 
@@ -628,23 +673,23 @@ def _install_wheel(  # noqa: C901, PLR0915 function is too long
         """Return the path the pyc file would have been written to."""
         return importlib.util.cache_from_source(path)
 
-    # Compile all of the pyc files for the installed files
-    if pycompile:
-        with contextlib.redirect_stdout(
-            StreamWrapper.from_stream(sys.stdout)
-        ) as stdout:
-            with warnings.catch_warnings():
-                warnings.filterwarnings("ignore")
-                for path in pyc_source_file_paths():
-                    success = compileall.compile_file(path, force=True, quiet=True)
-                    if success:
-                        pyc_path = pyc_output_path(path)
-                        assert os.path.exists(pyc_path)
-                        pyc_record_path = cast(
-                            "RecordPath", pyc_path.replace(os.path.sep, "/")
-                        )
-                        record_installed(pyc_record_path, pyc_path)
-        logger.debug(stdout.getvalue())
+    # Compile all of the pyc files for the installed files, unless the
+    # compilation is deferred to a BytecodeCompiler shared by several wheels
+    if pycompile and bytecode_compiler is None:
+        outputs = []
+        for path in pyc_source_file_paths():
+            success, output = _compile_file(path)
+            outputs.append(output)
+            if success:
+                pyc_path = pyc_output_path(path)
+                assert os.path.exists(pyc_path)
+                pyc_record_path = cast("RecordPath", pyc_path.replace(os.path.sep, "/"))
+                record_installed(pyc_record_path, pyc_path)
+        logger.debug("".join(outputs))
+    elif pycompile:
+        # get_csv_rows_for_installed() consumes `installed`, so collect the
+        # files to compile now.
+        pyc_source_paths = list(pyc_source_file_paths())
 
     maker = PipScriptMaker(None, scheme.scripts)
 
@@ -734,6 +779,107 @@ def _install_wheel(  # noqa: C901, PLR0915 function is too long
         writer = csv.writer(cast("IO[str]", record_file))
         writer.writerows(_normalized_outrows(rows))
 
+    if pycompile and bytecode_compiler is not None:
+        bytecode_compiler.add(record_path, lib_dir, pyc_source_paths)
+
+
+def _compile_file(path: str) -> tuple[bool, str]:
+    """Byte-compile a Python file.
+
+    Return whether it succeeded, and what the compiler printed. This is run in
+    worker processes, so it must remain a picklable module-level function.
+    """
+    with contextlib.redirect_stdout(StreamWrapper.from_stream(sys.stdout)) as stdout:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            success = compileall.compile_file(path, force=True, quiet=True)
+    return bool(success), stdout.getvalue()
+
+
+class BytecodeCompiler:
+    """Byte-compiles the Python files of several installed wheels at once.
+
+    Wheels register their files with ``add()`` as they are installed, and
+    ``compile()`` compiles them all, up to ``jobs`` at a time in worker
+    processes, then adds the compiled files to the RECORD of their wheel.
+    """
+
+    def __init__(self, jobs: int = 1) -> None:
+        self.jobs = jobs
+        # (RECORD path, lib dir, Python source paths) per installed wheel
+        self._pending: list[tuple[str, str, list[str]]] = []
+
+    def add(self, record_path: str, lib_dir: str, source_paths: list[str]) -> None:
+        self._pending.append((record_path, lib_dir, source_paths))
+
+    def compile(self) -> None:
+        pending, self._pending = self._pending, []
+        paths = list(dict.fromkeys(p for _, _, sources in pending for p in sources))
+        if not paths:
+            return
+
+        compiled = {
+            path for path, success in zip(paths, self._compile_files(paths)) if success
+        }
+        for record_path, lib_dir, sources in pending:
+            pyc_paths = []
+            for path in sources:
+                if path in compiled:
+                    pyc_path = importlib.util.cache_from_source(path)
+                    assert os.path.exists(pyc_path)
+                    pyc_paths.append(pyc_path)
+            if pyc_paths:
+                _add_to_record(record_path, lib_dir, pyc_paths)
+
+    def _compile_files(self, paths: list[str]) -> list[bool]:
+        results: Iterable[tuple[bool, str]] | None = None
+        if self.jobs > 1 and len(paths) > 1:
+            chunksize = max(1, len(paths) // (self.jobs * 4))
+            try:
+                # pip may still have threads running (downloads, prefetches)
+                # and forking then could leave a worker stuck on a lock one
+                # of them held, so start the workers from scratch.
+                with ProcessPoolExecutor(
+                    max_workers=self.jobs,
+                    mp_context=multiprocessing.get_context("spawn"),
+                ) as executor:
+                    results = list(
+                        executor.map(_compile_file, paths, chunksize=chunksize)
+                    )
+            except (BrokenProcessPool, NotImplementedError, OSError) as exc:
+                # Some platforms cannot start worker processes at all.
+                logger.debug("Could not compile in worker processes: %s", exc)
+        if results is None:
+            results = map(_compile_file, paths)
+
+        successes = []
+        outputs = []
+        for success, output in results:
+            successes.append(success)
+            outputs.append(output)
+        logger.debug("".join(outputs))
+        return successes
+
+
+def _add_to_record(record_path: str, lib_dir: str, paths: list[str]) -> None:
+    """Add generated files to an installed RECORD, keeping it sorted."""
+    with open(record_path, **csv_io_kwargs("r")) as record_file:
+        rows: list[InstalledCSVRow] = [
+            (cast("RecordPath", path), digest, size)
+            for path, digest, size in csv.reader(record_file)
+        ]
+    recorded = {row[0] for row in rows}
+    for path in paths:
+        record_path_entry = _fs_to_record_path(path, lib_dir)
+        if record_path_entry not in recorded:
+            rows.append((record_path_entry, "", ""))
+
+    with adjacent_tmp_file(record_path, **csv_io_kwargs("w")) as record_file:
+        writer = csv.writer(cast("IO[str]", record_file))
+        writer.writerows(_normalized_outrows(rows))
+    os.chmod(record_file.name, 0o666 & ~current_umask())
+    replace(record_file.name, record_path)
+
 
 @contextlib.contextmanager
 def req_error_context(req_description: str) -> Generator[None, None, None]:
@@ -754,6 +900,8 @@ def install_wheel(
     direct_url: DirectUrl | None = None,
     requested: bool = False,
     script_executable: str | None = None,
+    bytecode_compiler: BytecodeCompiler | None = None,
+    wheel_store: UnpackedWheelStore | None = None,
 ) -> None:
     with ZipFile(wheel_path, allowZip64=True) as z:
         with req_error_context(req_description):
@@ -767,4 +915,6 @@ def install_wheel(
                 direct_url=direct_url,
                 requested=requested,
                 script_executable=script_executable,
+                bytecode_compiler=bytecode_compiler,
+                wheel_store=wheel_store,
             )
@@ -8,6 +8,7 @@ import mimetypes
 import os
 import shutil
 from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -16,6 +17,7 @@ from pip._vendor.packaging.requirements import InvalidRequirement
 from pip._vendor.packaging.utils import canonicalize_name
 
 from pip._internal.build_env import BuildEnvironmentInstaller, BuildIsolationMode
+from pip._internal.cache import FileHashCache, MetadataCache
 from pip._internal.distributions import make_distribution_for_install_requirement
 from pip._internal.distributions.installed import InstalledDistribution
 from pip._internal.exceptions import (
@@ -33,13 +35,14 @@ from pip._internal.index.package_finder import PackageFinder
 from pip._internal.metadata import BaseDistribution, get_metadata_distribution
 from pip._internal.models.direct_url import ArchiveInfo, DirectUrl
 from pip._internal.models.link import Link, join_within_directory
-from pip._internal.models.wheel import Wheel
+from pip._internal.models.wheel import get_wheel
 from pip._internal.network.download import Downloader
 from pip._internal.network.lazy_wheel import (
     HTTPRangeRequestUnsupported,
     dist_from_wheel_url,
 )
 from pip._internal.network.session import PipSession
+from pip._internal.network.utils import raise_for_status
 from pip._internal.operations.build.build_tracker import BuildTracker
 from pip._internal.req.req_install import InstallRequirement
 from pip._internal.utils._log import getLogger
@@ -65,6 +68,9 @@ if TYPE_CHECKING:
 
 logger = getLogger(__name__)
 
+# The number of metadata files fetched at the same time when prefetching.
+_PREFETCH_METADATA_WORKERS = 4
+
 
 def _get_prepared_distribution(
     req: InstallRequirement,
@@ -111,33 +117,40 @@ def get_http_url(
     download: Downloader,
     download_dir: str | None = None,
     hashes: Hashes | None = None,
+    file_hash_cache: FileHashCache | None = None,
 ) -> File:
     temp_dir = TempDirectory(kind="unpack", globally_managed=True)
     # If a download dir is specified, is the file already downloaded there?
     already_downloaded_path = None
     if download_dir:
-        already_downloaded_path = _check_download_dir(link, download_dir, hashes)
+        already_downloaded_path = _check_download_dir(
+            link, download_dir, hashes, file_hash_cache=file_hash_cache
+        )
 
     if already_downloaded_path:
         from_path = already_downloaded_path
         content_type = None
     else:
         # let's download to a tmp dir
-        from_path, content_type = download(link, temp_dir.path)
-        if hashes:
-            hashes.check_against_path(from_path)
+        # The hashes are checked as the file is downloaded.
+        from_path, content_type = download(link, temp_dir.path, hashes)
 
     return File(from_path, content_type)
 
 
 def get_file_url(
-    link: Link, download_dir: str | None = None, hashes: Hashes | None = None
+    link: Link,
+    download_dir: str | None = None,
+    hashes: Hashes | None = None,
+    file_hash_cache: FileHashCache | None = None,
 ) -> File:
     """Get file and optionally check its hash."""
     # If a download dir is specified, is the file already there and valid?
     already_downloaded_path = None
     if download_dir:
-        already_downloaded_path = _check_download_dir(link, download_dir, hashes)
+        already_downloaded_path = _check_download_dir(
+            link, download_dir, hashes, file_hash_cache=file_hash_cache
+        )
 
     if already_downloaded_path:
         from_path = already_downloaded_path
@@ -150,7 +163,7 @@ def get_file_url(
     # hash in `hashes` matching: a URL-based or an option-based
     # one; no internet-sourced hash will be in `hashes`.
     if hashes:
-        hashes.check_against_path(from_path)
+        _check_hashes(hashes, from_path, file_hash_cache)
     return File(from_path, None)
 
 
@@ -161,6 +174,7 @@ def unpack_url(
     verbosity: int,
     download_dir: str | None = None,
     hashes: Hashes | None = None,
+    file_hash_cache: FileHashCache | None = None,
 ) -> File | None:
     """Unpack link into location, downloading if required.
 
@@ -168,6 +182,8 @@ def unpack_url(
         or HashMismatch will be raised. If the Hashes is empty, no matches are
         required, and unhashable types of requirements (like VCS ones, which
         would ordinarily raise HashUnsupported) are allowed.
+    :param file_hash_cache: Where the hashes of local files are recorded, so
+        that unchanged files aren't hashed again.
     """
     # non-editable vcs urls
     if link.is_vcs:
@@ -178,7 +194,9 @@ def unpack_url(
 
     # file urls
     if link.is_file:
-        file = get_file_url(link, download_dir, hashes=hashes)
+        file = get_file_url(
+            link, download_dir, hashes=hashes, file_hash_cache=file_hash_cache
+        )
 
     # http urls
     else:
@@ -187,6 +205,7 @@ def unpack_url(
             download,
             download_dir,
             hashes=hashes,
+            file_hash_cache=file_hash_cache,
         )
 
     # unpack the archive to the build dir location. even when only downloading
@@ -197,11 +216,21 @@ def unpack_url(
     return file
 
 
+def _check_hashes(
+    hashes: Hashes, path: str, file_hash_cache: FileHashCache | None
+) -> None:
+    if file_hash_cache is None:
+        hashes.check_against_path(path)
+    else:
+        file_hash_cache.check_against_path(hashes, path)
+
+
 def _check_download_dir(
     link: Link,
     download_dir: str,
     hashes: Hashes | None,
     warn_on_hash_mismatch: bool = True,
+    file_hash_cache: FileHashCache | None = None,
 ) -> str | None:
     """Check download_dir for previously downloaded file with correct hash
     If a correct file is found return its path else None
@@ -215,7 +244,7 @@ def _check_download_dir(
     logger.info("File was already downloaded %s", download_path)
     if hashes:
         try:
-            hashes.check_against_path(download_path)
+            _check_hashes(hashes, download_path, file_hash_cache)
         except HashMismatch:
             if warn_on_hash_mismatch:
                 logger.warning(
@@ -354,11 +383,15 @@ class RequirementPreparer:
         build_tracker: BuildTracker,
         session: PipSession,
         progress_bar: BarType,
+        download_concurrency: int = 1,
         finder: PackageFinder,
         require_hashes: bool,
         use_user_site: bool,
         lazy_wheel: bool,
         verbosity: int,
+        prefetch_metadata: bool = False,
+        metadata_cache: MetadataCache | None = None,
+        file_hash_cache: FileHashCache | None = None,
         legacy_resolver: bool,
         allow_editables: bool,
     ) -> None:
@@ -368,7 +401,9 @@ class RequirementPreparer:
         self.build_dir = build_dir
         self.build_tracker = build_tracker
         self._session = session
-        self._download = Downloader(session, progress_bar)
+        self._download = Downloader(
+            session, progress_bar, concurrency=download_concurrency
+        )
         self.finder = finder
 
         # Where still-packed archives should be written to. If None, they are
@@ -391,6 +426,18 @@ class RequirementPreparer:
         # Should wheels be downloaded lazily?
         self.use_lazy_wheel = lazy_wheel
 
+        # Should metadata files be fetched ahead of the resolver needing them?
+        self.prefetch_metadata = prefetch_metadata
+        self._prefetch_executor: ThreadPoolExecutor | None = None
+        # Metadata files being prefetched, by URL, until they are asked for.
+        self._prefetched_metadata: dict[str, Future[bytes]] = {}
+
+        # Where is the metadata of previously seen distributions kept?
+        self.metadata_cache = metadata_cache
+
+        # Where are the hashes of local files recorded, if they can be trusted?
+        self.file_hash_cache = file_hash_cache
+
         # How verbose should underlying tooling be?
         self.verbosity = verbosity
 
@@ -399,6 +446,8 @@ class RequirementPreparer:
 
         # Memoized downloaded files, as mapping of url: path.
         self._downloaded: dict[str, str] = {}
+        # The hashes the memoized files were already checked against, by url.
+        self._downloaded_hashes: dict[str, Hashes] = {}
 
         # Previous "header" printed for a link-based InstallRequirement
         self._previous_requirement_header = ("", "")
@@ -503,10 +552,39 @@ class RequirementPreparer:
                 "Metadata-only fetching is not used as hash checking is required",
             )
             return None
-        # Try PEP 658 metadata first, then fall back to lazy wheel if unavailable.
-        return self._fetch_metadata_using_link_data_attr(
-            req
-        ) or self._fetch_metadata_using_lazy_wheel(req.link)
+        # Try the metadata cache first, as it does not need the network. Then
+        # PEP 658 metadata, and fall back to lazy wheel if unavailable.
+        return (
+            self._fetch_metadata_using_cache(req)
+            or self._fetch_metadata_using_link_data_attr(req)
+            or self._fetch_metadata_using_lazy_wheel(req.link)
+        )
+
+    def _fetch_metadata_using_cache(
+        self,
+        req: InstallRequirement,
+    ) -> BaseDistribution | None:
+        """Fetch metadata recorded for the same file by an earlier run."""
+        if self.metadata_cache is None:
+            return None
+        metadata_contents = self.metadata_cache.get(req.link)
+        if metadata_contents is None:
+            return None
+        assert req.req is not None
+        logger.verbose(
+            "Using cached dependency information for %s from %s",
+            req.req,
+            req.link.filename,
+        )
+        return get_metadata_distribution(
+            metadata_contents,
+            req.link.filename,
+            req.req.name,
+        )
+
+    def _save_metadata_to_cache(self, link: Link, metadata_contents: bytes) -> None:
+        if self.metadata_cache is not None:
+            self.metadata_cache.set(link, metadata_contents)
 
     def _fetch_metadata_using_link_data_attr(
         self,
@@ -524,13 +602,15 @@ class RequirementPreparer:
             metadata_link,
         )
         # (2) Download the contents of the METADATA file, separate from the dist itself.
-        metadata_file = get_http_url(
-            metadata_link,
-            self._download,
-            hashes=metadata_link.as_hashes(),
-        )
-        with open(metadata_file.path, "rb") as f:
-            metadata_contents = f.read()
+        metadata_contents = self._take_prefetched_metadata(metadata_link)
+        if metadata_contents is None:
+            metadata_file = get_http_url(
+                metadata_link,
+                self._download,
+                hashes=metadata_link.as_hashes(),
+            )
+            with open(metadata_file.path, "rb") as f:
+                metadata_contents = f.read()
         # (3) Generate a dist just from those file contents.
         metadata_dist = get_metadata_distribution(
             metadata_contents,
@@ -547,8 +627,66 @@ class RequirementPreparer:
             raise MetadataInconsistent(
                 req, "Name", req.req.name, metadata_dist.raw_name
             )
+        self._save_metadata_to_cache(req.link, metadata_contents)
         return metadata_dist
 
+    def prefetch_metadata_files(self, links: Iterable[Link]) -> None:
+        """Start downloading the metadata files of the given links in the
+        background, in case the resolver needs their dependencies later.
+
+        This is purely speculative, so only the metadata files served
+        alongside remote distributions (PEP 658) are considered. Those
+        distributions are otherwise prepared as usual when asked for.
+        """
+        if not self.prefetch_metadata or self.legacy_resolver or self.require_hashes:
+            return
+        for link in links:
+            if link.is_file:
+                continue
+            metadata_link = link.metadata_link()
+            if metadata_link is None or metadata_link.url in self._prefetched_metadata:
+                continue
+            if self._prefetch_executor is None:
+                self._prefetch_executor = ThreadPoolExecutor(
+                    max_workers=_PREFETCH_METADATA_WORKERS,
+                    thread_name_prefix="pip-prefetch-metadata",
+                )
+            self._prefetched_metadata[metadata_link.url] = (
+                self._prefetch_executor.submit(
+                    self._download_metadata_file, metadata_link
+                )
+            )
+
+    def cancel_prefetch(self) -> None:
+        """Stop prefetching, discarding the metadata files not fetched yet."""
+        if self._prefetch_executor is None:
+            return
+        self._prefetch_executor.shutdown(wait=False, cancel_futures=True)
+        self._prefetch_executor = None
+        for url, future in list(self._prefetched_metadata.items()):
+            if future.cancelled():
+                del self._prefetched_metadata[url]
+
+    def _download_metadata_file(self, metadata_link: Link) -> bytes:
+        resp = self._session.get(metadata_link.url_without_fragment)
+        raise_for_status(resp)
+        hashes = metadata_link.as_hashes()
+        if hashes:
+            hashes.check_against_chunks([resp.content])
+        return resp.content
+
+    def _take_prefetched_metadata(self, metadata_link: Link) -> bytes | None:
+        """Return the contents of a prefetched metadata file, if available."""
+        future = self._prefetched_metadata.pop(metadata_link.url, None)
+        if future is None or future.cancelled():
+            return None
+        try:
+            return future.result()
+        except Exception:
+            # Let the regular code path retry and report the error, if any.
+            logger.debug("Prefetching %s failed", metadata_link, exc_info=True)
+            return None
+
     def _fetch_metadata_using_lazy_wheel(
         self,
         link: Link,
@@ -564,7 +702,7 @@ class RequirementPreparer:
             )
             return None
 
-        wheel = Wheel(link.filename)
+        wheel = get_wheel(link.filename)
         name = wheel.name
         logger.info(
             "Obtaining dependency information from %s %s",
@@ -573,10 +711,12 @@ class RequirementPreparer:
         )
         url = link.url.split("#", 1)[0]
         try:
-            return dist_from_wheel_url(name, url, self._session)
+            dist = dist_from_wheel_url(name, url, self._session)
         except HTTPRangeRequestUnsupported:
             logger.debug("%s does not support range requests", url)
             return None
+        self._save_metadata_to_cache(link, dist.read_text("METADATA").encode())
+        return dist
 
     def _complete_partial_requirements(
         self,
@@ -592,11 +732,15 @@ class RequirementPreparer:
         # `req.local_file_path` on the appropriate requirement after passing
         # all the links at once into BatchDownloader.
         links_to_fully_download: dict[Link, InstallRequirement] = {}
+        links_hashes: dict[Link, Hashes] = {}
         for req in partially_downloaded_reqs:
             assert req.link
             links_to_fully_download[req.link] = req
+            links_hashes[req.link] = self._get_linked_req_hashes(req)
 
-        batch_download = self._download.batch(links_to_fully_download.keys(), temp_dir)
+        batch_download = self._download.batch(
+            links_to_fully_download.keys(), temp_dir, links_hashes
+        )
         for link, (filepath, _) in batch_download:
             logger.debug("Downloading link %s to %s", link, filepath)
             req = links_to_fully_download[link]
@@ -604,8 +748,9 @@ class RequirementPreparer:
             # in .get_dist().
             req.local_file_path = filepath
             # Record that the file is downloaded so we don't do it again in
-            # _prepare_linked_requirement().
+            # _prepare_linked_requirement(), nor check its hashes again.
             self._downloaded[req.link.url] = filepath
+            self._downloaded_hashes[req.link.url] = links_hashes[link]
 
             # If this is an sdist, we need to unpack it after downloading, but the
             # .source_dir won't be set up until we are in _prepare_linked_requirement().
@@ -642,11 +787,13 @@ class RequirementPreparer:
                     # downloaded file will be removed and re-fetched from cache (which
                     # implies a hash check against the cache entry's origin.json).
                     warn_on_hash_mismatch=not req.is_wheel_from_cache,
+                    file_hash_cache=self.file_hash_cache,
                 )
 
             if file_path is not None:
                 # The file is already available, so mark it as downloaded
                 self._downloaded[req.link.url] = file_path
+                self._downloaded_hashes[req.link.url] = hashes
             else:
                 # The file is not available, attempt to fetch only metadata
                 metadata_dist = self._fetch_metadata_only(req)
@@ -672,9 +819,15 @@ class RequirementPreparer:
             # Determine if any of these requirements were already downloaded.
             if self.download_dir is not None and req.link.is_wheel:
                 hashes = self._get_linked_req_hashes(req)
-                file_path = _check_download_dir(req.link, self.download_dir, hashes)
+                file_path = _check_download_dir(
+                    req.link,
+                    self.download_dir,
+                    hashes,
+                    file_hash_cache=self.file_hash_cache,
+                )
                 if file_path is not None:
                     self._downloaded[req.link.url] = file_path
+                    self._downloaded_hashes[req.link.url] = hashes
                     req.needs_more_preparation = False
 
         # Prepare requirements we found were already downloaded for some
@@ -739,6 +892,7 @@ class RequirementPreparer:
                     self.verbosity,
                     self.download_dir,
                     hashes,
+                    self.file_hash_cache,
                 )
             except NetworkConnectionError as exc:
                 raise InstallationError(
@@ -747,8 +901,8 @@ class RequirementPreparer:
                 )
         else:
             file_path = self._downloaded[link.url]
-            if hashes:
-                hashes.check_against_path(file_path)
+            if hashes and self._downloaded_hashes.get(link.url) != hashes:
+                _check_hashes(hashes, file_path, self.file_hash_cache)
             local_file = File(file_path, content_type=None)
 
         # If download_info is set, we got it from the wheel cache.
@@ -766,7 +920,11 @@ class RequirementPreparer:
                 and not req.download_info.archive_info.hashes
                 and local_file
             ):
-                hash = hash_file(local_file.path)[0].hexdigest()
+                if link.is_file and self.file_hash_cache is not None:
+                    # Only files which stay around are worth recording.
+                    hash = self.file_hash_cache.sha256(local_file.path)
+                else:
+                    hash = hash_file(local_file.path)[0].hexdigest()
                 # We populate archive_info.hashes. For backward compatibility,
                 # the legacy hash field will be generated when converting to JSON.
                 req.download_info = DirectUrl(
@@ -809,6 +967,9 @@ class RequirementPreparer:
         ):
             _check_sidecar_matches_wheel(req, req._distribution, dist)
 
+        if link.is_wheel:
+            self._save_metadata_to_cache(link, dist.read_text("METADATA").encode())
+
         return dist
 
     def save_linked_requirement(self, req: InstallRequirement) -> None:
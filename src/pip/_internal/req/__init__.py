@@ -3,15 +3,25 @@ from __future__ import annotations
 import collections
 import logging
 from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
 
 from pip._internal.cli.progress_bars import BarType, get_install_progress_renderer
-from pip._internal.utils.logging import indent_log
+from pip._internal.utils.logging import (
+    DeferredRecord,
+    defer_logging,
+    indent_log,
+    replay_logging,
+)
 
 from .req_file import parse_requirements
 from .req_install import InstallRequirement
 from .req_set import RequirementSet
 
+if TYPE_CHECKING:
+    from pip._internal.cache import UnpackedWheelStore
+
 __all__ = [
     "RequirementSet",
     "InstallRequirement",
@@ -35,6 +45,78 @@ def _validate_requirements(
         yield req.name, req
 
 
+def _install_one(
+    requirement: InstallRequirement, install_options: dict[str, Any]
+) -> None:
+    """Install a requirement, replacing any installed version of it.
+
+    If the installation fails, the uninstalled version is restored.
+    """
+    if requirement.should_reinstall:
+        logger.info("Attempting uninstall: %s", requirement.name)
+        with indent_log():
+            uninstalled_pathset = requirement.uninstall(auto_confirm=True)
+    else:
+        uninstalled_pathset = None
+
+    try:
+        requirement.install(**install_options)
+    except Exception:
+        # if install did not succeed, rollback previous uninstall
+        if uninstalled_pathset and not requirement.install_succeeded:
+            uninstalled_pathset.rollback()
+        raise
+    else:
+        if uninstalled_pathset and requirement.install_succeeded:
+            uninstalled_pathset.commit()
+
+
+def _install_one_deferring_logs(
+    records: list[DeferredRecord],
+    requirement: InstallRequirement,
+    install_options: dict[str, Any],
+) -> None:
+    """Install a requirement, holding its logs back in records."""
+    with defer_logging(records):
+        _install_one(requirement, install_options)
+
+
+def _install_levels(
+    levels: list[list[InstallRequirement]],
+    install_options: dict[str, Any],
+    jobs: int,
+) -> Generator[InstallRequirement, None, None]:
+    """Install the requirements of each level up to jobs at a time.
+
+    A level is only started once the previous one is fully installed. The
+    requirements are yielded in order once installed, after their logs.
+    """
+    executor = ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="pip-install")
+    try:
+        for level in levels:
+            installs = []
+            for requirement in level:
+                records: list[DeferredRecord] = []
+                future = executor.submit(
+                    _install_one_deferring_logs, records, requirement, install_options
+                )
+                installs.append((requirement, records, future))
+            # Wait for the whole level, so that every failed installation has
+            # rolled back its uninstall before the first failure is raised.
+            error = None
+            for requirement, records, future in installs:
+                exc = future.exception()
+                replay_logging(records)
+                if exc is None:
+                    yield requirement
+                elif error is None:
+                    error = exc
+            if error is not None:
+                raise error
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
 def install_given_reqs(
     requirements: list[InstallRequirement],
     root: str | None,
@@ -45,12 +127,30 @@ def install_given_reqs(
     pycompile: bool,
     progress_bar: BarType,
     script_executable: str | None = None,
+    compile_jobs: int = 1,
+    levels: list[list[InstallRequirement]] | None = None,
+    install_jobs: int = 1,
+    wheel_store: UnpackedWheelStore | None = None,
 ) -> list[InstallationResult]:
     """
     Install everything in the given list.
 
     (to be called after having downloaded and unpacked the packages)
+
+    Byte-compilation is left until everything is installed, or an
+    installation failed, and then done for all the packages installed
+    together, in up to ``compile_jobs`` processes.
+
+    If ``levels`` splits the requirements into groups that do not depend on
+    each other, as ``BaseResolver.get_installation_levels()`` does, the
+    requirements of each group are installed up to ``install_jobs`` at a time.
+
+    If ``wheel_store`` is given, wheels are installed from their unpacked copy
+    in it, see ``UnpackedWheelStore``.
     """
+    # Lazy import, see InstallRequirement.install().
+    from pip._internal.operations.install.wheel import BytecodeCompiler
+
     to_install = collections.OrderedDict(_validate_requirements(requirements))
 
     if to_install:
@@ -61,45 +161,45 @@ def install_given_reqs(
 
     installed = []
 
-    show_progress = logger.isEnabledFor(logging.INFO) and len(to_install) > 1
-
+    bytecode_compiler = BytecodeCompiler(jobs=compile_jobs)
+    install_options: dict[str, Any] = {
+        "root": root,
+        "home": home,
+        "prefix": prefix,
+        "warn_script_location": warn_script_location,
+        "use_user_site": use_user_site,
+        "pycompile": pycompile,
+        "script_executable": script_executable,
+        "bytecode_compiler": bytecode_compiler,
+        "wheel_store": wheel_store,
+    }
+
+    concurrent = levels is not None and install_jobs > 1
     items = iter(to_install.values())
+    if concurrent:
+        assert levels is not None
+        logger.debug("Installing up to %d packages at a time", install_jobs)
+        items = _install_levels(levels, install_options, install_jobs)
+
+    show_progress = logger.isEnabledFor(logging.INFO) and len(to_install) > 1
     if show_progress:
         renderer = get_install_progress_renderer(
             bar_type=progress_bar, total=len(to_install)
         )
         items = renderer(items)
 
-    with indent_log():
-        for requirement in items:
-            req_name = requirement.name
-            assert req_name is not None
-            if requirement.should_reinstall:
-                logger.info("Attempting uninstall: %s", req_name)
-                with indent_log():
-                    uninstalled_pathset = requirement.uninstall(auto_confirm=True)
-            else:
-                uninstalled_pathset = None
-
-            try:
-                requirement.install(
-                    root=root,
-                    home=home,
-                    prefix=prefix,
-                    warn_script_location=warn_script_location,
-                    use_user_site=use_user_site,
-                    pycompile=pycompile,
-                    script_executable=script_executable,
-                )
-            except Exception:
-                # if install did not succeed, rollback previous uninstall
-                if uninstalled_pathset and not requirement.install_succeeded:
-                    uninstalled_pathset.rollback()
-                raise
-            else:
-                if uninstalled_pathset and requirement.install_succeeded:
-                    uninstalled_pathset.commit()
-
-            installed.append(InstallationResult(req_name))
+    try:
+        with indent_log():
+            for requirement in items:
+                assert requirement.name is not None
+                if not concurrent:
+                    _install_one(requirement, install_options)
+                installed.append(InstallationResult(requirement.name))
+    finally:
+        # Even if an installation failed, the packages installed before it
+        # stay installed, so they get their bytecode too.
+        if pycompile:
+            logger.debug("Compiling Python files to bytecode")
+            bytecode_compiler.compile()
 
     return installed
@@ -18,3 +18,13 @@ class BaseResolver:
         self, req_set: RequirementSet
     ) -> list[InstallRequirement]:
         raise NotImplementedError()
+
+    def get_installation_levels(
+        self, req_set: RequirementSet
+    ) -> list[list[InstallRequirement]]:
+        """Split the installation order into levels of requirements that can
+        be installed at the same time.
+
+        By default, every requirement is in a level of its own.
+        """
+        return [[req] for req in self.get_installation_order(req_set)]
@@ -19,7 +19,7 @@ from pip._internal.exceptions import (
 )
 from pip._internal.metadata import BaseDistribution
 from pip._internal.models.link import Link, links_equivalent
-from pip._internal.models.wheel import Wheel
+from pip._internal.models.wheel import get_wheel
 from pip._internal.req.constructors import (
     install_req_from_editable,
     install_req_from_line,
@@ -298,7 +298,7 @@ class LinkCandidate(_InstallRequirementBackedCandidate):
         ireq = make_install_req_from_link(link, template, version=version)
         assert ireq.link == link
         if ireq.link.is_wheel and not ireq.link.is_file:
-            wheel = Wheel(ireq.link.filename)
+            wheel = get_wheel(ireq.link.filename)
             wheel_name = wheel.name
             assert name == wheel_name, f"{name!r} != {wheel_name!r} for wheel"
             # Version may not be present for PEP 508 direct URLs
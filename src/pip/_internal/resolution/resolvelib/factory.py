@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import collections
 import contextlib
 import copy
 import functools
+import itertools
 import logging
+import urllib.parse
 from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 from typing import (
     TYPE_CHECKING,
+    Any,
     NamedTuple,
     Protocol,
     TypeVar,
@@ -30,10 +34,12 @@ from pip._internal.exceptions import (
     UnsupportedPythonVersion,
     UnsupportedWheel,
 )
+from pip._internal.index.collector import link_from_json, link_to_json
 from pip._internal.index.package_finder import PackageFinder
 from pip._internal.metadata import BaseDistribution, get_default_environment
+from pip._internal.models.candidate import InstallationCandidate
 from pip._internal.models.link import Link
-from pip._internal.models.wheel import Wheel
+from pip._internal.models.wheel import get_wheel
 from pip._internal.operations.prepare import RequirementPreparer
 from pip._internal.req.constructors import (
     install_req_drop_extras,
@@ -80,6 +86,10 @@ logger = logging.getLogger(__name__)
 C = TypeVar("C")
 Cache = dict[Link, C]
 
+# How many candidates of a project to prefetch metadata for, ahead of the
+# resolver asking for them.
+_PREFETCH_METADATA_LOOKAHEAD = 2
+
 
 class CollectedRootRequirements(NamedTuple):
     requirements: list[Requirement]
@@ -131,10 +141,66 @@ class Factory:
     def force_reinstall(self) -> bool:
         return self._force_reinstall
 
+    def prefetch_index_pages(self, requirements: Iterable[Requirement]) -> None:
+        """Start fetching the index pages of the projects named by the given
+        requirements, ahead of the resolver looking for their candidates.
+        """
+        for req in requirements:
+            if isinstance(req, SpecifierRequirement):
+                self._finder.prefetch_index_pages(req.project_name)
+
+    def prefetch_top_candidates(self, requirements: Iterable[Requirement]) -> None:
+        """Start fetching the metadata files of the most preferred candidates
+        of the projects named by the given requirements.
+
+        The resolver builds the top candidate of a project as soon as it
+        sees a requirement on it, one project after the other, so this lets
+        their metadata files download at the same time instead.
+        """
+        if not self.preparer.prefetch_metadata:
+            return
+        requirements = [
+            req for req in requirements if isinstance(req, SpecifierRequirement)
+        ]
+        self.prefetch_index_pages(requirements)
+        for req in requirements:
+            _, ireq = req.get_candidate_lookup()
+            assert ireq is not None and ireq.req is not None
+            if not self._force_reinstall and req.project_name in self._installed_dists:
+                # The installed version is likely to be used.
+                continue
+            result = self._finder.find_best_candidate(
+                project_name=req.project_name,
+                specifier=ireq.req.specifier,
+                hashes=ireq.hashes(trust_internet=False),
+            )
+            self._prefetch_metadata(
+                itertools.islice(
+                    (
+                        ican
+                        for ican in result.iter_applicable()
+                        if not ican.link.is_yanked
+                    ),
+                    _PREFETCH_METADATA_LOOKAHEAD,
+                )
+            )
+
+    def _prefetch_metadata(self, icans: Iterable[InstallationCandidate]) -> None:
+        self.preparer.prefetch_metadata_files(
+            ican.link
+            for ican in icans
+            if ican.link not in self._link_candidate_cache
+            and ican.link not in self._build_failures
+        )
+
+    def cancel_prefetch(self) -> None:
+        self._finder.cancel_prefetch()
+        self.preparer.cancel_prefetch()
+
     def _fail_if_link_is_unsupported_wheel(self, link: Link) -> None:
         if not link.is_wheel:
             return
-        wheel = Wheel(link.filename)
+        wheel = get_wheel(link.filename)
         if wheel.supported(self._finder.target_python.get_unsorted_tags()):
             return
         msg = f"{link.filename} is not a supported wheel on this platform."
@@ -314,12 +380,12 @@ class Factory:
                 specifier=specifier,
                 hashes=hashes,
             )
-            icans = result.applicable_candidates
 
             # PEP 592: Yanked releases are ignored unless the specifier
             # explicitly pins a version (via '==' or '===') that can be
-            # solely satisfied by a yanked release.
-            all_yanked = all(ican.link.is_yanked for ican in icans)
+            # solely satisfied by a yanked release. Yanked candidates are
+            # ranked last, so this stops at the first non-yanked one.
+            all_yanked = all(ican.link.is_yanked for ican in result.iter_applicable())
 
             def is_pinned(specifier: SpecifierSet) -> bool:
                 for sp in specifier:
@@ -334,10 +400,27 @@ class Factory:
 
             pinned = is_pinned(specifier)
 
-            # PackageFinder returns earlier versions first, so we reverse.
-            for ican in reversed(icans):
-                if not (all_yanked and pinned) and ican.link.is_yanked:
-                    continue
+            # The candidates are ranked lazily, most preferred first, so
+            # that only the versions the resolver gets to are ranked.
+            icans = (
+                ican
+                for ican in result.iter_applicable()
+                if (all_yanked and pinned) or not ican.link.is_yanked
+            )
+            upcoming: collections.deque[InstallationCandidate] = collections.deque()
+            while True:
+                upcoming.extend(
+                    itertools.islice(
+                        icans, _PREFETCH_METADATA_LOOKAHEAD + 1 - len(upcoming)
+                    )
+                )
+                if not upcoming:
+                    break
+                # Get the metadata of this candidate and the next few going in
+                # the background, before this one is built, in case the
+                # resolver ends up rejecting it.
+                self._prefetch_metadata(upcoming)
+                ican = upcoming.popleft()
                 func = functools.partial(
                     self._make_candidate_from_link,
                     link=ican.link,
@@ -634,6 +717,100 @@ class Factory:
             supported_tags=self._supported_tags_cache,
         )
 
+    def get_installed_versions(self) -> dict[str, str]:
+        """Return the versions of the installed distributions taken into
+        account, by name.
+        """
+        return {
+            name: dist.raw_version
+            for name, dist in sorted(self._installed_dists.items())
+        }
+
+    def pin_candidate(self, candidate: Candidate) -> dict[str, Any] | None:
+        """Describe a candidate so that make_candidate_from_pin() can make it
+        again later, in a form that can be serialized to JSON.
+
+        Return None if the candidate can't be made again from a description,
+        e.g. because it is editable.
+        """
+        if isinstance(candidate, RequiresPythonCandidate):
+            return {"kind": "python"}
+        if isinstance(candidate, ExtrasCandidate):
+            return {
+                "kind": "extras",
+                "base": candidate.base.name,
+                "extras": sorted(candidate.extras),
+            }
+        if isinstance(candidate, AlreadyInstalledCandidate):
+            return {
+                "kind": "installed",
+                "name": candidate.name,
+                "version": str(candidate.version),
+            }
+        if not isinstance(candidate, LinkCandidate):
+            return None
+        ireq = candidate.get_install_requirement()
+        link = candidate.source_link
+        if ireq is None or ireq.req is None or link is None:
+            return None
+        # Don't write credentials to the cache.
+        if "@" in urllib.parse.urlsplit(link.url).netloc:
+            return None
+        comes_from = ireq.comes_from
+        if isinstance(comes_from, InstallRequirement):
+            comes_from = comes_from.from_path()
+        return {
+            "kind": "link",
+            "name": candidate.name,
+            "version": str(candidate.version),
+            "link": link_to_json(link),
+            "page": link.comes_from if isinstance(link.comes_from, str) else None,
+            "req": str(ireq.req),
+            "user_supplied": ireq.user_supplied,
+            "comes_from": comes_from,
+        }
+
+    def make_candidate_from_pin(
+        self,
+        pin: Mapping[str, Any],
+        pinned: Mapping[str, Candidate],
+        root_ireqs: Mapping[NormalizedName, InstallRequirement],
+    ) -> Candidate | None:
+        """Make a candidate described by pin_candidate() again.
+
+        Return None if the candidate is no longer available, e.g. because the
+        installed distribution it describes was removed.
+
+        :param pinned: The candidates made so far, by identifier. The base
+            candidate of candidates with extras must be among them.
+        :param root_ireqs: The requirements given by the user, by project name.
+        """
+        if pin["kind"] == "python":
+            return self._python_candidate
+        if pin["kind"] == "extras":
+            base = pinned.get(pin["base"])
+            if not isinstance(base, (AlreadyInstalledCandidate, LinkCandidate)):
+                return None
+            return self._make_extras_candidate(base, frozenset(pin["extras"]))
+
+        name = canonicalize_name(pin["name"])
+        version = Version(pin["version"])
+        template = root_ireqs.get(name)
+        if pin["kind"] == "installed":
+            dist = self._installed_dists.get(name)
+            if dist is None or dist.version != version:
+                return None
+            if template is None:
+                template = self._make_install_req_from_spec(name, None)
+            return self._make_candidate_from_dist(dist, frozenset(), template)
+        if pin["kind"] != "link":
+            return None
+        if template is None or not pin["user_supplied"]:
+            template = self._make_install_req_from_spec(pin["req"], None)
+            template.comes_from = pin["comes_from"]
+        link = link_from_json(pin["link"], pin["page"])
+        return self._make_base_candidate_from_link(link, template, name, version)
+
     def get_dist_to_uninstall(self, candidate: Candidate) -> BaseDistribution | None:
         # TODO: Are there more cases this needs to return True? Editable?
         dist = self._installed_dists.get(candidate.project_name)
@@ -0,0 +1,411 @@
+"""Record where the time of a dependency resolution goes.
+
+This backs ``--resolver-profile``: the provider and reporter given to
+resolvelib are wrapped so that each round, the identifier chosen in it, the
+candidates rejected and the causes of backtracking are recorded, along with
+the time spent finding candidates and getting their dependencies.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from collections import defaultdict
+from collections.abc import Collection, Iterable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
+
+from pip._vendor.resolvelib.providers import AbstractProvider
+from pip._vendor.resolvelib.reporters import BaseReporter
+
+from pip._internal.utils._log import getLogger
+
+from .base import Candidate, Requirement
+from .provider import PipProvider
+
+if TYPE_CHECKING:
+    from pip._vendor.resolvelib.providers import Preference
+    from pip._vendor.resolvelib.resolvers import RequirementInformation
+    from pip._vendor.resolvelib.structs import Criterion, State
+
+    PreferenceInformation = RequirementInformation[Requirement, Candidate]
+
+    _ProviderBase = AbstractProvider[Requirement, Candidate, str]
+else:
+    _ProviderBase = AbstractProvider
+
+logger = getLogger(__name__)
+
+# Bumped when the format of the profile changes incompatibly.
+PROFILE_VERSION = 1
+
+
+def _describe_candidate(candidate: Candidate) -> str:
+    return f"{candidate.name} {candidate.version}"
+
+
+def _describe_information(info: PreferenceInformation) -> str:
+    req, parent = info.requirement, info.parent
+    if parent is None:
+        return f"The user requested {req.format_for_error()}"
+    return f"{_describe_candidate(parent)} depends on {req.format_for_error()}"
+
+
+class ResolverProfiler:
+    """Collect the measurements of a resolution, to write them as JSON."""
+
+    def __init__(self) -> None:
+        self._start = time.perf_counter()
+        self._round_start: float | None = None
+        self._preferences: list[tuple[Any, str]] = []
+        self._attempted: str | None = None
+        self.rounds: list[dict[str, Any]] = []
+        # The number of calls of each provider method, and their total time.
+        self.calls: defaultdict[str, dict[str, float]] = defaultdict(
+            lambda: {"count": 0, "seconds": 0.0}
+        )
+        self.projects: defaultdict[str, dict[str, Any]] = defaultdict(
+            lambda: {
+                "find_matches": 0.0,
+                "get_dependencies": 0.0,
+                "candidates": 0,
+                "rejected": 0,
+                "pins": 0,
+            }
+        )
+        self.peak_criteria = 0
+        self.peak_pinned = 0
+        # Whether the result was reused from the resolution cache, in which
+        # case nothing was resolved.
+        self.cached = False
+
+    @contextmanager
+    def timed(
+        self, method: str, identifier: str | None = None, count: bool = True
+    ) -> Iterator[None]:
+        """Account the time spent in the block to the given provider method,
+        and to the project it was called for.
+
+        :param count: Whether the block is a call of the method, rather than
+            more work done on behalf of an earlier call.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            if count:
+                self.calls[method]["count"] += 1
+            self.calls[method]["seconds"] += elapsed
+            if identifier is not None and method in self.projects[identifier]:
+                self.projects[identifier][method] += elapsed
+
+    def start_round(self, index: int) -> None:
+        self._round_start = time.perf_counter()
+        self._preferences = []
+        self._attempted = None
+        self.rounds.append(
+            {
+                "round": index,
+                "seconds": None,
+                "narrowed": None,
+                "chosen": None,
+                "pinned": None,
+                "rejected": [],
+                "backtrack_causes": [],
+            }
+        )
+
+    def end_round(self, state: State[Requirement, Candidate, str] | None) -> None:
+        if self._round_start is None or not self.rounds:
+            return
+        current = self.rounds[-1]
+        current["seconds"] = time.perf_counter() - self._round_start
+        self._round_start = None
+        # Mirror how resolvelib picks the identifier to work on: the most
+        # preferred one, unless there was a single one to choose from.
+        if self._preferences:
+            current["chosen"] = min(self._preferences, key=lambda p: p[0])[1]
+        elif current["narrowed"] is not None and len(current["narrowed"]) == 1:
+            current["chosen"] = current["narrowed"][0]
+        else:
+            current["chosen"] = self._attempted
+        if state is not None:
+            self.peak_criteria = max(self.peak_criteria, len(state.criteria))
+            self.peak_pinned = max(self.peak_pinned, len(state.mapping))
+
+    def _current_round(self) -> dict[str, Any] | None:
+        if self._round_start is None:
+            return None
+        return self.rounds[-1]
+
+    def record_narrowed(self, identifiers: list[str]) -> None:
+        current = self._current_round()
+        if current is not None:
+            current["narrowed"] = identifiers
+
+    def record_preference(self, identifier: str, preference: Any) -> None:
+        self._preferences.append((preference, identifier))
+
+    def record_candidates(self, identifier: str, count: int) -> None:
+        """Record that count candidates of a project were looked at in a row."""
+        project = self.projects[identifier]
+        project["candidates"] = max(project["candidates"], count)
+
+    def record_pinned(self, candidate: Candidate) -> None:
+        self.projects[candidate.name]["pins"] += 1
+        current = self._current_round()
+        if current is not None:
+            self._attempted = self._attempted or candidate.name
+            current["pinned"] = _describe_candidate(candidate)
+
+    def record_rejected(
+        self, criterion: Criterion[Requirement, Candidate], candidate: Candidate
+    ) -> None:
+        self.projects[candidate.name]["rejected"] += 1
+        current = self._current_round()
+        if current is not None:
+            self._attempted = self._attempted or candidate.name
+            current["rejected"].append(
+                {
+                    "candidate": _describe_candidate(candidate),
+                    "causes": [
+                        _describe_information(info) for info in criterion.information
+                    ],
+                }
+            )
+
+    def record_backtrack(self, causes: Collection[PreferenceInformation]) -> None:
+        current = self._current_round()
+        if current is not None:
+            current["backtrack_causes"] = [
+                _describe_information(info) for info in causes
+            ]
+
+    def to_json(self) -> dict[str, Any]:
+        # A resolution that failed leaves its last round open.
+        self.end_round(None)
+        return {
+            "version": PROFILE_VERSION,
+            "cached": self.cached,
+            "seconds": time.perf_counter() - self._start,
+            "rounds": self.rounds,
+            "calls": dict(self.calls),
+            "projects": dict(sorted(self.projects.items())),
+            "peak": {
+                "criteria": self.peak_criteria,
+                "pinned": self.peak_pinned,
+            },
+        }
+
+    def write(self, path: str) -> None:
+        """Write the profile to path, logging a short summary of it."""
+        data = self.to_json()
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+        except OSError as e:
+            logger.warning("Could not write the resolver profile to %s: %s", path, e)
+            return
+        logger.info("Wrote the resolver profile to %s", path)
+        for line in summarize_profile(data, top=3):
+            logger.verbose("%s", line)
+
+
+def summarize_profile(data: Mapping[str, Any], top: int = 10) -> list[str]:
+    """Describe the main figures of a profile written by ResolverProfiler.
+
+    :param top: How many projects to list, among those that took the most time
+        and those whose candidates were rejected the most.
+    """
+    if data.get("cached"):
+        return ["The result of a previous resolution was reused from the cache."]
+    rounds = data["rounds"]
+    backtracks = sum(1 for r in rounds if r["backtrack_causes"])
+    lines = [
+        f"Resolution took {data['seconds']:.2f}s over {len(rounds)} rounds, "
+        f"backtracking {backtracks} times.",
+        f"Up to {data['peak']['criteria']} projects were considered at once, "
+        f"{data['peak']['pinned']} of them pinned.",
+    ]
+    for method, call in sorted(data["calls"].items()):
+        lines.append(f"{method}: {call['seconds']:.2f}s in {int(call['count'])} calls")
+
+    projects = data["projects"]
+    slowest = sorted(
+        projects.items(),
+        key=lambda item: item[1]["find_matches"] + item[1]["get_dependencies"],
+        reverse=True,
+    )[:top]
+    if slowest:
+        lines.append("Slowest projects (finding candidates + getting dependencies):")
+        for name, project in slowest:
+            lines.append(
+                f"  {name}: {project['find_matches']:.2f}s + "
+                f"{project['get_dependencies']:.2f}s, "
+                f"up to {project['candidates']} candidates looked at"
+            )
+    rejected = sorted(
+        (item for item in projects.items() if item[1]["rejected"]),
+        key=lambda item: item[1]["rejected"],
+        reverse=True,
+    )[:top]
+    if rejected:
+        lines.append("Most rejected projects:")
+        for name, project in rejected:
+            lines.append(
+                f"  {name}: {project['rejected']} candidates rejected, "
+                f"{project['pins']} pinned"
+            )
+    return lines
+
+
+class _TimedMatches(Sequence[Candidate]):
+    """Wrap the candidates returned by find_matches(), which are found
+    lazily, to account the time spent iterating over them.
+    """
+
+    def __init__(
+        self, matches: Sequence[Candidate], identifier: str, profiler: ResolverProfiler
+    ) -> None:
+        self._matches = matches
+        self._identifier = identifier
+        self._profiler = profiler
+
+    def __getitem__(self, index: Any) -> Any:
+        return self._matches[index]
+
+    def __len__(self) -> int:
+        return len(self._matches)
+
+    def __bool__(self) -> bool:
+        with self._profiler.timed("find_matches", self._identifier, count=False):
+            return bool(self._matches)
+
+    def __iter__(self) -> Iterator[Candidate]:
+        iterator = iter(self._matches)
+        count = 0
+        while True:
+            with self._profiler.timed("find_matches", self._identifier, count=False):
+                candidate = next(iterator, None)
+            if candidate is None:
+                break
+            count += 1
+            self._profiler.record_candidates(self._identifier, count)
+            yield candidate
+
+
+class ProfilingProvider(_ProviderBase):
+    """A provider measuring the calls resolvelib makes to another one."""
+
+    def __init__(self, provider: PipProvider, profiler: ResolverProfiler) -> None:
+        self._provider = provider
+        self._profiler = profiler
+
+    def identify(self, requirement_or_candidate: Requirement | Candidate) -> str:
+        return self._provider.identify(requirement_or_candidate)
+
+    def narrow_requirement_selection(
+        self,
+        identifiers: Iterable[str],
+        resolutions: Mapping[str, Candidate],
+        candidates: Mapping[str, Iterator[Candidate]],
+        information: Mapping[str, Iterator[PreferenceInformation]],
+        backtrack_causes: Sequence[PreferenceInformation],
+    ) -> Iterable[str]:
+        with self._profiler.timed("narrow_requirement_selection"):
+            narrowed = list(
+                self._provider.narrow_requirement_selection(
+                    identifiers, resolutions, candidates, information, backtrack_causes
+                )
+            )
+        self._profiler.record_narrowed(narrowed)
+        return narrowed
+
+    def get_preference(
+        self,
+        identifier: str,
+        resolutions: Mapping[str, Candidate],
+        candidates: Mapping[str, Iterator[Candidate]],
+        information: Mapping[str, Iterable[PreferenceInformation]],
+        backtrack_causes: Sequence[PreferenceInformation],
+    ) -> Preference:
+        with self._profiler.timed("get_preference"):
+            preference = self._provider.get_preference(
+                identifier, resolutions, candidates, information, backtrack_causes
+            )
+        self._profiler.record_preference(identifier, preference)
+        return preference
+
+    def find_matches(
+        self,
+        identifier: str,
+        requirements: Mapping[str, Iterator[Requirement]],
+        incompatibilities: Mapping[str, Iterator[Candidate]],
+    ) -> Iterable[Candidate]:
+        with self._profiler.timed("find_matches", identifier):
+            matches = self._provider.find_matches(
+                identifier, requirements, incompatibilities
+            )
+            if not isinstance(matches, Sequence):
+                matches = list(matches)
+        return _TimedMatches(matches, identifier, self._profiler)
+
+    def is_satisfied_by(self, requirement: Requirement, candidate: Candidate) -> bool:
+        return self._provider.is_satisfied_by(requirement, candidate)
+
+    def get_dependencies(self, candidate: Candidate) -> Iterable[Requirement]:
+        # Getting the dependencies may need to download and build the
+        # candidate to read its metadata.
+        with self._profiler.timed("get_dependencies", candidate.name):
+            return list(self._provider.get_dependencies(candidate))
+
+
+class ProfilingReporter(BaseReporter[Requirement, Candidate, str]):
+    """A reporter recording the events of a resolution, and passing them on
+    to another reporter.
+    """
+
+    def __init__(
+        self,
+        reporter: BaseReporter[Requirement, Candidate, str],
+        profiler: ResolverProfiler,
+    ) -> None:
+        self._reporter = reporter
+        self._profiler = profiler
+
+    def starting(self) -> None:
+        self._reporter.starting()
+
+    def starting_round(self, index: int) -> None:
+        self._profiler.start_round(index)
+        self._reporter.starting_round(index)
+
+    def ending_round(
+        self, index: int, state: State[Requirement, Candidate, str]
+    ) -> None:
+        self._profiler.end_round(state)
+        self._reporter.ending_round(index, state)
+
+    def ending(self, state: State[Requirement, Candidate, str]) -> None:
+        self._profiler.end_round(state)
+        self._reporter.ending(state)
+
+    def adding_requirement(
+        self, requirement: Requirement, parent: Candidate | None
+    ) -> None:
+        self._reporter.adding_requirement(requirement, parent)
+
+    def resolving_conflicts(self, causes: Collection[PreferenceInformation]) -> None:
+        self._profiler.record_backtrack(causes)
+        self._reporter.resolving_conflicts(causes)
+
+    def rejecting_candidate(
+        self, criterion: Criterion[Requirement, Candidate], candidate: Candidate
+    ) -> None:
+        self._profiler.record_rejected(criterion, candidate)
+        self._reporter.rejecting_candidate(criterion, candidate)
+
+    def pinning(self, candidate: Candidate) -> None:
+        self._profiler.record_pinned(candidate)
+        self._reporter.pinning(candidate)
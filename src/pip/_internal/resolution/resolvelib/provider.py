@@ -306,4 +306,12 @@ class PipProvider(_ProviderBase):
     def get_dependencies(self, candidate: Candidate) -> Iterable[Requirement]:
         with_requires = not self._ignore_dependencies
         # iter_dependencies() can perform nontrivial work so delay until needed.
-        return (r for r in candidate.iter_dependencies(with_requires) if r is not None)
+        dependencies = [
+            r for r in candidate.iter_dependencies(with_requires) if r is not None
+        ]
+        # resolvelib looks up the candidates of each dependency in turn, so
+        # get all of their index pages, and the metadata of their most likely
+        # candidates, going before handing them over.
+        self._factory.prefetch_index_pages(dependencies)
+        self._factory.prefetch_top_candidates(dependencies)
+        yield from dependencies
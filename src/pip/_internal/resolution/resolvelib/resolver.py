@@ -2,16 +2,21 @@ from __future__ import annotations
 
 import contextlib
 import functools
+import json
 import logging
 import os
-from typing import TYPE_CHECKING, cast
+import urllib.parse
+from typing import TYPE_CHECKING, Any, cast
 
-from pip._vendor.packaging.utils import canonicalize_name
+from pip._vendor.packaging.markers import default_environment
+from pip._vendor.packaging.utils import NormalizedName, canonicalize_name
 from pip._vendor.resolvelib import BaseReporter, ResolutionImpossible, ResolutionTooDeep
 from pip._vendor.resolvelib import Resolver as RLResolver
+from pip._vendor.resolvelib.resolvers import Result as RLResult
 from pip._vendor.resolvelib.structs import DirectedGraph
 
-from pip._internal.cache import WheelCache
+from pip import __version__
+from pip._internal.cache import ResolutionCache, WheelCache
 from pip._internal.exceptions import ResolutionTooDeepError
 from pip._internal.index.package_finder import PackageFinder
 from pip._internal.operations.prepare import RequirementPreparer
@@ -19,6 +24,11 @@ from pip._internal.req.constructors import install_req_extend_extras
 from pip._internal.req.req_install import InstallRequirement
 from pip._internal.req.req_set import RequirementSet
 from pip._internal.resolution.base import BaseResolver, InstallRequirementProvider
+from pip._internal.resolution.resolvelib.profiler import (
+    ProfilingProvider,
+    ProfilingReporter,
+    ResolverProfiler,
+)
 from pip._internal.resolution.resolvelib.provider import PipProvider
 from pip._internal.resolution.resolvelib.reporter import (
     PipDebuggingReporter,
@@ -27,11 +37,9 @@ from pip._internal.resolution.resolvelib.reporter import (
 from pip._internal.utils.packaging import get_requirement
 
 from .base import Candidate, Requirement
-from .factory import Factory
+from .factory import CollectedRootRequirements, Factory
 
 if TYPE_CHECKING:
-    from pip._vendor.resolvelib.resolvers import Result as RLResult
-
     Result = RLResult[Requirement, Candidate, str]
 
 
@@ -55,7 +63,15 @@ class Resolver(BaseResolver):
         force_reinstall: bool,
         upgrade_strategy: str,
         py_version_info: tuple[int, ...] | None = None,
+        resolution_cache: ResolutionCache | None = None,
+        profile_path: str | None = None,
     ):
+        """
+        :param resolution_cache: Where to record the results of resolutions,
+            to reuse them while the index pages they depend on are unchanged.
+        :param profile_path: Where to write the timings and other details of
+            the resolution, as JSON.
+        """
         super().__init__()
         assert upgrade_strategy in self._allowed_strategies
         assert not (ignore_dependencies and only_dependencies)
@@ -76,42 +92,38 @@ class Resolver(BaseResolver):
         self.upgrade_strategy = upgrade_strategy
         self._result: Result | None = None
 
+        self._finder = finder
+        self._resolution_cache = resolution_cache
+        self._profile_path = profile_path
+        self._options = {
+            "use_user_site": use_user_site,
+            "ignore_dependencies": ignore_dependencies,
+            "only_dependencies": only_dependencies,
+            "ignore_installed": ignore_installed,
+            "ignore_requires_python": ignore_requires_python,
+            "force_reinstall": force_reinstall,
+            "upgrade_strategy": upgrade_strategy,
+            "py_version_info": py_version_info,
+        }
+
     def resolve(
         self, root_reqs: list[InstallRequirement], check_supported_wheels: bool
     ) -> RequirementSet:
         collected = self.factory.collect_root_requirements(root_reqs)
-        provider = PipProvider(
-            factory=self.factory,
-            constraints=collected.constraints,
-            ignore_dependencies=self.ignore_dependencies,
-            only_dependencies=self.only_dependencies,
-            upgrade_strategy=self.upgrade_strategy,
-            user_requested=collected.user_requested,
-        )
-        if "PIP_RESOLVER_DEBUG" in os.environ:
-            reporter: BaseReporter[Requirement, Candidate, str] = PipDebuggingReporter()
-        else:
-            reporter = PipReporter(constraints=provider.constraints)
-
-        resolver: RLResolver[Requirement, Candidate, str] = RLResolver(
-            provider,
-            reporter,
-        )
-
-        try:
-            limit_how_complex_resolution_can_be = 200000
-            result = self._result = resolver.resolve(
-                collected.requirements, max_rounds=limit_how_complex_resolution_can_be
-            )
-
-        except ResolutionImpossible as e:
-            error = self.factory.get_installation_error(
-                cast("ResolutionImpossible[Requirement, Candidate]", e),
-                collected.constraints,
-            )
-            raise error from e
-        except ResolutionTooDeep:
-            raise ResolutionTooDeepError from None
+        cache_key = self._get_cache_key(root_reqs)
+        result = None
+        if cache_key is not None:
+            result = self._load_result(cache_key, root_reqs)
+            if result is not None and self._profile_path is not None:
+                # Still write the profile, saying why there is nothing in it.
+                profiler = ResolverProfiler()
+                profiler.cached = True
+                profiler.write(self._profile_path)
+        if result is None:
+            result = self._resolve(collected)
+            if cache_key is not None:
+                self._save_result(cache_key, result)
+        self._result = result
 
         req_set = RequirementSet(check_supported_wheels=check_supported_wheels)
         # process candidates with extras last to ensure their base equivalent is
@@ -192,6 +204,155 @@ class Resolver(BaseResolver):
 
         return req_set
 
+    def _resolve(self, collected: CollectedRootRequirements) -> Result:
+        provider = PipProvider(
+            factory=self.factory,
+            constraints=collected.constraints,
+            ignore_dependencies=self.ignore_dependencies,
+            only_dependencies=self.only_dependencies,
+            upgrade_strategy=self.upgrade_strategy,
+            user_requested=collected.user_requested,
+        )
+        if "PIP_RESOLVER_DEBUG" in os.environ:
+            reporter: BaseReporter[Requirement, Candidate, str] = PipDebuggingReporter()
+        else:
+            reporter = PipReporter(constraints=provider.constraints)
+
+        profiler = None
+        if self._profile_path is not None:
+            profiler = ResolverProfiler()
+            resolver: RLResolver[Requirement, Candidate, str] = RLResolver(
+                ProfilingProvider(provider, profiler),
+                ProfilingReporter(reporter, profiler),
+            )
+        else:
+            resolver = RLResolver(provider, reporter)
+
+        try:
+            self.factory.prefetch_top_candidates(collected.requirements)
+            limit_how_complex_resolution_can_be = 200000
+            return resolver.resolve(
+                collected.requirements, max_rounds=limit_how_complex_resolution_can_be
+            )
+
+        except ResolutionImpossible as e:
+            error = self.factory.get_installation_error(
+                cast("ResolutionImpossible[Requirement, Candidate]", e),
+                collected.constraints,
+            )
+            raise error from e
+        except ResolutionTooDeep:
+            raise ResolutionTooDeepError from None
+        finally:
+            self.factory.cancel_prefetch()
+            if profiler is not None:
+                assert self._profile_path is not None
+                profiler.write(self._profile_path)
+
+    def _get_cache_key(self, root_reqs: list[InstallRequirement]) -> str | None:
+        """Describe everything the result of a resolution depends on, except
+        for the index pages it consults.
+
+        Return None if the result can't be cached, e.g. because a requirement
+        points to a local directory whose contents may change.
+        """
+        if self._resolution_cache is None or not self._resolution_cache.cache_dir:
+            return None
+        if self.factory.preparer.require_hashes:
+            return None
+        selection = self._finder.describe_selection()
+        # Local files aren't versioned like index pages, and URLs with
+        # credentials shouldn't be written to the cache.
+        if selection["find_links"] or selection["locked_links"]:
+            return None
+        if any(
+            "@" in urllib.parse.urlsplit(url).netloc for url in selection["index_urls"]
+        ):
+            return None
+
+        requirements = []
+        for ireq in root_reqs:
+            if ireq.editable or ireq.link or ireq.req is None or ireq.hash_options:
+                return None
+            requirements.append(
+                [
+                    str(ireq.req),
+                    ireq.constraint,
+                    ireq.user_supplied,
+                    ireq.config_settings,
+                ]
+            )
+        key = {
+            "pip": __version__,
+            "requirements": requirements,
+            "environment": default_environment(),
+            "selection": selection,
+            "options": self._options,
+            "installed": self.factory.get_installed_versions(),
+        }
+        return json.dumps(key, sort_keys=True)
+
+    def _load_result(
+        self, cache_key: str, root_reqs: list[InstallRequirement]
+    ) -> Result | None:
+        """Rebuild the result of a previous resolution from the cache, if the
+        index pages it consulted are unchanged.
+        """
+        assert self._resolution_cache is not None
+        data = self._resolution_cache.get(cache_key)
+        if data is None:
+            return None
+        root_ireqs: dict[NormalizedName, InstallRequirement] = {}
+        for ireq in root_reqs:
+            if not ireq.constraint and ireq.name and ireq.match_markers():
+                root_ireqs.setdefault(canonicalize_name(ireq.name), ireq)
+        try:
+            if not self._finder.check_index_pages(data["pages"]):
+                logger.debug("Index pages changed since the resolution was cached")
+                return None
+            mapping: dict[str, Candidate] = {}
+            for identifier, pin in data["pins"]:
+                candidate = self.factory.make_candidate_from_pin(
+                    pin, mapping, root_ireqs
+                )
+                if candidate is None:
+                    logger.debug("Cached resolution result pins unavailable %s", pin)
+                    return None
+                mapping[identifier] = candidate
+            graph: DirectedGraph[str | None] = DirectedGraph()
+            for node in data["nodes"]:
+                graph.add(node)
+            for parent, child in data["edges"]:
+                graph.connect(parent, child)
+        except (KeyError, TypeError, ValueError) as e:
+            logger.debug("Ignoring invalid cached resolution result: %s", e)
+            return None
+        logger.info("Using the cached result of a previous resolution")
+        return RLResult(mapping=mapping, graph=graph, criteria={})
+
+    def _save_result(self, cache_key: str, result: Result) -> None:
+        assert self._resolution_cache is not None
+        pages = self._finder.get_fetched_index_pages()
+        if any(version is None for _, _, version in pages):
+            logger.debug("Not caching the resolution result: unversioned pages")
+            return
+        pins: list[tuple[str, dict[str, Any]]] = []
+        for identifier, candidate in result.mapping.items():
+            pin = self.factory.pin_candidate(candidate)
+            if pin is None:
+                logger.debug("Not caching the resolution result: %s", candidate)
+                return
+            pins.append((identifier, pin))
+        # Candidates with extras are made from their base, so they go last.
+        pins.sort(key=lambda item: item[1]["kind"] == "extras")
+        data = {
+            "pages": pages,
+            "pins": pins,
+            "nodes": list(result.graph),
+            "edges": list(result.graph.iter_edges()),
+        }
+        self._resolution_cache.set(cache_key, data)
+
     def get_installation_order(
         self, req_set: RequirementSet
     ) -> list[InstallRequirement]:
@@ -207,11 +368,61 @@ class Resolver(BaseResolver):
         arbitrary points. We make no guarantees about where the cycle
         would be broken, other than it *would* be broken.
         """
+        return [ireq for _, ireq in self._sort_requirements(req_set)[0]]
+
+    def get_installation_levels(
+        self, req_set: RequirementSet
+    ) -> list[list[InstallRequirement]]:
+        """Split the installation order into levels of independent requirements.
+
+        Requirements in a level have the same topological weight, and none of
+        them depends on another, directly or through other nodes of the graph,
+        so they can be installed at the same time. Concatenated, the levels
+        give the order returned by ``get_installation_order()``.
+        """
+        assert self._result is not None, "must call resolve() first"
+        # Computing the weights prunes the graph, so keep a complete copy.
+        graph = self._result.graph.copy()
+        sorted_items, weights = self._sort_requirements(req_set)
+
+        descendants: dict[str, set[str | None]] = {}
+
+        def get_descendants(key: str) -> set[str | None]:
+            if key not in descendants:
+                found: set[str | None] = set()
+                stack: list[str | None] = [key]
+                while stack:
+                    for child in graph.iter_children(stack.pop()):
+                        if child not in found:
+                            found.add(child)
+                            stack.append(child)
+                descendants[key] = found
+            return descendants[key]
+
+        levels: list[list[InstallRequirement]] = []
+        level_keys: list[str] = []
+        for key, ireq in sorted_items:
+            key = canonicalize_name(key)
+            if (
+                not levels
+                or weights[key] != weights[level_keys[0]]
+                or any(k in get_descendants(key) for k in level_keys)
+                or any(key in get_descendants(k) for k in level_keys)
+            ):
+                levels.append([])
+                level_keys = []
+            levels[-1].append(ireq)
+            level_keys.append(key)
+        return levels
+
+    def _sort_requirements(
+        self, req_set: RequirementSet
+    ) -> tuple[list[tuple[str, InstallRequirement]], dict[str | None, int]]:
         assert self._result is not None, "must call resolve() first"
 
         if not req_set.requirements:
             # Nothing is left to install, so we do not need an order.
-            return []
+            return [], {}
 
         graph = self._result.graph
         weights = get_topological_weights(graph, set(req_set.requirements.keys()))
@@ -221,7 +432,7 @@ class Resolver(BaseResolver):
             key=functools.partial(_req_set_item_sorter, weights=weights),
             reverse=True,
         )
-        return [ireq for _, ireq in sorted_items]
+        return sorted_items, weights
 
 
 def get_topological_weights(
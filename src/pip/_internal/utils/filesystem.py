@@ -4,6 +4,7 @@ import fnmatch
 import os
 import os.path
 import random
+import shutil
 import sys
 from collections.abc import Callable, Generator
 from contextlib import contextmanager
@@ -12,7 +13,7 @@ from tempfile import NamedTemporaryFile
 from typing import Any, BinaryIO, cast
 
 from pip._internal.utils.compat import get_path_uid
-from pip._internal.utils.misc import format_size
+from pip._internal.utils.misc import ensure_dir, format_size
 from pip._internal.utils.retry import retry
 
 
@@ -71,6 +72,23 @@ def adjacent_tmp_file(path: str, **kwargs: Any) -> Generator[BinaryIO, None, Non
 replace = retry(stop_after_delay=1, wait=0.25)(os.replace)
 
 
+def write_file_atomically(
+    path: str, contents: bytes, permissions_of: str | None = None
+) -> None:
+    """Write contents to path, creating its directory if needed.
+
+    The file is written next to path and moved in place, so that readers
+    never see it partially written. If permissions_of is given, the file gets
+    the read/write permissions of that directory.
+    """
+    ensure_dir(os.path.dirname(path))
+    with adjacent_tmp_file(path) as f:
+        f.write(contents)
+        if permissions_of is not None:
+            copy_directory_permissions(permissions_of, f)
+    replace(f.name, path)
+
+
 # test_writable_dir and _test_writable_dir_win are copied from Flit,
 # with the author's agreement to also place them under pip's license.
 def test_writable_dir(path: str) -> bool:
@@ -165,6 +183,45 @@ def copy_directory_permissions(directory: str, target_file: BinaryIO) -> None:
         os.chmod(target_file.name, mode, follow_symlinks=False)
 
 
+# The ioctl request to clone a file on Linux, only exposed by fcntl on 3.12+.
+_FICLONE = 0x40049409
+
+
+def _reflink(src: str, dest: str) -> bool:
+    """Create dest as a copy-on-write clone of src, if the file system
+    supports it. Return whether it did.
+    """
+    if sys.platform != "linux":
+        return False
+    import fcntl
+
+    try:
+        with open(src, "rb") as src_file, open(dest, "wb") as dest_file:
+            fcntl.ioctl(dest_file.fileno(), _FICLONE, src_file.fileno())
+    except OSError:
+        try:
+            os.unlink(dest)
+        except OSError:
+            pass
+        return False
+    shutil.copymode(src, dest)
+    return True
+
+
+def clone_or_copy_file(src: str, dest: str) -> None:
+    """Create dest with the contents and mode of src, sharing its storage
+    where possible.
+
+    A copy-on-write clone (reflink) is tried first, before falling back to a
+    plain copy. Either way, writing to dest leaves src unchanged, which a
+    hard link wouldn't. dest must not exist.
+    """
+    if _reflink(src, dest):
+        return
+    shutil.copyfile(src, dest)
+    shutil.copymode(src, dest)
+
+
 def _subdirs_without_generic(
     path: str, predicate: Callable[[str, list[str]], bool]
 ) -> Generator[Path]:
@@ -107,6 +107,38 @@ def get_indentation() -> int:
     return getattr(_log_state, "indentation", 0)
 
 
+# A log record held back by defer_logging(), with the indentation it was
+# emitted at.
+DeferredRecord = tuple[logging.LogRecord, int]
+
+
+@contextlib.contextmanager
+def defer_logging(records: list[DeferredRecord]) -> Generator[None, None, None]:
+    """
+    A context manager which holds back the log records emitted by the current
+    thread inside it, appending them to records instead of outputting them.
+
+    This keeps the logs of tasks running in parallel from interleaving. The
+    records can be output later, in the right place, with replay_logging().
+    """
+    _log_state.deferred_records = records
+    try:
+        yield
+    finally:
+        _log_state.deferred_records = None
+
+
+def is_logging_deferred() -> bool:
+    return getattr(_log_state, "deferred_records", None) is not None
+
+
+def replay_logging(records: list[DeferredRecord]) -> None:
+    """Output log records held back by defer_logging()."""
+    for record, indentation in records:
+        with indent_log(indentation):
+            logging.getLogger(record.name).handle(record)
+
+
 class IndentingFormatter(logging.Formatter):
     default_time_format = "%Y-%m-%dT%H:%M:%S"
 
@@ -264,6 +296,22 @@ class MaxLevelFilter(Filter):
         return record.levelno < self.level
 
 
+class DeferredRecordFilter(Filter):
+    """
+    A logging Filter that holds back the records emitted inside
+    defer_logging(), so that handlers do not output them yet.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        records = getattr(_log_state, "deferred_records", None)
+        if records is None:
+            return True
+        # The same record goes through the filter of every handler.
+        if not records or records[-1][0] is not record:
+            records.append((record, get_indentation()))
+        return False
+
+
 class ExcludeLoggerFilter(Filter):
     """
     A logging Filter that excludes records from a logger (or its children).
@@ -336,6 +384,9 @@ def setup_logging(verbosity: int, no_color: bool, user_log_file: str | None) ->
             "version": 1,
             "disable_existing_loggers": False,
             "filters": {
+                "defer": {
+                    "()": "pip._internal.utils.logging.DeferredRecordFilter",
+                },
                 "exclude_warnings": {
                     "()": "pip._internal.utils.logging.MaxLevelFilter",
                     "level": logging.WARNING,
@@ -365,14 +416,14 @@ def setup_logging(verbosity: int, no_color: bool, user_log_file: str | None) ->
                     "level": level,
                     "class": handler_classes["stream"],
                     "console": _stdout_console,
-                    "filters": ["exclude_subprocess", "exclude_warnings"],
+                    "filters": ["defer", "exclude_subprocess", "exclude_warnings"],
                     "formatter": "indent",
                 },
                 "console_errors": {
                     "level": "WARNING",
                     "class": handler_classes["stream"],
                     "console": _stderr_console,
-                    "filters": ["exclude_subprocess"],
+                    "filters": ["defer", "exclude_subprocess"],
                     "formatter": "indent",
                 },
                 # A handler responsible for logging to the console messages
@@ -381,7 +432,7 @@ def setup_logging(verbosity: int, no_color: bool, user_log_file: str | None) ->
                     "level": level,
                     "class": handler_classes["stream"],
                     "console": _stderr_console,
-                    "filters": ["restrict_to_subprocess"],
+                    "filters": ["defer", "restrict_to_subprocess"],
                     "formatter": "indent",
                 },
                 "user_log": {
@@ -390,6 +441,7 @@ def setup_logging(verbosity: int, no_color: bool, user_log_file: str | None) ->
                     "filename": additional_log_file,
                     "encoding": "utf-8",
                     "delay": True,
+                    "filters": ["defer"],
                     "formatter": "indent_with_timestamp",
                 },
             },
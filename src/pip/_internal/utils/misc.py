@@ -7,6 +7,7 @@ import logging
 import os
 import pathlib
 import posixpath
+import re
 import shutil
 import stat
 import sys
@@ -315,6 +316,22 @@ def format_size(bytes: float) -> str:
         return f"{int(bytes)} bytes"
 
 
+_SIZE_RE = re.compile(r"^\s*(\d+(?:\.\d*)?)\s*([a-z]*)\s*$", re.IGNORECASE)
+_SIZE_UNITS = {"": 1, "b": 1, "bytes": 1, "kb": 1000, "mb": 1000**2, "gb": 1000**3}
+
+
+def parse_size(value: str) -> int:
+    """Parse a size given in bytes, kB, MB or GB, like "500", "20 kB" or "1.5GB".
+
+    :raise ValueError: If value is not a valid size.
+    """
+    match = _SIZE_RE.match(value)
+    if match is None or match.group(2).lower() not in _SIZE_UNITS:
+        raise ValueError(f"invalid size {value!r}")
+    number, unit = match.groups()
+    return int(float(number) * _SIZE_UNITS[unit.lower()])
+
+
 def tabulate(rows: Iterable[Iterable[Any]]) -> tuple[list[str], list[int]]:
     """Return a list of formatted rows and a list of column sizes.
 
@@ -42,3 +42,12 @@ def get_requirement(req_string: str) -> Requirement:
     # minimize repeated parsing of the same string to construct equivalent
     # Requirement objects.
     return Requirement(req_string)
+
+
+@functools.lru_cache(maxsize=10000)
+def get_version(version_string: str) -> version.Version:
+    """Construct a packaging.Version object with caching"""
+    # The same versions appear on the index pages of many projects. Returning
+    # the same object for each of them saves parsing them again, and keeps a
+    # single copy in memory, however many candidates refer to it.
+    return version.Version(version_string)
@@ -225,18 +225,26 @@ def call_subprocess(
     return output
 
 
-def runner_with_spinner_message(message: str) -> Callable[..., None]:
+def runner_with_spinner_message(
+    message: str, extra_environ: Mapping[str, Any] | None = None
+) -> Callable[..., None]:
     """Provide a subprocess_runner that shows a spinner message.
 
     Intended for use with for BuildBackendHookCaller. Thus, the runner has
     an API that matches what's expected by BuildBackendHookCaller.subprocess_runner.
+
+    :param extra_environ: Environment variables to set for every command, in
+        addition to the ones given by the BuildBackendHookCaller.
     """
+    runner_environ = extra_environ
 
     def runner(
         cmd: list[str],
         cwd: str | None = None,
         extra_environ: Mapping[str, Any] | None = None,
     ) -> None:
+        if runner_environ:
+            extra_environ = {**runner_environ, **(extra_environ or {})}
         with open_spinner(message) as spinner:
             call_subprocess(
                 cmd,
@@ -5,7 +5,8 @@ from __future__ import annotations
 import logging
 import os.path
 import re
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
 from tempfile import TemporaryDirectory
 
 from pip._vendor.packaging.utils import canonicalize_name, canonicalize_version
@@ -19,7 +20,12 @@ from pip._internal.models.wheel import Wheel
 from pip._internal.operations.build.wheel import build_wheel_pep517
 from pip._internal.operations.build.wheel_editable import build_wheel_editable
 from pip._internal.req.req_install import InstallRequirement
-from pip._internal.utils.logging import indent_log
+from pip._internal.utils.logging import (
+    DeferredRecord,
+    defer_logging,
+    indent_log,
+    replay_logging,
+)
 from pip._internal.utils.misc import ensure_dir, hash_file
 from pip._internal.utils.urls import path_to_url
 from pip._internal.vcs import vcs
@@ -140,9 +146,13 @@ def _build_one(
         )
         return None
 
-    # Install build deps into temporary directory (PEP 518)
-    with req.build_env:
-        wheel_path = _build_one_inside_env(req, output_dir, editable)
+    # Use the build deps installed into a temporary directory (PEP 518). The
+    # environment is given to the backend subprocess rather than entered, as
+    # entering it changes os.environ, which is shared with other builds that
+    # may be running in parallel.
+    wheel_path = _build_one_inside_env(
+        req, output_dir, editable, req.build_env.get_environ()
+    )
     if wheel_path and verify:
         try:
             _verify_one(req, wheel_path)
@@ -156,6 +166,7 @@ def _build_one_inside_env(
     req: InstallRequirement,
     output_dir: str,
     editable: bool,
+    build_environ: Mapping[str, str] | None = None,
 ) -> str | None:
     with TemporaryDirectory(dir=output_dir) as wheel_directory:
         assert req.name
@@ -167,6 +178,7 @@ def _build_one_inside_env(
                 backend=req.pep517_backend,
                 metadata_directory=req.metadata_directory,
                 wheel_directory=wheel_directory,
+                extra_environ=build_environ,
             )
         else:
             wheel_path = build_wheel_pep517(
@@ -174,6 +186,7 @@ def _build_one_inside_env(
                 backend=req.pep517_backend,
                 metadata_directory=req.metadata_directory,
                 wheel_directory=wheel_directory,
+                extra_environ=build_environ,
             )
 
         if wheel_path is not None:
@@ -204,14 +217,73 @@ def _build_one_inside_env(
         return None
 
 
+def _build_one_deferring_logs(
+    records: list[DeferredRecord],
+    req: InstallRequirement,
+    output_dir: str,
+    verify: bool,
+    editable: bool,
+) -> str | None:
+    """Build one wheel, holding its logs back in records."""
+    with defer_logging(records):
+        return _build_one(req, output_dir, verify, editable)
+
+
+def _build_all(
+    requirements: list[InstallRequirement],
+    wheel_cache: WheelCache,
+    verify: bool,
+    allow_editables: bool,
+    jobs: int,
+) -> Iterable[tuple[InstallRequirement, str, str | None]]:
+    """Build wheels, up to jobs at a time.
+
+    :return: The requirements, with the cache directory each one was built
+        into and the filename of the built wheel, or None if the build failed,
+        in the order they were given.
+    """
+    if jobs == 1 or len(requirements) <= 1:
+        for req in requirements:
+            cache_dir = _get_cache_dir(req, wheel_cache)
+            editable = req.editable and allow_editables
+            yield req, cache_dir, _build_one(req, cache_dir, verify, editable)
+        return
+
+    logger.info("Building up to %d wheels at a time", jobs)
+    executor = ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="pip-build")
+    try:
+        builds: list[
+            tuple[InstallRequirement, str, list[DeferredRecord], Future[str | None]]
+        ] = []
+        for req in requirements:
+            cache_dir = _get_cache_dir(req, wheel_cache)
+            editable = req.editable and allow_editables
+            records: list[DeferredRecord] = []
+            future = executor.submit(
+                _build_one_deferring_logs, records, req, cache_dir, verify, editable
+            )
+            builds.append((req, cache_dir, records, future))
+        # Report the builds in order, each with its own logs.
+        for req, cache_dir, records, future in builds:
+            try:
+                wheel_file = future.result()
+            finally:
+                replay_logging(records)
+            yield req, cache_dir, wheel_file
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
 def build(
     requirements: Iterable[InstallRequirement],
     wheel_cache: WheelCache,
     verify: bool,
     allow_editables: bool,
+    jobs: int = 1,
 ) -> BuildResult:
     """Build wheels.
 
+    :param jobs: The maximum number of wheels to build at the same time.
     :return: The list of InstallRequirement that succeeded to build and
         the list of InstallRequirement that failed to build.
     """
@@ -226,15 +298,10 @@ def build(
 
     with indent_log():
         build_successes, build_failures = [], []
-        for req in requirements:
+        for req, cache_dir, wheel_file in _build_all(
+            list(requirements), wheel_cache, verify, allow_editables, jobs
+        ):
             assert req.name
-            cache_dir = _get_cache_dir(req, wheel_cache)
-            wheel_file = _build_one(
-                req,
-                cache_dir,
-                verify,
-                req.editable and allow_editables,
-            )
             if wheel_file:
                 # Record the download origin in the cache
                 if req.download_info is not None:
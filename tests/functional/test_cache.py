@@ -529,3 +529,202 @@ def test_cache_purge_with_mixed_content(
     assert "Directories removed:" in result.stdout
     files_removed = int(re.findall(r"Files removed: (\d+)", result.stdout)[0])
     assert files_removed == 4
+
+
+@pytest.fixture
+def metadata_cache_dir(cache_dir: str) -> str:
+    return os.path.normcase(os.path.join(cache_dir, "metadata"))
+
+
+@pytest.fixture
+def populate_metadata_cache(metadata_cache_dir: str) -> list[tuple[str, str]]:
+    files = [
+        ("yyy-1.2.3", "aa", "yyy-1.2.3-py3-none-any.whl.metadata"),
+        ("zzz-4.5.6", "bb", "zzz-4.5.6-py3-none-any.whl.metadata"),
+        ("zzz-7.8.9", "cc", "zzz-7.8.9.tar.gz.metadata"),
+    ]
+
+    result = []
+    for mtime, (name, sha256, filename) in enumerate(files):
+        destination = os.path.join(metadata_cache_dir, sha256, sha256, sha256)
+        os.makedirs(destination)
+        path = os.path.join(destination, filename)
+        with open(path, "w") as f:
+            f.write("x" * 100)
+        # The last file is the most recently used one.
+        os.utime(path, (mtime, mtime))
+        result.append((name, path))
+
+    return result
+
+
+@pytest.mark.usefixtures("populate_metadata_cache")
+def test_cache_info_metadata(
+    script: PipTestEnvironment, metadata_cache_dir: str
+) -> None:
+    result = script.pip("cache", "info")
+
+    assert f"Dependency metadata location: {metadata_cache_dir}" in result.stdout
+    assert "Dependency metadata size: 300 bytes" in result.stdout
+    assert "Number of dependency metadata files: 3" in result.stdout
+
+
+def test_cache_remove_metadata(
+    script: PipTestEnvironment, populate_metadata_cache: list[tuple[str, str]]
+) -> None:
+    """Running `pip cache remove zzz` should also remove the cached metadata
+    of zzz, but nothing else."""
+    result = script.pip("cache", "remove", "zzz", "--verbose")
+
+    (_, yyy), (_, zzz_wheel), (_, zzz_sdist) = populate_metadata_cache
+    assert os.path.exists(yyy)
+    assert not os.path.exists(zzz_wheel)
+    assert not os.path.exists(zzz_sdist)
+    assert "Files removed: 2" in result.stdout
+
+
+def test_cache_trim_metadata(
+    script: PipTestEnvironment, populate_metadata_cache: list[tuple[str, str]]
+) -> None:
+    """Running `pip cache trim-metadata` should remove the least recently
+    used metadata files first."""
+    result = script.pip("cache", "trim-metadata", "250", "--verbose")
+
+    (_, yyy), (_, zzz_wheel), (_, zzz_sdist) = populate_metadata_cache
+    assert not os.path.exists(yyy)
+    assert os.path.exists(zzz_wheel)
+    assert os.path.exists(zzz_sdist)
+    assert "Files removed: 1 (100 bytes)" in result.stdout
+
+
+@pytest.mark.parametrize("args", [[], ["1MB", "2MB"], ["lots"]])
+def test_cache_trim_metadata_bad_arguments(
+    script: PipTestEnvironment, args: list[str]
+) -> None:
+    script.pip("cache", "trim-metadata", *args, expect_error=True)
+
+
+@pytest.fixture
+def populate_single_file_http_cache(cache_dir: str) -> list[str]:
+    result = []
+    for mtime, shard in enumerate(["aa", "bb", "cc"]):
+        destination = os.path.join(cache_dir, "http-single-file", shard)
+        os.makedirs(destination)
+        path = os.path.join(destination, shard * 28)
+        with open(path, "w") as f:
+            f.write("x" * 100)
+        # The last file is the most recently used one.
+        os.utime(path, (mtime, mtime))
+        result.append(path)
+
+    return result
+
+
+def test_cache_trim_http(
+    script: PipTestEnvironment, populate_single_file_http_cache: list[str]
+) -> None:
+    """Running `pip cache trim-http` should remove the least recently used
+    responses first."""
+    result = script.pip("cache", "trim-http", "250", "--verbose")
+
+    aa, bb, cc = populate_single_file_http_cache
+    assert not os.path.exists(aa)
+    assert os.path.exists(bb)
+    assert os.path.exists(cc)
+    assert "Files removed: 1 (100 bytes)" in result.stdout
+
+
+@pytest.mark.usefixtures("populate_single_file_http_cache")
+def test_cache_purge_single_file_http_cache(
+    script: PipTestEnvironment, cache_dir: str
+) -> None:
+    result = script.pip("cache", "purge", "--verbose")
+
+    assert not os.listdir(os.path.join(cache_dir, "http-single-file"))
+    assert "Files removed: 3" in result.stdout
+
+
+@pytest.fixture
+def unpacked_wheels_dir(cache_dir: str) -> str:
+    return os.path.normcase(os.path.join(cache_dir, "unpacked-wheels"))
+
+
+@pytest.fixture
+def populate_unpacked_wheels(unpacked_wheels_dir: str) -> list[str]:
+    wheels = [
+        ("aa", "yyy-1.2.3-py3-none-any.whl"),
+        ("bb", "zzz-4.5.6-py3-none-any.whl"),
+    ]
+
+    result = []
+    for sha256, filename in wheels:
+        destination = os.path.join(
+            unpacked_wheels_dir, sha256, sha256, sha256, sha256, filename
+        )
+        os.makedirs(os.path.join(destination, "pkg"))
+        with open(os.path.join(destination, "pkg", "__init__.py"), "w") as f:
+            f.write("x" * 100)
+        result.append(destination)
+
+    return result
+
+
+@pytest.mark.usefixtures("populate_unpacked_wheels")
+def test_cache_info_unpacked_wheels(
+    script: PipTestEnvironment, unpacked_wheels_dir: str
+) -> None:
+    result = script.pip("cache", "info")
+
+    assert f"Unpacked wheels location: {unpacked_wheels_dir}" in result.stdout
+    assert "Unpacked wheels size: 200 bytes" in result.stdout
+    assert "Number of unpacked wheels: 2" in result.stdout
+
+
+def test_cache_remove_unpacked_wheels(
+    script: PipTestEnvironment, populate_unpacked_wheels: list[str]
+) -> None:
+    """Running `pip cache remove zzz` should also remove the unpacked wheels
+    of zzz, but nothing else."""
+    script.pip("cache", "remove", "zzz", "--verbose")
+
+    yyy, zzz = populate_unpacked_wheels
+    assert os.path.exists(yyy)
+    assert not os.path.exists(zzz)
+    assert not os.path.exists(os.path.dirname(zzz))
+
+
+@pytest.fixture
+def populate_environment_snapshots(cache_dir: str) -> list[str]:
+    destination = os.path.join(cache_dir, "environments")
+    os.makedirs(destination)
+    result = []
+    for key in ["aa", "bb"]:
+        path = os.path.join(destination, f"{key * 28}.json")
+        with open(path, "w") as f:
+            f.write("x" * 100)
+        result.append(path)
+
+    return result
+
+
+@pytest.mark.usefixtures("populate_environment_snapshots")
+def test_cache_info_environment_snapshots(
+    script: PipTestEnvironment, cache_dir: str
+) -> None:
+    result = script.pip("cache", "info")
+
+    environments_dir = os.path.normcase(os.path.join(cache_dir, "environments"))
+    assert (
+        f"Installed environment snapshots location: {environments_dir}" in result.stdout
+    )
+    assert "Installed environment snapshots size: 200 bytes" in result.stdout
+
+
+def test_cache_purge_environment_snapshots(
+    script: PipTestEnvironment, populate_environment_snapshots: list[str]
+) -> None:
+    result = script.pip("cache", "purge", "--verbose")
+
+    for path in populate_environment_snapshots:
+        assert not os.path.exists(path)
+    assert "Files removed: 2" in result.stdout
@@ -656,6 +656,53 @@ def test_wheel_no_compiles_pyc(
     assert not any(exists)
 
 
+def test_wheel_compile_jobs_records_pyc(
+    script: PipTestEnvironment, shared_data: TestData, tmpdir: Path
+) -> None:
+    """
+    Test installing from wheel with --compile-jobs records the compiled files
+    """
+    shutil.copy(shared_data.packages / "simple.dist-0.1-py2.py3-none-any.whl", tmpdir)
+    script.pip(
+        "install",
+        "--compile-jobs=2",
+        "simple.dist==0.1",
+        "--no-index",
+        "--find-links",
+        tmpdir,
+    )
+    pyc_paths = list(script.site_packages_path.glob("simpledist/__pycache__/*.pyc"))
+    assert pyc_paths
+
+    record_path = script.site_packages_path / "simple.dist-0.1.dist-info" / "RECORD"
+    record = record_path.read_text()
+    for pyc_path in pyc_paths:
+        assert f"simpledist/__pycache__/{pyc_path.name},," in record
+
+
+def test_install_from_wheel_store(
+    script: PipTestEnvironment, shared_data: TestData, tmpdir: Path
+) -> None:
+    """
+    Test installing a wheel through the unpacked wheel store, twice
+    """
+    shutil.copy(shared_data.packages / "simple.dist-0.1-py2.py3-none-any.whl", tmpdir)
+    for _ in range(2):
+        script.pip(
+            "install",
+            "--force-reinstall",
+            "--use-feature=wheel-store",
+            "simple.dist==0.1",
+            "--no-index",
+            "--find-links",
+            tmpdir,
+        )
+    script.assert_installed(**{"simple.dist": "0.1"})
+
+    result = script.pip("cache", "info")
+    assert "Number of unpacked wheels: 1" in result.stdout
+
+
 def test_install_from_wheel_uninstalls_old_version(
     script: PipTestEnvironment, data: TestData
 ) -> None:
@@ -373,6 +373,49 @@ def test_outdated_respects_binary_options(
     ]
 
 
+@pytest.mark.parametrize("lookup_jobs", ["1", "3"])
+def test_outdated_lookup_jobs(script: PipTestEnvironment, lookup_jobs: str) -> None:
+    """Test --lookup-jobs does not change the packages reported by --outdated."""
+    for name in ("pkga", "pkgb", "pkgc"):
+        create_basic_wheel_for_package(script, name, "1.0")
+    create_basic_wheel_for_package(script, "pkga", "2.0")
+    create_basic_wheel_for_package(script, "pkgc", "3.0")
+    script.pip(
+        "install",
+        "--no-index",
+        "--find-links",
+        script.scratch_path,
+        "pkga==1.0",
+        "pkgb==1.0",
+        "pkgc==1.0",
+    )
+
+    result = script.pip(
+        "list",
+        "--no-index",
+        "--find-links",
+        script.scratch_path,
+        "--outdated",
+        "--lookup-jobs",
+        lookup_jobs,
+        "--format=json",
+    )
+    assert json.loads(result.stdout) == [
+        {
+            "name": "pkga",
+            "version": "1.0",
+            "latest_version": "2.0",
+            "latest_filetype": "wheel",
+        },
+        {
+            "name": "pkgc",
+            "version": "1.0",
+            "latest_version": "3.0",
+            "latest_filetype": "wheel",
+        },
+    ]
+
+
 @pytest.mark.parametrize(
     "binary_option",
     [
@@ -382,6 +382,40 @@ def test_pip_wheel_fail(script: PipTestEnvironment, data: TestData) -> None:
     assert result.returncode != 0
 
 
+def test_pip_wheel_build_jobs(script: PipTestEnvironment, data: TestData) -> None:
+    """
+    Test 'pip wheel --build-jobs' builds wheels in parallel and reports them
+    in order, with each build's output kept together.
+    """
+    result = script.pip(
+        "wheel",
+        "--no-build-isolation",
+        "--no-index",
+        "-f",
+        data.find_links,
+        "--build-jobs",
+        "3",
+        "simple==3.0",
+        "wheelbroken==0.1",
+        "simple2==3.0",
+        expect_error=True,
+    )
+    for name in ("simple", "simple2"):
+        wheel_file_name = f"{name}-3.0-py{pyversion[0]}-none-any.whl"
+        result.did_create(script.scratch / wheel_file_name)
+    assert re.search(
+        r"Building wheel for simple .*"
+        r"Created wheel for simple: .*"
+        r"Building wheel for wheelbroken .*"
+        r"Building wheel for simple2 .*"
+        r"Created wheel for simple2: ",
+        result.stdout,
+        re.S,
+    ), result.stdout
+    assert "Successfully built simple simple2" in result.stdout, result.stdout
+    assert "Failed to build wheelbroken" in result.stdout, result.stdout
+
+
 def test_pip_wheel_source_deps(script: PipTestEnvironment, data: TestData) -> None:
     """
     Test 'pip wheel' finds and builds source archive dependencies
@@ -25,6 +25,9 @@ class FakeStream:
     def release_conn(self) -> None:
         pass
 
+    def close(self) -> None:
+        pass
+
 
 class MockResponse(Response):
     request: MockRequest  # type: ignore[assignment]
@@ -0,0 +1,195 @@
+import json
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from pip._internal.metadata import (
+    environment_snapshots,
+    get_environment,
+    select_backend,
+)
+from pip._internal.metadata._snapshot import get_location_snapshot
+
+pytestmark = pytest.mark.skipif(
+    select_backend().NAME != "importlib",
+    reason="Snapshots are only used by the importlib.metadata backend",
+)
+
+
+@pytest.fixture(autouse=True)
+def default_environment(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # Only the locations of the default environment outside the temporary
+    # directory are snapshotted.
+    monkeypatch.syspath_prepend(str(tmp_path / "site-packages"))
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path / "tmp"))
+
+
+def _make_dist_info(site_packages: Path, name: str, version: str) -> Path:
+    info_dir = site_packages / f"{name}-{version}.dist-info"
+    info_dir.mkdir(parents=True)
+    info_dir.joinpath("METADATA").write_text(
+        f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\n"
+        "Requires-Dist: dep>=1\nRequires-Dist: extra-dep; extra == 'test'\n"
+        "Provides-Extra: Test\n"
+    )
+    info_dir.joinpath("INSTALLER").write_text("pip\n")
+    return info_dir
+
+
+def _snapshot_files(directory: Path) -> list[Path]:
+    return list(directory.iterdir()) if directory.exists() else []
+
+
+def test_snapshot_matches_metadata(tmp_path: Path) -> None:
+    site_packages = tmp_path / "site-packages"
+    _make_dist_info(site_packages, "Pkg_A", "1.0")
+    snapshots = tmp_path / "environments"
+
+    expected = get_environment([str(site_packages)]).get_distribution("pkg-a")
+    assert expected is not None
+    for _ in range(2):
+        with environment_snapshots(str(snapshots)):
+            dist = get_environment([str(site_packages)]).get_distribution("pkg-a")
+            assert dist is not None
+            assert dist.raw_name == expected.raw_name == "Pkg_A"
+            assert dist.raw_version == "1.0"
+            assert list(dist.iter_dependencies()) == list(expected.iter_dependencies())
+            assert list(dist.iter_dependencies(["test"])) == list(
+                expected.iter_dependencies(["test"])
+            )
+            assert list(dist.iter_provided_extras()) == ["test"]
+            assert dist.installer == "pip"
+            assert not dist.requested
+            assert dist.direct_url is None
+        assert len(_snapshot_files(snapshots)) == 1
+
+
+def test_snapshot_is_reused(tmp_path: Path) -> None:
+    site_packages = tmp_path / "site-packages"
+    info_dir = _make_dist_info(site_packages, "pkg", "1.0")
+    snapshots = tmp_path / "environments"
+
+    with environment_snapshots(str(snapshots)):
+        dist = get_environment([str(site_packages)]).get_distribution("pkg")
+        assert dist is not None
+        assert dist.raw_name == "pkg"
+    [snapshot_file] = _snapshot_files(snapshots)
+    data = json.loads(snapshot_file.read_text())
+    assert data["location"] == os.path.normcase(str(site_packages))
+    assert list(data["distributions"]) == [info_dir.name]
+
+    # Make the recorded name differ from the metadata: it is used as long as
+    # the .dist-info directory looks unchanged.
+    data["distributions"][info_dir.name]["raw_name"] = "from-snapshot"
+    snapshot_file.write_text(json.dumps(data))
+    with environment_snapshots(str(snapshots)):
+        dist = get_environment([str(site_packages)]).get_distribution("pkg")
+        assert dist is not None
+        assert dist.raw_name == "from-snapshot"
+
+
+def test_snapshot_is_updated(tmp_path: Path) -> None:
+    site_packages = tmp_path / "site-packages"
+    info_dir = _make_dist_info(site_packages, "pkg", "1.0")
+    _make_dist_info(site_packages, "other", "1.0")
+    snapshots = tmp_path / "environments"
+
+    with environment_snapshots(str(snapshots)):
+        env = get_environment([str(site_packages)])
+        assert not any(dist.requested for dist in env.iter_all_distributions())
+
+    info_dir.joinpath("REQUESTED").write_text("")
+    with environment_snapshots(str(snapshots)):
+        dist = get_environment([str(site_packages)]).get_distribution("pkg")
+        assert dist is not None
+        assert dist.requested
+
+    [snapshot_file] = _snapshot_files(snapshots)
+    data = json.loads(snapshot_file.read_text())
+    assert data["distributions"][info_dir.name]["files"]["REQUESTED"] == ""
+
+    # Distributions that are no longer installed are forgotten.
+    for path in info_dir.iterdir():
+        path.unlink()
+    info_dir.rmdir()
+    with environment_snapshots(str(snapshots)):
+        dist = get_environment([str(site_packages)]).get_distribution("other")
+        assert dist is not None
+        # Force the snapshot of the location to be rewritten.
+        snapshot = get_location_snapshot(str(site_packages))
+        assert snapshot is not None
+        snapshot._modified = True
+    data = json.loads(snapshot_file.read_text())
+    assert list(data["distributions"]) == ["other-1.0.dist-info"]
+
+
+def test_snapshot_disabled(tmp_path: Path) -> None:
+    site_packages = tmp_path / "site-packages"
+    _make_dist_info(site_packages, "pkg", "1.0")
+    assert get_location_snapshot(str(site_packages)) is None
+    dist = get_environment([str(site_packages)]).get_distribution("pkg")
+    assert dist is not None
+    assert dist.raw_name == "pkg"
+
+
+def test_snapshot_ignores_unreadable_file(tmp_path: Path) -> None:
+    site_packages = tmp_path / "site-packages"
+    _make_dist_info(site_packages, "pkg", "1.0")
+    snapshots = tmp_path / "environments"
+    with environment_snapshots(str(snapshots)):
+        snapshot = get_location_snapshot(str(site_packages))
+        assert snapshot is not None
+    Path(snapshot.path).parent.mkdir(parents=True)
+    Path(snapshot.path).write_text("not json")
+
+    with environment_snapshots(str(snapshots)):
+        dist = get_environment([str(site_packages)]).get_distribution("pkg")
+        assert dist is not None
+        assert dist.raw_name == "pkg"
+    data = json.loads(Path(snapshot.path).read_text())
+    assert list(data["distributions"]) == ["pkg-1.0.dist-info"]
+
+
+def test_snapshot_only_long_lived_locations(tmp_path: Path) -> None:
+    other = tmp_path / "other"
+    _make_dist_info(other, "pkg", "1.0")
+    temporary = tmp_path / "tmp" / "build-env"
+    _make_dist_info(temporary, "pkg", "1.0")
+    snapshots = tmp_path / "environments"
+
+    with environment_snapshots(str(snapshots)):
+        for location in [other, temporary]:
+            dist = get_environment([str(location)]).get_distribution("pkg")
+            assert dist is not None
+            assert get_location_snapshot(str(location)) is None
+    assert _snapshot_files(snapshots) == []
+
+
+def test_snapshot_of_removed_location_is_removed(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    site_packages = tmp_path / "site-packages"
+    _make_dist_info(site_packages, "pkg", "1.0")
+    removed = tmp_path / "removed"
+    info_dir = _make_dist_info(removed, "pkg", "1.0")
+    monkeypatch.syspath_prepend(str(removed))
+    snapshots = tmp_path / "environments"
+
+    with environment_snapshots(str(snapshots)):
+        dist = get_environment([str(removed)]).get_distribution("pkg")
+        assert dist is not None
+        assert dist.raw_name == "pkg"
+    [removed_snapshot] = _snapshot_files(snapshots)
+
+    for path in info_dir.iterdir():
+        path.unlink()
+    info_dir.rmdir()
+    removed.rmdir()
+    with environment_snapshots(str(snapshots)):
+        dist = get_environment([str(site_packages)]).get_distribution("pkg")
+        assert dist is not None
+        assert dist.raw_name == "pkg"
+    [snapshot_file] = _snapshot_files(snapshots)
+    assert snapshot_file != removed_snapshot
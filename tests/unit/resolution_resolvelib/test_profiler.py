@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from unittest import mock
+
+from pip._vendor.resolvelib import BaseReporter
+from pip._vendor.resolvelib import Resolver as RLResolver
+from pip._vendor.resolvelib.resolvers import RequirementInformation
+
+from pip._internal.req.constructors import install_req_from_line
+from pip._internal.resolution.resolvelib.base import Candidate, Requirement
+from pip._internal.resolution.resolvelib.factory import Factory
+from pip._internal.resolution.resolvelib.profiler import (
+    ProfilingProvider,
+    ProfilingReporter,
+    ResolverProfiler,
+    summarize_profile,
+)
+from pip._internal.resolution.resolvelib.provider import PipProvider
+
+
+def test_profiler_records_resolution(
+    factory: Factory, provider: PipProvider, tmp_path: Path
+) -> None:
+    profiler = ResolverProfiler()
+    reporter = mock.Mock(wraps=BaseReporter())
+    resolver = RLResolver(
+        ProfilingProvider(provider, profiler), ProfilingReporter(reporter, profiler)
+    )
+    collected = factory.collect_root_requirements(
+        [install_req_from_line("simplewheel<2")]
+    )
+    result = resolver.resolve(collected.requirements)
+    assert str(result.mapping["simplewheel"].version) == "1.0"
+    # Events are passed on to the wrapped reporter.
+    reporter.pinning.assert_called_once_with(result.mapping["simplewheel"])
+
+    path = tmp_path / "profile.json"
+    profiler.write(str(path))
+    data = json.loads(path.read_text())
+    first_round = data["rounds"][0]
+    assert first_round["chosen"] == "simplewheel"
+    assert first_round["pinned"] == "simplewheel 1.0"
+    assert first_round["seconds"] >= 0
+    assert data["calls"]["find_matches"]["count"] >= 1
+    assert data["calls"]["get_dependencies"]["count"] == 1
+    assert data["projects"]["simplewheel"]["candidates"] == 1
+    assert data["projects"]["simplewheel"]["pins"] == 1
+    assert data["peak"] == {"criteria": 1, "pinned": 1}
+
+
+def test_profiler_records_backtracking() -> None:
+    def make_info(
+        req: str, parent: str | None
+    ) -> RequirementInformation[Requirement, Candidate]:
+        requirement = mock.Mock()
+        requirement.format_for_error.return_value = req
+        if parent is not None:
+            name, version = parent.split()
+            parent_candidate = mock.Mock(version=version)
+            parent_candidate.name = name
+            return RequirementInformation(requirement, parent_candidate)
+        return RequirementInformation(requirement, None)
+
+    causes = [make_info("dd<1.2", "ee 2.0"), make_info("dd>=1.5", None)]
+    candidate = mock.Mock(version="1.5")
+    candidate.name = "dd"
+
+    profiler = ResolverProfiler()
+    reporter = ProfilingReporter(BaseReporter(), profiler)
+    reporter.starting_round(0)
+    reporter.rejecting_candidate(mock.Mock(information=causes), candidate)
+    reporter.resolving_conflicts(causes)
+    # The resolution fails before the round ends.
+    data = profiler.to_json()
+
+    expected_causes = ["ee 2.0 depends on dd<1.2", "The user requested dd>=1.5"]
+    assert data["rounds"] == [
+        {
+            "round": 0,
+            "seconds": mock.ANY,
+            "narrowed": None,
+            "chosen": "dd",
+            "pinned": None,
+            "rejected": [{"candidate": "dd 1.5", "causes": expected_causes}],
+            "backtrack_causes": expected_causes,
+        }
+    ]
+    assert data["projects"]["dd"]["rejected"] == 1
+
+    summary = summarize_profile(data)
+    assert summary[0].endswith("over 1 rounds, backtracking 1 times.")
+    assert "  dd: 1 candidates rejected, 0 pinned" in summary
+
+
+def test_profiler_counts_find_matches_once() -> None:
+    provider = mock.Mock()
+    candidates = [mock.Mock(), mock.Mock()]
+    provider.find_matches.return_value = iter(candidates)
+    profiler = ResolverProfiler()
+    matches = ProfilingProvider(provider, profiler).find_matches("dd", {}, {})
+    assert list(matches) == candidates
+    assert bool(matches)
+
+    # Going through the matches adds to the time, not to the number of calls.
+    assert profiler.to_json()["calls"]["find_matches"]["count"] == 1
+
+
+def test_summarize_cached_profile() -> None:
+    profiler = ResolverProfiler()
+    profiler.cached = True
+    assert summarize_profile(profiler.to_json()) == [
+        "The result of a previous resolution was reused from the cache."
+    ]
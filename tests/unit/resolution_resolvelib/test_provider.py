@@ -3,11 +3,16 @@ from __future__ import annotations
 import math
 from collections.abc import Iterable, Sequence
 from typing import TYPE_CHECKING
+from unittest import mock
 
 import pytest
 
+from pip._vendor.packaging.specifiers import SpecifierSet
 from pip._vendor.resolvelib.resolvers import RequirementInformation
 
+from pip._internal.index.package_finder import CandidateEvaluator
+from pip._internal.models.candidate import InstallationCandidate
+from pip._internal.models.link import Link, MetadataFile
 from pip._internal.req.constructors import install_req_from_req_string
 from pip._internal.resolution.resolvelib.base import Candidate
 from pip._internal.resolution.resolvelib.candidates import REQUIRES_PYTHON_IDENTIFIER
@@ -20,6 +25,7 @@ from pip._internal.resolution.resolvelib.requirements import (
     ExplicitRequirement,
     SpecifierRequirement,
 )
+from pip._internal.utils.hashes import Hashes
 
 if TYPE_CHECKING:
     from pip._vendor.resolvelib.providers import Preference
@@ -292,3 +298,97 @@ def test_conflict_promoted_get_preference(provider: PipProvider) -> None:
     pref_other = provider.get_preference("normal-pkg", {}, {}, info, [])
 
     assert pref < pref_other
+
+
+def test_get_dependencies_prefetches_index_pages(
+    provider: PipProvider, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Index pages of all dependencies are requested before any is returned."""
+    dependencies = [
+        build_req_info("dep-a").requirement,
+        build_explicit_req_info("https://example.com/dep-b.whl").requirement,
+        build_req_info("dep-c").requirement,
+    ]
+    candidate = FakeCandidate()
+    monkeypatch.setattr(
+        candidate, "iter_dependencies", lambda with_requires: iter(dependencies)
+    )
+    prefetched: list[str] = []
+    monkeypatch.setattr(
+        provider._factory._finder, "prefetch_index_pages", prefetched.append
+    )
+
+    iterator = iter(provider.get_dependencies(candidate))
+    assert prefetched == []
+    assert next(iterator) is dependencies[0]
+    assert prefetched == ["dep-a", "dep-c"]
+    assert list(iterator) == dependencies[1:]
+
+
+def test_get_dependencies_prefetches_top_metadata(
+    provider: PipProvider, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The metadata files of the top candidates of the dependencies are fetched
+    in the background, and used when the top candidate is built.
+    """
+    factory = provider._factory
+    preparer = factory.preparer
+    metadata = b"Metadata-Version: 2.1\nName: dep-a\nVersion: 3.0\n"
+    links = [
+        Link(
+            f"https://example.com/dep_a-{version}-py3-none-any.whl",
+            metadata_file_data=MetadataFile(None),
+        )
+        for version in ("1.0", "2.0", "3.0")
+    ]
+    icans = [
+        InstallationCandidate("dep-a", f"{i + 1}.0", link)
+        for i, link in enumerate(links)
+    ]
+    evaluator = CandidateEvaluator.create("dep-a")
+    monkeypatch.setattr(preparer, "prefetch_metadata", True)
+    monkeypatch.setattr(
+        factory._finder,
+        "find_best_candidate",
+        lambda project_name, specifier, hashes: evaluator.compute_best_candidate(icans),
+    )
+    monkeypatch.setattr(factory._finder, "prefetch_index_pages", lambda name: None)
+    monkeypatch.setattr(
+        preparer, "_download_metadata_file", mock.Mock(return_value=metadata)
+    )
+
+    dependencies = [build_req_info("dep-a").requirement]
+    candidate = FakeCandidate()
+    monkeypatch.setattr(
+        candidate, "iter_dependencies", lambda with_requires: iter(dependencies)
+    )
+    assert list(provider.get_dependencies(candidate)) == dependencies
+
+    # The two newest versions are being fetched before they are asked for.
+    assert set(preparer._prefetched_metadata) == {
+        f"https://example.com/dep_a-{version}-py3-none-any.whl.metadata"
+        for version in ("2.0", "3.0")
+    }
+
+    # Looking up the candidates also fetches the top one before building it.
+    for future in preparer._prefetched_metadata.values():
+        future.result()
+    preparer._prefetched_metadata.clear()
+
+    def make_candidate(link: Link, **kwargs: object) -> Candidate:
+        metadata_link = link.metadata_link()
+        assert metadata_link is not None
+        # Building the candidate uses the prefetched metadata file.
+        assert preparer._take_prefetched_metadata(metadata_link) == metadata
+        return FakeCandidate()
+
+    monkeypatch.setattr(factory, "_make_candidate_from_link", make_candidate)
+    found = factory._iter_found_candidates(
+        [install_req_from_req_string("dep-a")],
+        SpecifierSet(),
+        Hashes(),
+        prefers_installed=False,
+        incompatible_ids=set(),
+    )
+    assert next(iter(found))
+    preparer.cancel_prefetch()
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import json
+import os
+from pathlib import Path
 from typing import cast
 from unittest import mock
 
@@ -9,7 +12,9 @@ from pip._vendor.packaging.utils import canonicalize_name
 from pip._vendor.resolvelib.resolvers import Result
 from pip._vendor.resolvelib.structs import DirectedGraph
 
+from pip._internal.cache import ResolutionCache
 from pip._internal.index.package_finder import PackageFinder
+from pip._internal.models.search_scope import SearchScope
 from pip._internal.operations.prepare import RequirementPreparer
 from pip._internal.req.constructors import install_req_from_line
 from pip._internal.req.req_set import RequirementSet
@@ -105,6 +110,68 @@ def test_new_resolver_get_installation_order(
     assert req_strs == ordered_reqs
 
 
+@pytest.mark.parametrize(
+    "edges, levels",
+    [
+        (
+            [(None, "require-simple"), ("require-simple", "simple")],
+            [["simple==3.0"], ["require-simple==1.0"]],
+        ),
+        (
+            [(None, "meta"), ("meta", "simple"), ("meta", "simple2")],
+            [["simple2==3.0", "simple==3.0"], ["meta==1.0"]],
+        ),
+        (
+            [
+                (None, "toporequires"),
+                (None, "toporequires2"),
+                (None, "toporequires3"),
+                (None, "toporequires4"),
+                ("toporequires2", "toporequires"),
+                ("toporequires3", "toporequires"),
+                ("toporequires4", "toporequires"),
+                ("toporequires4", "toporequires2"),
+                ("toporequires4", "toporequires3"),
+            ],
+            [
+                ["toporequires==0.0.1"],
+                ["toporequires3==0.0.1", "toporequires2==0.0.1"],
+                ["toporequires4==0.0.1"],
+            ],
+        ),
+        (
+            # A cycle gives both packages the same weight.
+            [(None, "a"), ("a", "b"), ("b", "a")],
+            [["b==1.0"], ["a==1.0"]],
+        ),
+    ],
+)
+def test_new_resolver_get_installation_levels(
+    resolver: Resolver,
+    edges: list[tuple[str | None, str | None]],
+    levels: list[list[str]],
+) -> None:
+    graph = _make_graph(edges)
+
+    # Mapping values and criteria are not used in test, so we stub them out.
+    mapping = {vertex: None for vertex in graph if vertex is not None}
+    resolver._result = Result(mapping, graph, criteria=None)  # type: ignore
+
+    reqset = RequirementSet()
+    for level in levels:
+        for r in level:
+            reqset.add_named_requirement(install_req_from_line(r))
+
+    ireq_levels = resolver.get_installation_levels(reqset)
+    assert [[str(r.req) for r in level] for level in ireq_levels] == levels
+
+    # Computing the order prunes the graph, so start again from a fresh one.
+    resolver._result = Result(mapping, _make_graph(edges), criteria=None)  # type: ignore
+    assert [ireq for level in ireq_levels for ireq in level] == (
+        resolver.get_installation_order(reqset)
+    )
+
+
 @pytest.mark.parametrize(
     "name, edges, requirement_keys, expected_weights",
     [
@@ -301,3 +368,103 @@ def test_new_resolver_topological_weights(
 
     weights = get_topological_weights(graph, requirement_keys)
     assert weights == expected_weights
+
+
+@pytest.fixture
+def cached_resolver(
+    preparer: RequirementPreparer, finder: PackageFinder, tmp_path: Path
+) -> Resolver:
+    # Links found in local directories can't be checked for changes.
+    finder.search_scope = SearchScope([], ["https://example.com/simple/"], False)
+    return Resolver(
+        preparer=preparer,
+        finder=finder,
+        wheel_cache=None,
+        make_install_req=mock.Mock(),
+        use_user_site=False,
+        ignore_dependencies=False,
+        only_dependencies=False,
+        ignore_installed=False,
+        ignore_requires_python=False,
+        force_reinstall=False,
+        upgrade_strategy="to-satisfy-only",
+        resolution_cache=ResolutionCache(os.fspath(tmp_path)),
+    )
+
+
+def test_new_resolver_resolution_cache(
+    cached_resolver: Resolver, tmp_path: Path
+) -> None:
+    candidate = mock.Mock(project_name="simple")
+    candidate.name = "simple"
+    candidate.get_install_requirement.return_value = None
+    graph = _make_graph([(None, "simple")])
+    pages = [("https://example.com/simple/simple/", "simple", "v1")]
+    pin = {"kind": "link", "name": "simple", "version": "1.0"}
+
+    finder = cached_resolver._finder
+    factory = cached_resolver.factory
+    resolve = mock.Mock(return_value=Result({"simple": candidate}, graph, {}))
+
+    with (
+        mock.patch.object(cached_resolver, "_resolve", resolve),
+        mock.patch.object(finder, "get_fetched_index_pages", return_value=pages),
+        mock.patch.object(
+            finder, "check_index_pages", return_value=True
+        ) as check_index_pages,
+        mock.patch.object(factory, "pin_candidate", return_value=pin),
+        mock.patch.object(
+            factory, "make_candidate_from_pin", return_value=candidate
+        ) as make_candidate_from_pin,
+    ):
+        root_reqs = [install_req_from_line("simple==1.0")]
+        cached_resolver.resolve(root_reqs, check_supported_wheels=True)
+        assert resolve.call_count == 1
+
+        # The result is reused while the pages are unchanged, and the profile
+        # says so.
+        profile_path = tmp_path / "profile.json"
+        cached_resolver._profile_path = os.fspath(profile_path)
+        cached_resolver.resolve(root_reqs, check_supported_wheels=True)
+        assert resolve.call_count == 1
+        assert json.loads(profile_path.read_text())["cached"] is True
+        cached_resolver._profile_path = None
+        check_index_pages.assert_called_once_with([list(pages[0])])
+        make_candidate_from_pin.assert_called_once()
+        pinned, _, root_ireqs = make_candidate_from_pin.call_args.args
+        assert (pinned, root_ireqs) == (pin, {"simple": root_reqs[0]})
+        assert cached_resolver._result is not None
+        assert cached_resolver._result.mapping == {"simple": candidate}
+        assert set(cached_resolver._result.graph.iter_edges()) == {(None, "simple")}
+
+        # Other requirements are resolved separately.
+        cached_resolver.resolve(
+            [install_req_from_line("simple==2.0")], check_supported_wheels=True
+        )
+        assert resolve.call_count == 2
+
+        check_index_pages.return_value = False
+        cached_resolver.resolve(root_reqs, check_supported_wheels=True)
+        assert resolve.call_count == 3
+
+
+@pytest.mark.parametrize(
+    "requirement",
+    [
+        "simple @ https://example.com/simple-1.0.tar.gz",
+        "https://example.com/simple-1.0.tar.gz",
+        "simple==1.0 --hash=sha256:" + "0" * 64,
+    ],
+)
+def test_new_resolver_resolution_cache_uncacheable(
+    cached_resolver: Resolver, requirement: str
+) -> None:
+    line, _, hash_option = requirement.partition(" --hash=")
+    ireq = install_req_from_line(
+        line,
+        hash_options=(
+            {"sha256": [hash_option.partition(":")[2]]} if hash_option else None
+        ),
+    )
+    assert cached_resolver._get_cache_key([ireq]) is None
+    assert cached_resolver._get_cache_key([install_req_from_line("simple")])
@@ -1,3 +1,4 @@
+import hashlib
 import os
 from pathlib import Path
 from typing import NoReturn
@@ -6,11 +7,25 @@ import pytest
 
 from pip._vendor.packaging.tags import Tag, interpreter_name, interpreter_version
 
-from pip._internal.cache import SimpleWheelCache, WheelCache, _hash_dict
+from pip._internal.cache import (
+    FileHashCache,
+    IndexPageCache,
+    MetadataCache,
+    NotFoundCache,
+    ResolutionCache,
+    SimpleWheelCache,
+    UnpackedWheelStore,
+    WheelCache,
+    _hash_dict,
+)
+from pip._internal.exceptions import HashMismatch
 from pip._internal.models.link import Link
+from pip._internal.utils.hashes import Hashes
 from pip._internal.utils.misc import ensure_dir
 from pip._internal.utils.urls import path_to_url
 
+from tests.lib.wheel import make_wheel
+
 
 def test_falsey_path_none() -> None:
     wc = WheelCache("")
@@ -152,3 +167,247 @@ def test_wheel_cache_entry_none_for_existing_directory(tmpdir: Path) -> None:
 
     assert wc.get_cache_entry(link, "example", supported_tags) is None
     assert wc.get(link, "example", supported_tags) is link
+
+
+def test_metadata_cache(tmp_path: Path) -> None:
+    mc = MetadataCache(os.fspath(tmp_path))
+    link = Link(f"https://g.c/pkg-1.0-py3-none-any.whl#sha256={'a' * 64}")
+    assert mc.get(link) is None
+
+    mc.set(link, b"Name: pkg\n")
+    assert mc.get(link) == b"Name: pkg\n"
+    # The file is the key, wherever it is served from.
+    mirror_link = Link(f"https://mirror/pkg-1.0-py3-none-any.whl#sha256={'a' * 64}")
+    assert mc.get(mirror_link) == b"Name: pkg\n"
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://g.c/pkg-1.0-py3-none-any.whl",
+        f"https://g.c/pkg-1.0-py3-none-any.whl#md5={'a' * 32}",
+        f"file:///pkg-1.0-py3-none-any.whl#sha256={'a' * 64}",
+    ],
+)
+def test_metadata_cache_needs_remote_sha256(tmp_path: Path, url: str) -> None:
+    mc = MetadataCache(os.fspath(tmp_path))
+    link = Link(url)
+    assert mc.get_path_for_link(link) is None
+    mc.set(link, b"Name: pkg\n")
+    assert mc.get(link) is None
+
+
+def test_metadata_cache_trim(tmp_path: Path) -> None:
+    mc = MetadataCache(os.fspath(tmp_path))
+    links = [
+        Link(f"https://g.c/pkg-{i}.0-py3-none-any.whl#sha256={str(i) * 64}")
+        for i in range(3)
+    ]
+    for i, link in enumerate(links):
+        mc.set(link, b"x" * 100)
+        path = mc.get_path_for_link(link)
+        assert path is not None
+        os.utime(path, (i, i))
+    # Reading an entry makes it the most recently used one.
+    mc.get(links[0])
+
+    removed = mc.trim(250)
+
+    assert removed == [mc.get_path_for_link(links[1])]
+    assert mc.get(links[0]) is not None
+    assert mc.get(links[1]) is None
+    assert mc.get(links[2]) is not None
+
+
+def test_index_page_cache(tmp_path: Path) -> None:
+    cache = IndexPageCache(os.fspath(tmp_path))
+    url = "https://example.com/simple/pkg/"
+    assert cache.get(url, '"etag-1"') is None
+
+    cache.set(url, '"etag-1"', [["https://example.com/pkg-1.0.tar.gz"]])
+    assert cache.get(url, '"etag-1"') == [["https://example.com/pkg-1.0.tar.gz"]]
+    assert cache.get("https://example.com/simple/other/", '"etag-1"') is None
+
+    # A changed page replaces the entry of its URL.
+    assert cache.get(url, '"etag-2"') is None
+    cache.set(url, '"etag-2"', [])
+    assert cache.get(url, '"etag-2"') == []
+    assert cache.get(url, '"etag-1"') is None
+    path = cache.get_path_for_url(url)
+    assert path.startswith(cache.directory)
+    assert os.listdir(os.path.dirname(path)) == [os.path.basename(path)]
+
+
+def test_index_page_cache_ignores_invalid_entry(tmp_path: Path) -> None:
+    cache = IndexPageCache(os.fspath(tmp_path))
+    url = "https://example.com/simple/pkg/"
+    path = Path(cache.get_path_for_url(url))
+    path.parent.mkdir(parents=True)
+    path.write_text("not json")
+    assert cache.get(url, '"etag"') is None
+
+
+def test_index_page_cache_disabled() -> None:
+    cache = IndexPageCache("")
+    cache.set("https://example.com/simple/pkg/", '"etag"', [])
+    assert cache.get("https://example.com/simple/pkg/", '"etag"') is None
+
+
+def test_not_found_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = NotFoundCache(os.fspath(tmp_path), ttl=60)
+    url = "https://example.com/simple/pkg/"
+    assert not cache.is_missing(url)
+
+    monkeypatch.setattr("time.time", lambda: 1000.0)
+    cache.add(url)
+    assert cache.is_missing(url)
+    assert not cache.is_missing("https://example.com/simple/other/")
+    assert cache.get_path_for_url(url).startswith(cache.directory)
+
+    # The entry expires after ttl seconds.
+    monkeypatch.setattr("time.time", lambda: 1059.0)
+    assert cache.is_missing(url)
+    monkeypatch.setattr("time.time", lambda: 1060.0)
+    assert not cache.is_missing(url)
+    # An entry from the future, e.g. after the clock changed, is not trusted.
+    monkeypatch.setattr("time.time", lambda: 900.0)
+    assert not cache.is_missing(url)
+
+
+def test_not_found_cache_disabled() -> None:
+    cache = NotFoundCache("")
+    cache.add("https://example.com/simple/pkg/")
+    assert not cache.is_missing("https://example.com/simple/pkg/")
+
+
+def test_resolution_cache(tmp_path: Path) -> None:
+    cache = ResolutionCache(os.fspath(tmp_path))
+    assert cache.get("key") is None
+
+    data = {"pages": [["https://example.com/simple/pkg/", "pkg", "v1"]]}
+    cache.set("key", data)
+    assert cache.get("key") == data
+    assert cache.get("other") is None
+    assert cache.get_path_for_key("key").startswith(cache.directory)
+
+    # Corrupt entries are ignored.
+    Path(cache.get_path_for_key("key")).write_text("[")
+    assert cache.get("key") is None
+
+
+def test_resolution_cache_disabled() -> None:
+    cache = ResolutionCache("")
+    cache.set("key", {"pages": []})
+    assert cache.get("key") is None
+
+
+def _sha256_hashes(data: bytes) -> Hashes:
+    return Hashes({"sha256": [hashlib.sha256(data).hexdigest()]})
+
+
+def test_file_hash_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = FileHashCache(os.fspath(tmp_path / "cache"))
+    path = os.fspath(tmp_path / "pkg-1.0.tar.gz")
+    Path(path).write_bytes(b"contents")
+    assert cache.get(path) == {}
+
+    cache.check_against_path(_sha256_hashes(b"contents"), path)
+    assert cache.get(path) == {"sha256": hashlib.sha256(b"contents").hexdigest()}
+    cache_path = cache.get_path_for_file(path)
+    assert cache_path.startswith(cache.directory)
+    assert os.listdir(os.path.dirname(cache_path)) == [os.path.basename(cache_path)]
+
+    # The file isn't read again while it is unchanged.
+    def fail(*args: object) -> NoReturn:
+        raise AssertionError("the file was hashed again")
+
+    with monkeypatch.context() as m:
+        m.setattr("pip._internal.cache.read_chunks", fail)
+        cache.check_against_path(_sha256_hashes(b"contents"), path)
+        assert cache.sha256(path) == hashlib.sha256(b"contents").hexdigest()
+
+    # Other algorithms are added to the record.
+    sha512 = hashlib.sha512(b"contents").hexdigest()
+    cache.check_against_path(Hashes({"sha512": [sha512]}), path)
+    assert set(cache.get(path)) == {"sha256", "sha512"}
+
+    # A mismatch is reported with the hash of the file as it is now.
+    with pytest.raises(HashMismatch):
+        cache.check_against_path(_sha256_hashes(b"other"), path)
+
+
+def test_file_hash_cache_changed_file(tmp_path: Path) -> None:
+    cache = FileHashCache(os.fspath(tmp_path / "cache"))
+    path = os.fspath(tmp_path / "pkg-1.0.tar.gz")
+    Path(path).write_bytes(b"contents")
+    cache.check_against_path(_sha256_hashes(b"contents"), path)
+
+    # Replace the file with one of the same size and modification time.
+    stat = os.stat(path)
+    os.unlink(path)
+    Path(path).write_bytes(b"tampered")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert cache.get(path) == {}
+    with pytest.raises(HashMismatch):
+        cache.check_against_path(_sha256_hashes(b"contents"), path)
+    cache.check_against_path(_sha256_hashes(b"tampered"), path)
+
+
+def test_file_hash_cache_ignores_invalid_entry(tmp_path: Path) -> None:
+    cache = FileHashCache(os.fspath(tmp_path / "cache"))
+    path = os.fspath(tmp_path / "pkg-1.0.tar.gz")
+    Path(path).write_bytes(b"contents")
+    cache_path = Path(cache.get_path_for_file(path))
+    cache_path.parent.mkdir(parents=True)
+    cache_path.write_text("not json")
+    assert cache.get(path) == {}
+    cache.check_against_path(_sha256_hashes(b"contents"), path)
+
+
+def test_file_hash_cache_disabled(tmp_path: Path) -> None:
+    cache = FileHashCache("")
+    path = os.fspath(tmp_path / "pkg-1.0.tar.gz")
+    Path(path).write_bytes(b"contents")
+    cache.check_against_path(_sha256_hashes(b"contents"), path)
+    assert cache.get(path) == {}
+    with pytest.raises(HashMismatch):
+        cache.check_against_path(_sha256_hashes(b"other"), path)
+
+
+def test_unpacked_wheel_store(tmp_path: Path) -> None:
+    wheel_path = os.fspath(
+        make_wheel(
+            "simple", "1.0", extra_files={"simple/__init__.py": "x = 1\n"}
+        ).save_to_dir(tmp_path)
+    )
+    store = UnpackedWheelStore(os.fspath(tmp_path / "cache"))
+
+    path = store.unpack(wheel_path)
+    assert path == store.get_path_for_wheel(wheel_path)
+    assert path is not None
+    assert path.startswith(store.directory)
+    assert os.path.basename(path) == "simple-1.0-py2.py3-none-any.whl"
+    with open(os.path.join(path, "simple", "__init__.py")) as f:
+        assert f.read() == "x = 1\n"
+    assert os.path.isfile(os.path.join(path, "simple-1.0.dist-info", "RECORD"))
+
+    # A stored wheel is not unpacked again.
+    os.unlink(os.path.join(path, "simple", "__init__.py"))
+    assert store.unpack(wheel_path) == path
+    assert not os.path.exists(os.path.join(path, "simple", "__init__.py"))
+    assert os.listdir(os.path.dirname(path)) == [os.path.basename(path)]
+
+
+def test_unpacked_wheel_store_disabled(tmp_path: Path) -> None:
+    wheel_path = make_wheel("simple", "1.0").save_to_dir(tmp_path)
+    assert UnpackedWheelStore("").unpack(os.fspath(wheel_path)) is None
+
+
+def test_unpacked_wheel_store_broken_wheel(tmp_path: Path) -> None:
+    wheel_path = tmp_path / "simple-1.0-py3-none-any.whl"
+    wheel_path.write_bytes(b"not a zip file")
+    store = UnpackedWheelStore(os.fspath(tmp_path / "cache"))
+    assert store.unpack(os.fspath(wheel_path)) is None
+    path = store.get_path_for_wheel(os.fspath(wheel_path))
+    assert os.listdir(os.path.dirname(path)) == []
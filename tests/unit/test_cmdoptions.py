@@ -10,6 +10,7 @@ import pytest
 
 from pip._internal.cli.cmdoptions import (
     _convert_python_version,
+    _handle_positive_int,
     _handle_uploaded_prior_to,
 )
 from pip._internal.cli.main_parser import identify_python_interpreter
@@ -225,3 +226,24 @@ def test_handle_uploaded_prior_to_p0d_overrides_duration() -> None:
     assert p0d_result > p10d_result
     now = datetime.datetime.now(datetime.timezone.utc)
     assert abs((p0d_result - now).total_seconds()) < 1
+
+
+@pytest.mark.parametrize("value", [1, 8])
+def test_handle_positive_int(value: int) -> None:
+    option = Option("--download-concurrency", dest="download_concurrency")
+    parser = OptionParser()
+    parser.values = Values()
+
+    _handle_positive_int(option, "--download-concurrency", value, parser)
+
+    assert parser.values.download_concurrency == value
+
+
+@pytest.mark.parametrize("value", [0, -1])
+def test_handle_positive_int_invalid(value: int) -> None:
+    option = Option("--download-concurrency", dest="download_concurrency")
+    parser = OptionParser()
+    parser.values = Values()
+
+    with pytest.raises(SystemExit):
+        _handle_positive_int(option, "--download-concurrency", value, parser)
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+
+from pip._vendor.packaging.utils import canonicalize_name
+from pip._vendor.packaging.version import Version
+
+from pip._internal.commands import create_command
+from pip._internal.commands.list import ListCommand
+
+from tests.lib import TestData
+
+
+def _make_dist(name: str, version: str) -> mock.Mock:
+    dist = mock.Mock(spec=["canonical_name", "version"])
+    dist.canonical_name = canonicalize_name(name)
+    dist.version = Version(version)
+    return dist
+
+
+@pytest.mark.parametrize("lookup_jobs", ["1", "4"])
+def test_iter_packages_latest_infos(data: TestData, lookup_jobs: str) -> None:
+    command = create_command("list")
+    assert isinstance(command, ListCommand)
+    options, _ = command.parse_args(
+        ["--no-index", "--find-links", data.find_links, "--lookup-jobs", lookup_jobs]
+    )
+    packages = [
+        _make_dist("simple", "1.0"),
+        _make_dist("unknown-package", "1.0"),
+        _make_dist("simplewheel", "1.0"),
+        _make_dist("simple2", "3.0"),
+    ]
+
+    results = list(command.iter_packages_latest_infos(packages, options))
+
+    assert [
+        (dist.canonical_name, str(dist.latest_version), dist.latest_filetype)
+        for dist in results
+    ] == [
+        ("simple", "3.0", "sdist"),
+        ("simplewheel", "2.0", "wheel"),
+        ("simple2", "3.0", "sdist"),
+    ]
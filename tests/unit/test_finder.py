@@ -1,6 +1,8 @@
 import datetime
 import logging
+import threading
 from collections.abc import Iterable
+from typing import Any
 from unittest.mock import Mock, patch
 
 import pytest
@@ -592,6 +594,37 @@ def test_find_all_candidates_find_links_and_index(data: TestData) -> None:
     assert [str(v.version) for v in versions] == ["3.0", "2.0", "1.0", "1.0"]
 
 
+def test_find_all_candidates_indexes_concurrently() -> None:
+    """With several index jobs, the pages of all indexes are fetched at once,
+    and their candidates are still found in the order of the indexes."""
+    second_requested = threading.Event()
+
+    def get_simple_response(url: str, **kwargs: Any) -> Mock:
+        if url.startswith("https://first.example"):
+            # Only returns once the other index was queried in the meantime.
+            assert second_requested.wait(timeout=5)
+            filename = "abc-1.0.tar.gz"
+        else:
+            second_requested.set()
+            filename = "abc-2.0.tar.gz"
+        content = f'<html><body><a href="/{filename}">{filename}</a></body></html>'
+        return Mock(
+            content=content.encode(), url=url, headers={"Content-Type": "text/html"}
+        )
+
+    finder = make_test_finder(
+        index_urls=["https://first.example/simple", "https://second.example/simple"]
+    )
+    finder._link_collector.index_jobs = 2
+    with patch(
+        "pip._internal.index.collector._get_simple_response",
+        side_effect=get_simple_response,
+    ):
+        versions = finder.find_all_candidates("abc")
+    finder.cancel_prefetch()
+    assert [str(v.version) for v in versions] == ["1.0", "2.0"]
+
+
 class TestPackageFinderUploadedPriorTo:
     """Test PackageFinder integration with uploaded_prior_to functionality.
 
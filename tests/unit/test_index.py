@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import datetime
+import itertools
 import logging
+from unittest import mock
 
 import pytest
 
@@ -9,6 +11,7 @@ from pip._vendor.packaging.specifiers import SpecifierSet
 from pip._vendor.packaging.tags import Tag
 from pip._vendor.packaging.utils import canonicalize_name
 
+from pip._internal.exceptions import UnsupportedWheel
 from pip._internal.index.collector import LinkCollector
 from pip._internal.index.package_finder import (
     CandidateEvaluator,
@@ -22,6 +25,7 @@ from pip._internal.index.package_finder import (
     _find_name_version_sep,
     filter_unallowed_hashes,
 )
+from pip._internal.models.candidate import InstallationCandidate
 from pip._internal.models.link import Link
 from pip._internal.models.release_control import ReleaseControl
 from pip._internal.models.search_scope import SearchScope
@@ -657,6 +661,62 @@ class TestCandidateEvaluator:
         assert result.applicable_candidates == []
         assert result.best_candidate is None
 
+    def test_compute_best_candidate__ranks_lazily(self) -> None:
+        """
+        Test that only the newest version is ranked to find the best candidate.
+        """
+
+        def make_candidate(filename: str) -> InstallationCandidate:
+            version = filename.split("-")[1].removesuffix(".tar.gz")
+            link = Link(f"https://example.com/{filename}")
+            return InstallationCandidate("mypackage", version, link)
+
+        candidates = [
+            make_candidate("mypackage-1.0-py3-none-any.whl"),
+            # Not supported, but it isn't needed either.
+            make_candidate("mypackage-1.0-cp27-cp27m-win32.whl"),
+            make_candidate("mypackage-2.0.tar.gz"),
+            make_candidate("mypackage-2.0-py3-none-any.whl"),
+            make_candidate("mypackage-1.5.tar.gz"),
+        ]
+        evaluator = CandidateEvaluator.create("my-project")
+        result = evaluator.compute_best_candidate(candidates)
+
+        with mock.patch.object(
+            evaluator, "_tag_key", wraps=evaluator._tag_key
+        ) as tag_key:
+            assert result.best_candidate is candidates[3]
+            first_two = list(itertools.islice(result.iter_applicable(), 2))
+        assert first_two == [candidates[3], candidates[2]]
+        assert {c.args[0] for c in tag_key.call_args_list} == {
+            candidates[2],
+            candidates[3],
+        }
+
+        with pytest.raises(UnsupportedWheel):
+            list(result.iter_applicable())
+
+    def test_compute_best_candidate__same_as_sorting(self) -> None:
+        """
+        Test that the lazy ranking matches sorting all the candidates.
+        """
+        candidates = [
+            make_mock_candidate("1.0"),
+            make_mock_candidate("3.0", yanked_reason="bad metadata"),
+            make_mock_candidate("2.0"),
+            make_mock_candidate("1.0"),
+            make_mock_candidate("2.0.0", hex_digest=(64 * "a")),
+            make_mock_candidate("2.0"),
+        ]
+        hashes = Hashes({"sha256": [64 * "a"]})
+        evaluator = CandidateEvaluator.create("my-project", hashes=hashes)
+        result = evaluator.compute_best_candidate(candidates)
+
+        expected = evaluator.get_applicable_candidates(candidates)
+        assert result.applicable_candidates == expected
+        assert list(result.iter_applicable()) == expected[::-1]
+        assert result.best_candidate is evaluator.sort_best_candidate(expected)
+
     @pytest.mark.parametrize(
         "hex_digest, expected",
         [
@@ -994,6 +1054,29 @@ class TestPackageFinder:
         assert evaluator._specifier is specifier
         assert evaluator._supported_tags == [Tag("py36", "none", "any")]
 
+    def test_get_link_filter_tags(self, caplog: pytest.LogCaptureFixture) -> None:
+        target_python = TargetPython()
+        target_python._valid_tags = [Tag("py36", "none", "any")]
+        link_collector = LinkCollector(
+            session=PipSession(),
+            search_scope=SearchScope([], [], False),
+        )
+        finder = PackageFinder(
+            link_collector=link_collector,
+            target_python=target_python,
+            allow_yanked=True,
+        )
+
+        caplog.set_level(logging.INFO)
+        tags = finder._get_link_filter_tags()
+        assert tags == frozenset([Tag("py36", "none", "any")])
+        # The same object is returned, so that pages parsed with it are cached.
+        assert finder._get_link_filter_tags() is tags
+
+        # Links are not skipped while parsing when their evaluation is logged.
+        caplog.set_level(logging.DEBUG)
+        assert finder._get_link_filter_tags() is None
+
 
 @pytest.mark.parametrize(
     "fragment, canonical_name, expected",
@@ -10,10 +10,15 @@ import pytest
 
 from pip._internal.utils.logging import (
     BrokenStdoutLoggingError,
+    DeferredRecord,
+    DeferredRecordFilter,
     IndentingFormatter,
     PipConsole,
     RichPipStreamHandler,
+    defer_logging,
     indent_log,
+    is_logging_deferred,
+    replay_logging,
 )
 
 logger = logging.getLogger(__name__)
@@ -201,3 +206,51 @@ class TestColorizedStreamHandler:
         # Sanity check that the log record was written, since flush() happens
         # after write().
         assert output.startswith("my error")
+
+
+class TestDeferLogging:
+    @pytest.fixture
+    def deferring_logger(self) -> Iterator[tuple[logging.Logger, StringIO]]:
+        stream = StringIO()
+        handler = logging.StreamHandler(stream)
+        handler.setFormatter(IndentingFormatter(fmt="%(message)s"))
+        handler.addFilter(DeferredRecordFilter())
+        # A second handler to check that records are only deferred once.
+        other_handler = logging.StreamHandler(StringIO())
+        other_handler.addFilter(DeferredRecordFilter())
+        deferring_logger = logging.getLogger(f"{__name__}.deferring")
+        deferring_logger.propagate = False
+        deferring_logger.setLevel(logging.INFO)
+        deferring_logger.addHandler(handler)
+        deferring_logger.addHandler(other_handler)
+        try:
+            yield deferring_logger, stream
+        finally:
+            deferring_logger.removeHandler(handler)
+            deferring_logger.removeHandler(other_handler)
+
+    def test_defer_logging(
+        self, deferring_logger: tuple[logging.Logger, StringIO]
+    ) -> None:
+        logger, stream = deferring_logger
+        records: list[DeferredRecord] = []
+
+        def thread_function() -> None:
+            with defer_logging(records):
+                assert is_logging_deferred()
+                logger.info("hello")
+                with indent_log():
+                    logger.info("world")
+            assert not is_logging_deferred()
+
+        thread = Thread(target=thread_function)
+        thread.start()
+        logger.info("main")
+        thread.join()
+
+        assert stream.getvalue() == "main\n"
+        assert len(records) == 2
+
+        with indent_log():
+            replay_logging(records)
+        assert stream.getvalue() == "main\n  hello\n    world\n"
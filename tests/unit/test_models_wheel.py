@@ -3,7 +3,7 @@ import pytest
 from pip._vendor.packaging.tags import Tag
 
 from pip._internal.exceptions import InvalidWheelFilename
-from pip._internal.models.wheel import Wheel
+from pip._internal.models.wheel import Wheel, get_wheel
 from pip._internal.utils import compatibility_tags
 
 
@@ -251,6 +251,28 @@ class TestWheelFile:
         with pytest.raises(ValueError):
             w.support_index_min(tags=[])
 
+    def test_find_most_preferred_tag(self) -> None:
+        tag_to_priority = {
+            Tag("py2", "none", "TEST"): 0,
+            Tag("py2", "TEST", "any"): 1,
+            Tag("py2", "none", "any"): 2,
+        }
+        w = Wheel("simple-0.1-py2-none-any.whl")
+        assert w.find_most_preferred_tag([], tag_to_priority) == 2
+        # The result is remembered for the same mapping only.
+        tag_to_priority[Tag("py2", "none", "any")] = 5
+        assert w.find_most_preferred_tag([], tag_to_priority) == 2
+        assert w.find_most_preferred_tag([], dict(tag_to_priority)) == 5
+        with pytest.raises(ValueError):
+            w.find_most_preferred_tag([], {})
+
+    def test_get_wheel_caching(self) -> None:
+        w = get_wheel("simple-0.1-py2-none-any.whl")
+        assert w.version == "0.1"
+        assert get_wheel("simple-0.1-py2-none-any.whl") is w
+        with pytest.raises(InvalidWheelFilename):
+            get_wheel("simple-0.1_1-py2-none-any.whl")
+
     def test_version_underscore_conversion(self) -> None:
         """
         Test that underscore versions are now invalid (no longer converted)
@@ -1,16 +1,35 @@
+import io
 import os
+import threading
 from pathlib import Path
 from unittest.mock import Mock
 
 import pytest
 
+from pip._vendor import msgpack
 from pip._vendor.cachecontrol.caches import FileCache
 
-from pip._internal.network.cache import SafeFileCache
+from pip._internal.network.cache import SafeFileCache, SingleFileCache
 
 from tests.lib.filesystem import chmod
 
 
+def cc_metadata(**headers: str) -> bytes:
+    """Return cachecontrol's metadata for a response with the given headers."""
+    data = {
+        "response": {
+            "body": b"",
+            "headers": {k.replace("_", "-"): v for k, v in headers.items()},
+            "status": 200,
+            "version": 11,
+            "reason": "OK",
+            "decode_content": True,
+        },
+        "vary": {},
+    }
+    return b"cc=4," + msgpack.dumps(data, use_bin_type=True)
+
+
 @pytest.fixture
 def cache_tmpdir(tmpdir: Path) -> Path:
     cache_dir = tmpdir.joinpath("cache")
@@ -113,3 +132,211 @@ class TestSafeFileCache:
             cache = SafeFileCache(os.fspath(cache_tmpdir))
             cache.set(key, b"bar")
         assert (os.stat(cache._get_cache_path(key)).st_mode & 0o777) == 0o600
+
+
+class TestSingleFileCache:
+    def test_cache_roundtrip(self, cache_tmpdir: Path) -> None:
+        cache = SingleFileCache(os.fspath(cache_tmpdir))
+        assert cache.get("test key") is None
+        cache.set("test key", b"a test string")
+        # Body hasn't been stored yet, so the entry isn't valid yet
+        assert cache.get("test key") is None
+        assert cache.get_body("test key") is None
+
+        cache.set_body("test key", b"body")
+        assert cache.get("test key") == b"a test string"
+        body = cache.get_body("test key")
+        assert body is not None
+        with body:
+            assert body.read() == b"body"
+
+        # Both parts of the entry are in a single file.
+        assert os.listdir(os.path.dirname(cache._get_cache_path("test key"))) == [
+            os.path.basename(cache._get_cache_path("test key"))
+        ]
+        cache.delete("test key")
+        assert cache.get("test key") is None
+        assert cache.get_body("test key") is None
+
+    def test_cache_roundtrip_body_first(self, cache_tmpdir: Path) -> None:
+        cache = SingleFileCache(os.fspath(cache_tmpdir))
+        cache.set_body_from_io("test key", io.BytesIO(b"a test string"))
+        assert cache.get("test key") is None
+        assert cache.get_body("test key") is None
+
+        cache.set("test key", b"metadata")
+        assert cache.get("test key") == b"metadata"
+        body = cache.get_body("test key")
+        assert body is not None
+        with body:
+            assert body.read() == b"a test string"
+
+    def test_set_keeps_body(self, cache_tmpdir: Path) -> None:
+        """Updating the metadata only, as done when a response is revalidated,
+        keeps the body."""
+        cache = SingleFileCache(os.fspath(cache_tmpdir))
+        old_metadata = cc_metadata(ETag='"1"', Content_Length="4", Date="old")
+        cache.set("test key", old_metadata)
+        cache.set_body("test key", b"body")
+        # cachecontrol keeps the Content-Length of the stored response.
+        new_metadata = cc_metadata(ETag='"1"', Content_Length="4", Date="new")
+        cache.set("test key", new_metadata)
+
+        assert cache.get("test key") == new_metadata
+        body = cache.get_body("test key")
+        assert body is not None
+        with body:
+            assert body.read() == b"body"
+
+    @pytest.mark.parametrize(
+        "old_metadata, new_metadata",
+        [
+            (cc_metadata(ETag='"1"'), cc_metadata(ETag='"2"')),
+            (cc_metadata(Date="old"), cc_metadata(Date="new")),
+            (b"old metadata", b"new metadata"),
+        ],
+    )
+    def test_set_discards_other_body(
+        self, cache_tmpdir: Path, old_metadata: bytes, new_metadata: bytes
+    ) -> None:
+        """Metadata of another response isn't served with the old body while
+        the new body hasn't been stored."""
+        cache = SingleFileCache(os.fspath(cache_tmpdir))
+        cache.set("test key", old_metadata)
+        cache.set_body("test key", b"old body")
+
+        cache.set("test key", new_metadata)
+        assert cache.get("test key") is None
+        assert cache.get_body("test key") is None
+
+        cache.set_body("test key", b"new body")
+        assert cache.get("test key") == new_metadata
+        body = cache.get_body("test key")
+        assert body is not None
+        with body:
+            assert body.read() == b"new body"
+
+    def test_get_body_matches_get(self, cache_tmpdir: Path) -> None:
+        """The body returned after get() belongs with the returned metadata,
+        even if the entry is replaced in between."""
+        cache = SingleFileCache(os.fspath(cache_tmpdir))
+        cache.set("test key", b"metadata 1")
+        cache.set_body("test key", b"body 1")
+
+        assert cache.get("test key") == b"metadata 1"
+        cache.set_body("test key", b"body 2")
+        body = cache.get_body("test key")
+        assert body is not None
+        with body:
+            assert body.read() == b"body 1"
+
+    def test_invalid_entry(self, cache_tmpdir: Path) -> None:
+        cache = SingleFileCache(os.fspath(cache_tmpdir))
+        path = cache._get_cache_path("test key")
+        os.makedirs(os.path.dirname(path))
+        with open(path, "wb") as f:
+            f.write(b"not a cache entry")
+
+        assert cache.get("test key") is None
+        assert cache.get_body("test key") is None
+        cache.set("test key", b"metadata")
+        cache.set_body("test key", b"body")
+        assert cache.get("test key") == b"metadata"
+
+    @pytest.mark.skipif("sys.platform == 'win32'")
+    def test_safe_no_perms(self, cache_tmpdir: Path) -> None:
+        with chmod(cache_tmpdir, 000):
+            cache = SingleFileCache(os.fspath(cache_tmpdir), max_size=1)
+            cache.set("foo", b"bar")
+            cache.set_body("foo", b"bar")
+            cache.get("foo")
+            cache.get_body("foo")
+            cache.delete("foo")
+            cache.trim(0)
+            cache.close()
+
+    def _populate(
+        self, cache: SingleFileCache, keys: list[str], start: int = 0
+    ) -> list[str]:
+        paths = []
+        for mtime, key in enumerate(keys, start):
+            cache.set(key, b"x" * 50)
+            cache.set_body(key, b"x" * 50)
+            path = cache._get_cache_path(key)
+            # The last entry is the most recently used one.
+            os.utime(path, (mtime, mtime))
+            paths.append(path)
+        return paths
+
+    def test_trim(self, cache_tmpdir: Path) -> None:
+        cache = SingleFileCache(os.fspath(cache_tmpdir))
+        a, b, c = self._populate(cache, ["a", "b", "c"])
+        entry_size = os.path.getsize(a)
+
+        assert cache.trim(3 * entry_size) == []
+        assert cache.trim(2 * entry_size) == [a]
+        assert not os.path.exists(a)
+        assert os.path.exists(b)
+        assert os.path.exists(c)
+
+    def test_get_marks_entry_as_used(self, cache_tmpdir: Path) -> None:
+        cache = SingleFileCache(os.fspath(cache_tmpdir))
+        a, b, c = self._populate(cache, ["a", "b", "c"])
+        entry_size = os.path.getsize(a)
+
+        assert cache.get("a") is not None
+        body = cache.get_body("a")
+        assert body is not None
+        body.close()
+        assert cache.trim(2 * entry_size) == [b]
+
+    def test_close_trims(self, cache_tmpdir: Path) -> None:
+        cache = SingleFileCache(os.fspath(cache_tmpdir), max_size=1000)
+        paths = self._populate(cache, [str(i) for i in range(7)])
+        entry_size = os.path.getsize(paths[0])
+        # Nothing needs to be removed yet.
+        cache.close()
+        assert all(os.path.exists(path) for path in paths)
+
+        cache = SingleFileCache(os.fspath(cache_tmpdir), max_size=1000)
+        paths += self._populate(cache, ["7", "8", "9"], start=7)
+        cache.close()
+        # The cache is trimmed a bit below its maximum size.
+        kept = [path for path in paths if os.path.exists(path)]
+        assert kept == paths[-(900 // entry_size) :]
+
+        # Closing again does nothing, since nothing was written.
+        os.utime(paths[-1], (0, 0))
+        cache.close()
+        assert os.path.exists(paths[-1])
+
+    def test_trims_while_writing(self, cache_tmpdir: Path) -> None:
+        cache = SingleFileCache(os.fspath(cache_tmpdir), max_size=1000)
+        paths = self._populate(cache, [str(i) for i in range(20)])
+        entry_size = os.path.getsize(paths[-1])
+        # The cache doesn't wait to be closed to stay within its maximum size.
+        kept = [path for path in paths if os.path.exists(path)]
+        assert len(kept) * entry_size <= 1000
+        assert kept == paths[-len(kept) :]
+
+    def test_concurrent_writes_are_counted(self, cache_tmpdir: Path) -> None:
+        cache = SingleFileCache(os.fspath(cache_tmpdir), max_size=10**6)
+        cache._write_size(0)
+
+        def write(thread: int) -> None:
+            for i in range(20):
+                cache.set(f"{thread}-{i}", b"x" * 50)
+
+        threads = [threading.Thread(target=write, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        entry_size = os.path.getsize(cache._get_cache_path("0-0"))
+        assert cache._bytes_written == 80 * entry_size
+
+    def test_close_without_max_size(self, cache_tmpdir: Path) -> None:
+        cache = SingleFileCache(os.fspath(cache_tmpdir))
+        paths = self._populate(cache, [str(i) for i in range(10)])
+        cache.close()
+        assert all(os.path.exists(path) for path in paths)
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import hashlib
 import logging
 import sys
+import threading
+from collections.abc import Callable, Iterator, Mapping
 from pathlib import Path
-from typing import TYPE_CHECKING, BinaryIO
+from typing import TYPE_CHECKING, Any, BinaryIO
 from unittest.mock import MagicMock, call, patch
 
 import pytest
@@ -14,6 +17,7 @@ from pip._vendor.urllib3.exceptions import ProtocolError, ProxyError, ReadTimeou
 from pip._internal.exceptions import (
     ConnectionFailedError,
     ConnectionTimeoutError,
+    HashMismatch,
     IncompleteDownloadError,
     ProxyConnectionError,
     SSLMissingError,
@@ -29,8 +33,9 @@ from pip._internal.network.download import (
 )
 from pip._internal.network.session import PipSession
 from pip._internal.network.utils import HEADERS
+from pip._internal.utils.hashes import Hashes
 
-from tests.lib.requests_mocks import BrokenStream, MockResponse
+from tests.lib.requests_mocks import BrokenStream, FakeStream, MockResponse
 from tests.lib.server import Body, MockServer
 
 if TYPE_CHECKING:
@@ -383,6 +388,59 @@ def test_downloader(
     _http_get_mock.assert_has_calls(calls)
 
 
+def _response(body: bytes, status_code: int, size: int) -> MockResponse:
+    response = MockResponse(body)
+    response.headers.update({"content-length": str(size)})
+    response.status_code = status_code
+    return response
+
+
+_CONTENT = b"0cfa7e9d-1868-4dd7-9fb3-f2561d5dfd89"
+
+
+@pytest.mark.parametrize(
+    "responses",
+    [
+        pytest.param(lambda: [_response(_CONTENT, 200, 36)], id="complete"),
+        pytest.param(
+            lambda: [
+                _response(_CONTENT[:24], 200, 36),
+                _response(_CONTENT[24:], 206, 12),
+            ],
+            id="resumed",
+        ),
+        pytest.param(
+            lambda: [
+                _response(b"not-the-same-file-at-all", 200, 36),
+                _response(_CONTENT, 200, 36),
+            ],
+            id="restarted",
+        ),
+    ],
+)
+@pytest.mark.parametrize("matches", [True, False])
+def test_downloader_checks_hashes_while_downloading(
+    responses: Callable[[], list[MockResponse]], matches: bool, tmpdir: Path
+) -> None:
+    session = PipSession(resume_retries=1)
+    link = Link("http://example.com/foo.tgz")
+    downloader = Downloader(session, "on")
+    digest = hashlib.sha256(_CONTENT if matches else b"other").hexdigest()
+    hashes = Hashes({"sha256": [digest]})
+
+    with (
+        patch.object(Downloader, "_http_get", MagicMock(side_effect=responses())),
+        # The hashes are computed from the downloaded data, not the saved file.
+        patch.object(Hashes, "check_against_path", side_effect=AssertionError),
+    ):
+        if matches:
+            filepath, _ = downloader(link, str(tmpdir), hashes)
+            assert Path(filepath).read_bytes() == _CONTENT
+        else:
+            with pytest.raises(HashMismatch):
+                downloader(link, str(tmpdir), hashes)
+
+
 def _incomplete_response() -> MockResponse:
     response = MockResponse(b"partial")
     response.headers.update({"content-length": "12"})
@@ -399,9 +457,9 @@ def test_incomplete_download_is_closed_before_removal(tmpdir: Path) -> None:
     downloads: list[_FileDownload] = []
 
     def record_download(
-        link: Link, output_file: BinaryIO, size: int | None
+        link: Link, output_file: BinaryIO, size: int | None, hashers: dict[str, Any]
     ) -> _FileDownload:
-        download = _FileDownload(link, output_file, size)
+        download = _FileDownload(link, output_file, size, hashers=hashers)
         downloads.append(download)
         return download
 
@@ -694,3 +752,202 @@ def test_resumed_download_caching(tmpdir: Path) -> None:
         cache_files = list(cache_dir.rglob("*"))
         # Should have cache files (both metadata and body files)
         assert len([f for f in cache_files if f.is_file()]) == 2
+
+
+@pytest.mark.parametrize("concurrency", [1, 3])
+def test_downloader_batch(concurrency: int, tmpdir: Path) -> None:
+    session = PipSession(resume_retries=0)
+    downloader = Downloader(session, "off", concurrency=concurrency)
+    links = [Link(f"http://example.com/pkg{i}.tgz") for i in range(5)]
+
+    def fake_http_get(link: Link) -> MockResponse:
+        resp = MockResponse(link.filename.encode())
+        resp.headers.update({"content-length": str(len(link.filename))})
+        resp.status_code = 200
+        return resp
+
+    with patch.object(Downloader, "_http_get", side_effect=fake_http_get):
+        results = list(downloader.batch(links, str(tmpdir)))
+
+    # Results are reported in the order the links were given.
+    assert [link for link, _ in results] == links
+    for link, (filepath, _) in results:
+        assert filepath == str(tmpdir / link.filename)
+        with open(filepath, "rb") as f:
+            assert f.read() == link.filename.encode()
+
+
+def test_downloader_batch_resumes_concurrently(tmpdir: Path) -> None:
+    session = PipSession(resume_retries=1)
+    downloader = Downloader(session, "off", concurrency=2)
+    links = [Link("http://example.com/foo.tgz"), Link("http://example.com/bar.tgz")]
+
+    def fake_http_get(link: Link, headers: Mapping[str, str] = HEADERS) -> MockResponse:
+        if "Range" not in headers:
+            resp = MockResponse(b"0cfa7e9d-")
+            resp.headers.update({"content-length": "12"})
+            resp.status_code = 200
+        else:
+            resp = MockResponse(b"f25")
+            resp.headers.update({"content-length": "3"})
+            resp.status_code = 206
+        return resp
+
+    with patch.object(Downloader, "_http_get", side_effect=fake_http_get):
+        results = list(downloader.batch(links, str(tmpdir)))
+
+    for _, (filepath, _) in results:
+        with open(filepath, "rb") as f:
+            assert f.read() == b"0cfa7e9d-f25"
+
+
+@pytest.mark.parametrize("concurrency", [1, 2])
+def test_downloader_batch_checks_hashes(concurrency: int, tmpdir: Path) -> None:
+    session = PipSession(resume_retries=0)
+    links = [Link("http://example.com/foo.tgz"), Link("http://example.com/bar.tgz")]
+    downloader = Downloader(session, "off", concurrency=concurrency)
+    hashes = {
+        links[0]: Hashes({"sha256": [hashlib.sha256(_CONTENT).hexdigest()]}),
+        links[1]: Hashes({"sha256": [hashlib.sha256(b"other").hexdigest()]}),
+    }
+
+    def _http_get(link: Link) -> MockResponse:
+        return _response(_CONTENT, 200, 36)
+
+    with (
+        patch.object(Downloader, "_http_get", side_effect=_http_get),
+        pytest.raises(HashMismatch),
+    ):
+        list(downloader.batch(links, str(tmpdir), hashes))
+
+    with patch.object(Downloader, "_http_get", side_effect=_http_get):
+        results = list(
+            downloader.batch(links, str(tmpdir), {links[0]: hashes[links[0]]})
+        )
+    assert [link for link, _ in results] == links
+
+
+def test_downloader_batch_failure(tmpdir: Path) -> None:
+    session = PipSession(resume_retries=0)
+    downloader = Downloader(session, "off", concurrency=2)
+    links = [Link("http://example.com/foo.tgz"), Link("http://example.com/bar.tgz")]
+
+    with (
+        patch.object(
+            Downloader, "_http_get", MagicMock(return_value=_incomplete_response())
+        ),
+        pytest.raises(IncompleteDownloadError),
+    ):
+        list(downloader.batch(links, str(tmpdir)))
+
+
+class _GatedStream(FakeStream):
+    """A stream which waits for, or signals, another stream's progress."""
+
+    def __init__(
+        self,
+        contents: bytes,
+        wait: threading.Event | None = None,
+        notify: threading.Event | None = None,
+    ) -> None:
+        super().__init__(contents)
+        self._wait = wait
+        self._notify = notify
+
+    def stream(self, size: int, decode_content: bool | None = None) -> Iterator[bytes]:
+        if self._wait is not None:
+            self._wait.wait(timeout=5)
+        yield from super().stream(size, decode_content)
+
+    def close(self) -> None:
+        if self._notify is not None:
+            self._notify.set()
+
+
+def _range_server(
+    range_status: int = 206,
+    accept_ranges: str = "bytes",
+    gate: threading.Event | None = None,
+) -> Callable[..., MockResponse]:
+    """Serve _CONTENT, answering range requests with range_status.
+
+    If a gate is given, the first response is held back until the last range
+    has been sent, so that the segments arrive out of order.
+    """
+
+    def _http_get(link: Link, headers: Mapping[str, str] = HEADERS) -> MockResponse:
+        resp = MockResponse(_CONTENT)
+        resp.headers.update({"ETag": '"abc"', "Accept-Ranges": accept_ranges})
+        if "Range" not in headers or range_status != 206:
+            resp.raw = _GatedStream(_CONTENT, wait=gate)
+            resp.headers["content-length"] = str(len(_CONTENT))
+            return resp
+        assert headers["If-Range"] == '"abc"'
+        start, end = map(int, headers["Range"][len("bytes=") :].split("-"))
+        last = end + 1 == len(_CONTENT)
+        resp.raw = _GatedStream(
+            _CONTENT[start : end + 1], notify=gate if last else None
+        )
+        resp.headers["content-length"] = str(end + 1 - start)
+        resp.headers["Content-Range"] = f"bytes {start}-{end}/{len(_CONTENT)}"
+        resp.status_code = 206
+        return resp
+
+    return _http_get
+
+
+@pytest.mark.parametrize("hash_matches", [True, False])
+def test_downloader_segmented(hash_matches: bool, tmpdir: Path) -> None:
+    session = PipSession(download_segments=3, segmented_download_threshold=10)
+    downloader = Downloader(session, "off")
+    link = Link("http://example.com/foo.tgz")
+    digest = hashlib.sha256(_CONTENT if hash_matches else b"other").hexdigest()
+    hashes = Hashes({"sha256": [digest]})
+
+    _http_get = MagicMock(side_effect=_range_server(gate=threading.Event()))
+    with patch.object(Downloader, "_http_get", _http_get):
+        if hash_matches:
+            filepath, _ = downloader(link, str(tmpdir), hashes)
+        else:
+            with pytest.raises(HashMismatch):
+                downloader(link, str(tmpdir), hashes)
+            return
+
+    with open(filepath, "rb") as f:
+        assert f.read() == _CONTENT
+    ranges = sorted(c.args[1]["Range"] for c in _http_get.call_args_list[1:])
+    assert ranges == ["bytes=12-23", "bytes=24-35"]
+
+
+@pytest.mark.parametrize(
+    "segments, threshold, range_status, accept_ranges, expected_calls",
+    [
+        pytest.param(1, 10, 206, "bytes", 1, id="disabled"),
+        pytest.param(3, 100, 206, "bytes", 1, id="below-threshold"),
+        pytest.param(3, 10, 206, "none", 1, id="no-range-support"),
+        pytest.param(3, 10, 200, "bytes", 4, id="range-ignored"),
+    ],
+)
+def test_downloader_segmented_falls_back(
+    segments: int,
+    threshold: int,
+    range_status: int,
+    accept_ranges: str,
+    expected_calls: int,
+    tmpdir: Path,
+) -> None:
+    session = PipSession(
+        download_segments=segments, segmented_download_threshold=threshold
+    )
+    downloader = Downloader(session, "off")
+    link = Link("http://example.com/foo.tgz")
+    hashes = Hashes({"sha256": [hashlib.sha256(_CONTENT).hexdigest()]})
+
+    _http_get = MagicMock(side_effect=_range_server(range_status, accept_ranges))
+    with patch.object(Downloader, "_http_get", _http_get):
+        filepath, _ = downloader(link, str(tmpdir), hashes)
+
+    with open(filepath, "rb") as f:
+        assert f.read() == _CONTENT
+    # When the server ignores the ranges, the file is downloaded again whole.
+    assert _http_get.call_count == expected_calls
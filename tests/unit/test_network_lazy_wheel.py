@@ -1,4 +1,6 @@
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pytest
 
@@ -7,7 +9,9 @@ from pip._vendor.packaging.version import Version
 
 from pip._internal.exceptions import InvalidWheel
 from pip._internal.network.lazy_wheel import (
+    TAIL_SIZE,
     HTTPRangeRequestUnsupported,
+    LazyZipOverHTTP,
     dist_from_wheel_url,
 )
 from pip._internal.network.session import PipSession
@@ -15,6 +19,9 @@ from pip._internal.network.session import PipSession
 from tests.lib import TestData
 from tests.lib.server import MockServer, file_response
 
+if TYPE_CHECKING:
+    from _typeshed.wsgi import StartResponse, WSGIApplication, WSGIEnvironment
+
 MYPY_0_782_WHL = (
     "https://files.pythonhosted.org/packages/9d/65/"
     "b96e844150ce18b9892b155b780248955ded13a2581d31872e7daa90a503/"
@@ -43,6 +50,29 @@ def mypy_whl_no_range(mock_server: MockServer, shared_data: TestData) -> Iterato
     mock_server.stop()
 
 
+def range_response(path: Path, etag: str | None = None) -> "WSGIApplication":
+    def responder(
+        environ: "WSGIEnvironment", start_response: "StartResponse"
+    ) -> list[bytes]:
+        data = path.read_bytes()
+        spec = environ["HTTP_RANGE"].split("=", 1)[1]
+        first, last = spec.split("-")
+        if first:
+            start, end = int(first), int(last)
+        else:
+            start, end = max(0, len(data) - int(last)), len(data) - 1
+        headers = [
+            ("Content-Length", str(end - start + 1)),
+            ("Content-Range", f"bytes {start}-{end}/{len(data)}"),
+        ]
+        if etag is not None:
+            headers.append(("ETag", etag))
+        start_response("206 Partial Content", headers)
+        return [data[start : end + 1]]
+
+    return responder
+
+
 @pytest.mark.network
 def test_dist_from_wheel_url(session: PipSession) -> None:
     """Test if the acquired distribution contain correct information."""
@@ -69,3 +99,122 @@ def test_dist_from_wheel_url_not_zip(session: PipSession) -> None:
         dist_from_wheel_url(
             canonicalize_name("python"), "https://www.python.org/", session
         )
+
+
+def test_dist_from_wheel_url_range(
+    session: PipSession, mock_server: MockServer, shared_data: TestData
+) -> None:
+    """Test the metadata is read starting from the end of the file."""
+    mypy_whl = shared_data.packages / "mypy-0.782-py3-none-any.whl"
+    mock_server.set_responses([range_response(mypy_whl)] * 5)
+    mock_server.start()
+    url = f"http://{mock_server.host}:{mock_server.port}/{mypy_whl.name}"
+    try:
+        dist = dist_from_wheel_url(canonicalize_name("mypy"), url, session)
+    finally:
+        mock_server.stop()
+    assert dist.version == Version("0.782")
+    assert {str(d) for d in dist.iter_dependencies(["dmypy"])} == MYPY_0_782_REQS
+    ranges = [request["HTTP_RANGE"] for request in mock_server.get_requests()]
+    assert ranges[0] == f"bytes=-{TAIL_SIZE}"
+    assert len(ranges) == 5
+
+
+def test_dist_from_wheel_url_small_wheel(
+    session: PipSession, mock_server: MockServer, shared_data: TestData
+) -> None:
+    """Test a wheel smaller than the tail is read with a single request."""
+    wheel = shared_data.packages / "simplewheel-2.0-1-py2.py3-none-any.whl"
+    mock_server.set_responses([range_response(wheel)])
+    mock_server.start()
+    url = f"http://{mock_server.host}:{mock_server.port}/{wheel.name}"
+    try:
+        dist = dist_from_wheel_url(canonicalize_name("simplewheel"), url, session)
+    finally:
+        mock_server.stop()
+    assert dist.version == Version("2.0")
+    assert len(mock_server.get_requests()) == 1
+
+
+def test_dist_from_wheel_url_cached(
+    mock_server: MockServer, shared_data: TestData, tmp_path: Path
+) -> None:
+    """Test range responses are served from the HTTP cache."""
+    mypy_whl = shared_data.packages / "mypy-0.782-py3-none-any.whl"
+    mock_server.set_responses([range_response(mypy_whl, '"v1"')] * 5)
+    mock_server.start()
+    host = f"{mock_server.host}:{mock_server.port}"
+    url = f"http://{host}/{mypy_whl.name}"
+    session = PipSession(cache=str(tmp_path), trusted_hosts=[host])
+    try:
+        for _ in range(2):
+            dist = dist_from_wheel_url(canonicalize_name("mypy"), url, session)
+            assert dist.version == Version("0.782")
+    finally:
+        mock_server.stop()
+    assert len(mock_server.get_requests()) == 5
+
+
+def test_dist_from_wheel_url_cached_other_version(
+    mock_server: MockServer, shared_data: TestData, tmp_path: Path
+) -> None:
+    """Test cached ranges of another version of the file are not used."""
+    mypy_whl = shared_data.packages / "mypy-0.782-py3-none-any.whl"
+    etags = iter(['"v1"'] * 5 + ['"v2"'] * 5 + ['"v3"'] * 5)
+    ranges: list[str] = []
+
+    def responder(
+        environ: "WSGIEnvironment", start_response: "StartResponse"
+    ) -> Iterable[bytes]:
+        ranges.append(environ["HTTP_RANGE"].split("=", 1)[1])
+        return range_response(mypy_whl, next(etags))(environ, start_response)
+
+    mock_server.set_responses([responder] * 15)
+    mock_server.start()
+    host = f"{mock_server.host}:{mock_server.port}"
+    url = f"http://{host}/{mypy_whl.name}"
+    session = PipSession(cache=str(tmp_path), trusted_hosts=[host])
+    cache = session.get_adapter(url).cache  # type: ignore[attr-defined]
+    try:
+        dist_from_wheel_url(canonicalize_name("mypy"), url, session)
+        assert len(ranges) == 5
+
+        # The tail of the new version doesn't match the cached ranges, which
+        # are downloaded again.
+        cache.delete(f"{url}#range={ranges[0]}")
+        dist = dist_from_wheel_url(canonicalize_name("mypy"), url, session)
+        assert dist.version == Version("0.782")
+        assert ranges[5:] == ranges[:5]
+
+        # The cached tail doesn't match the ranges downloaded after it.
+        for byte_range in ranges[1:5]:
+            cache.delete(f"{url}#range={byte_range}")
+        with pytest.raises(HTTPRangeRequestUnsupported):
+            dist_from_wheel_url(canonicalize_name("mypy"), url, session)
+        assert len(ranges) == 11
+    finally:
+        mock_server.stop()
+
+
+@pytest.mark.parametrize(
+    "downloaded, needed, expected",
+    [
+        # Gaps separated by less than a chunk are fetched together.
+        ([(10, 19), (30, 39)], (0, 49), [(0, 49)]),
+        ([(10, 109)], (0, 149), [(0, 9), (110, 149)]),
+        ([(10, 19), (30, 129)], (0, 149), [(0, 29), (130, 149)]),
+        ([(0, 49)], (10, 19), []),
+    ],
+)
+def test_merge_coalesces_gaps(
+    downloaded: list[tuple[int, int]],
+    needed: tuple[int, int],
+    expected: list[tuple[int, int]],
+) -> None:
+    lazy_zip = LazyZipOverHTTP.__new__(LazyZipOverHTTP)
+    lazy_zip._chunk_size = 100
+    lazy_zip._left = [start for start, _ in downloaded]
+    lazy_zip._right = [end for _, end in downloaded]
+    start, end = needed
+    assert list(lazy_zip._merge(start, end, 0, len(downloaded))) == expected
+    assert lazy_zip._left == [min(start, *lazy_zip._left)]
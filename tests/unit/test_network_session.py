@@ -33,6 +33,7 @@ from pip._internal.exceptions import (
     SSLVerificationError,
 )
 from pip._internal.models.link import Link
+from pip._internal.network.cache import SingleFileCache
 from pip._internal.network.session import (
     HTTPAdapter,
     PipSession,
@@ -190,6 +191,21 @@ class TestPipSession:
         assert hasattr(session.adapters["http://example.com/"], "cache")
         assert hasattr(session.adapters["https://example.com/"], "cache")
 
+    def test_single_file_cache(self, tmpdir: Path) -> None:
+        session = PipSession(
+            cache=os.fspath(tmpdir.joinpath("test-cache")),
+            trusted_hosts=["example.com"],
+            single_file_cache=True,
+            cache_max_size=1000,
+        )
+
+        cache = session.adapters["https://"].cache  # type: ignore[attr-defined]
+        assert isinstance(cache, SingleFileCache)
+        assert cache.max_size == 1000
+        # The trusted hosts share the cache, so that it is only trimmed once.
+        adapter = session.adapters["https://example.com/"]
+        assert adapter.cache is cache  # type: ignore[attr-defined]
+
     def test_add_trusted_host(self) -> None:
         # Leave a gap to test how the ordering is affected.
         trusted_hosts = ["host1", "host3"]
@@ -1,3 +1,4 @@
+import hashlib
 import os
 import shutil
 from pathlib import Path
@@ -10,19 +11,24 @@ import pytest
 
 from pip._vendor.requests import Response
 
+from pip._internal.cache import FileHashCache, MetadataCache
 from pip._internal.exceptions import (
     HashMismatch,
     MetadataInvalid,
     SidecarMetadataInconsistent,
 )
 from pip._internal.metadata import BaseDistribution, get_metadata_distribution
-from pip._internal.models.link import Link
+from pip._internal.models.link import Link, MetadataFile
 from pip._internal.network.download import Downloader
 from pip._internal.network.session import PipSession
 from pip._internal.operations.prepare import (
+    RequirementPreparer,
     _check_sidecar_matches_wheel,
+    get_http_url,
     unpack_url,
 )
+from pip._internal.req.constructors import install_req_from_line
+from pip._internal.req.req_install import InstallRequirement
 from pip._internal.utils.hashes import Hashes
 
 from tests.lib import TestData
@@ -42,6 +48,7 @@ def test_unpack_url_with_urllib_response_without_content_type(data: TestData) ->
 
     session = Mock()
     session.resume_retries = 0
+    session.download_segments = 1
     session.get = _fake_session_get
     download = Downloader(session, progress_bar="on")
 
@@ -81,6 +88,7 @@ def test_download_http_url__no_directory_traversal(
 
     session = Mock()
     session.resume_retries = 0
+    session.download_segments = 1
     resp = MockResponse(contents)
     resp.url = mock_url
     resp.headers.update(
@@ -103,6 +111,29 @@ def test_download_http_url__no_directory_traversal(
     mock_raise_for_status.assert_called_once_with(resp)
 
 
+@patch("pip._internal.network.download.raise_for_status")
+def test_get_http_url_checks_hashes_while_downloading(
+    mock_raise_for_status: Mock, tmpdir: Path
+) -> None:
+    contents = b"downloaded"
+    link = Link("http://www.example.com/whatever.tgz")
+
+    session = Mock()
+    session.resume_retries = 0
+    session.download_segments = 1
+    session.get.side_effect = lambda *args, **kwargs: MockResponse(contents)
+    download = Downloader(session, progress_bar="on")
+
+    # The downloaded file isn't read again to check its hash.
+    with patch.object(Hashes, "check_against_path", side_effect=AssertionError):
+        good_hashes = Hashes({"sha256": [hashlib.sha256(contents).hexdigest()]})
+        file = get_http_url(link, download, hashes=good_hashes)
+        assert Path(file.path).read_bytes() == contents
+
+        with pytest.raises(HashMismatch):
+            get_http_url(link, download, hashes=Hashes({"sha256": ["0" * 64]}))
+
+
 @pytest.fixture
 def clean_project(tmpdir_factory: pytest.TempPathFactory, data: TestData) -> Path:
     tmpdir = tmpdir_factory.mktemp("clean_project")
@@ -148,6 +179,37 @@ class Test_unpack_url:
                 verbosity=0,
             )
 
+    def test_unpack_url_file_hash_cache(self, tmpdir: Path, data: TestData) -> None:
+        """
+        Test that the recorded hash of an unchanged local file is trusted
+        """
+        self.prep(tmpdir, data)
+        file_hash_cache = FileHashCache(os.fspath(tmpdir.joinpath("cache")))
+        hashes = Hashes(
+            {"sha256": [hashlib.sha256(self.dist_path.read_bytes()).hexdigest()]}
+        )
+        unpack_url(
+            self.dist_url,
+            self.build_dir,
+            self.no_download,
+            verbosity=0,
+            hashes=hashes,
+            file_hash_cache=file_hash_cache,
+        )
+        assert file_hash_cache.get(os.fspath(self.dist_path))
+
+        rmtree(self.build_dir)
+        with patch.object(Hashes, "check_against_hashers", side_effect=AssertionError):
+            unpack_url(
+                self.dist_url,
+                self.build_dir,
+                self.no_download,
+                verbosity=0,
+                hashes=hashes,
+                file_hash_cache=file_hash_cache,
+            )
+        assert os.path.isdir(os.path.join(self.build_dir, "simple"))
+
 
 def _metadata(*lines: str, name: str = "pkg", version: str = "1.0") -> str:
     metadata = [
@@ -288,3 +350,137 @@ class TestCheckSidecarMatchesWheel:
         wheel = _make_distribution(_metadata())
         with pytest.raises(MetadataInvalid):
             _check_sidecar_matches_wheel(self._req(), sidecar, wheel)
+
+
+def _make_preparer(session: Any, **kwargs: Any) -> RequirementPreparer:
+    options: dict[str, Any] = {
+        "build_dir": "build",
+        "download_dir": None,
+        "src_dir": "src",
+        "build_isolation": Mock(),
+        "build_isolation_installer": Mock(),
+        "check_build_deps": False,
+        "build_tracker": Mock(),
+        "session": session,
+        "progress_bar": "off",
+        "finder": Mock(),
+        "require_hashes": False,
+        "use_user_site": False,
+        "lazy_wheel": False,
+        "verbosity": 0,
+        "prefetch_metadata": True,
+        "legacy_resolver": False,
+        "allow_editables": True,
+    }
+    options.update(kwargs)
+    return RequirementPreparer(**options)
+
+
+class TestPrefetchMetadata:
+    metadata = b"Metadata-Version: 2.1\nName: simple\nVersion: 1.0\n"
+
+    def _link(self, fragment: str = "") -> Link:
+        return Link(
+            "https://example.com/simple-1.0-py3-none-any.whl" + fragment,
+            metadata_file_data=MetadataFile(None),
+        )
+
+    def test_prefetch_metadata_files(self) -> None:
+        session = Mock(resume_retries=0, download_segments=1)
+        session.get.return_value = MockResponse(self.metadata)
+        preparer = _make_preparer(session)
+        link = self._link()
+        metadata_link = link.metadata_link()
+        assert metadata_link is not None
+
+        preparer.prefetch_metadata_files([link, link])
+        preparer.cancel_prefetch()
+
+        session.get.assert_called_once_with(
+            "https://example.com/simple-1.0-py3-none-any.whl.metadata"
+        )
+        assert preparer._take_prefetched_metadata(metadata_link) == self.metadata
+        # Prefetched contents are only handed out once.
+        assert preparer._take_prefetched_metadata(metadata_link) is None
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"prefetch_metadata": False},
+            {"legacy_resolver": True},
+            {"require_hashes": True},
+        ],
+    )
+    def test_prefetch_metadata_files_disabled(self, kwargs: dict[str, Any]) -> None:
+        session = Mock(resume_retries=0, download_segments=1)
+        preparer = _make_preparer(session, **kwargs)
+        preparer.prefetch_metadata_files([self._link()])
+        session.get.assert_not_called()
+
+    def test_prefetch_metadata_files_skips_links_without_metadata(self) -> None:
+        session = Mock(resume_retries=0, download_segments=1)
+        preparer = _make_preparer(session)
+        preparer.prefetch_metadata_files(
+            [Link("https://example.com/simple-1.0-py3-none-any.whl")]
+        )
+        session.get.assert_not_called()
+
+    def test_prefetched_metadata_hash_mismatch(self) -> None:
+        session = Mock(resume_retries=0, download_segments=1)
+        session.get.return_value = MockResponse(self.metadata)
+        preparer = _make_preparer(session)
+        link = Link(
+            "https://example.com/simple-1.0-py3-none-any.whl",
+            metadata_file_data=MetadataFile({"sha256": "bogus"}),
+        )
+        metadata_link = link.metadata_link()
+        assert metadata_link is not None
+
+        preparer.prefetch_metadata_files([link])
+        preparer.cancel_prefetch()
+
+        # The failure is left for the regular code path to report.
+        assert preparer._take_prefetched_metadata(metadata_link) is None
+
+
+class TestMetadataCache:
+    metadata = b"Metadata-Version: 2.1\nName: simple\nVersion: 1.0\n"
+
+    def _req(self) -> tuple[InstallRequirement, Link]:
+        link = Link(
+            f"https://example.com/simple-1.0-py3-none-any.whl#sha256={'a' * 64}",
+            metadata_file_data=MetadataFile(None),
+        )
+        req = install_req_from_line("simple==1.0")
+        req.link = link
+        return req, link
+
+    def test_metadata_from_cache(self, tmp_path: Path) -> None:
+        session = Mock(resume_retries=0, download_segments=1)
+        metadata_cache = MetadataCache(os.fspath(tmp_path))
+        preparer = _make_preparer(session, metadata_cache=metadata_cache)
+        req, link = self._req()
+        metadata_cache.set(link, self.metadata)
+
+        dist = preparer._fetch_metadata_only(req)
+
+        assert dist is not None
+        assert dist.raw_name == "simple"
+        session.get.assert_not_called()
+
+    def test_metadata_saved_to_cache(self, tmp_path: Path) -> None:
+        session = Mock(resume_retries=0, download_segments=1)
+        session.get.return_value = MockResponse(self.metadata)
+        metadata_cache = MetadataCache(os.fspath(tmp_path))
+        preparer = _make_preparer(session, metadata_cache=metadata_cache)
+        req, link = self._req()
+        metadata_link = link.metadata_link()
+        assert metadata_link is not None
+
+        # Fetch the metadata file through the prefetching machinery, which
+        # does not need a real download.
+        preparer.prefetch_metadata_files([link])
+        preparer.cancel_prefetch()
+        assert preparer._fetch_metadata_only(req) is not None
+
+        assert metadata_cache.get(link) == self.metadata
@@ -4,8 +4,13 @@ import pytest
 
 from pip._vendor.packaging import specifiers
 from pip._vendor.packaging.requirements import Requirement
+from pip._vendor.packaging.version import InvalidVersion, Version
 
-from pip._internal.utils.packaging import check_requires_python, get_requirement
+from pip._internal.utils.packaging import (
+    check_requires_python,
+    get_requirement,
+    get_version,
+)
 
 
 @pytest.mark.parametrize(
@@ -43,3 +48,10 @@ def test_get_or_create_caching() -> None:
         assert getattr(from_helper, iattr) == getattr(freshly_made, iattr)
     assert get_requirement(teststr) is not Requirement(teststr)
     assert get_requirement(teststr) is get_requirement(teststr)
+
+
+def test_get_version_caching() -> None:
+    assert get_version("1.0") == Version("1.0")
+    assert get_version("1.0") is get_version("1.0")
+    with pytest.raises(InvalidVersion):
+        get_version("invalid")
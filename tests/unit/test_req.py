@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import contextlib
 import email.message
+import importlib.util
 import os
 import shutil
 import sys
@@ -9,7 +10,7 @@ import tempfile
 from collections.abc import Iterator
 from functools import partial
 from pathlib import Path
-from typing import cast
+from typing import Any, cast
 from unittest import mock
 
 import pytest
@@ -37,7 +38,7 @@ from pip._internal.models.link import Link
 from pip._internal.network.session import PipSession
 from pip._internal.operations.build.build_tracker import get_build_tracker
 from pip._internal.operations.prepare import RequirementPreparer
-from pip._internal.req import InstallRequirement, RequirementSet
+from pip._internal.req import InstallRequirement, RequirementSet, install_given_reqs
 from pip._internal.req.constructors import (
     _get_url_from_path,
     _looks_like_path,
@@ -910,6 +911,84 @@ class TestInstallRequirement:
         assert extended.user_supplied == req.user_supplied
 
 
+class TestInstallGivenReqs:
+    def _req(self, name: str, fail: bool = False) -> mock.Mock:
+        req = mock.Mock(should_reinstall=True, install_succeeded=None)
+        req.name = name
+
+        def install(**kwargs: object) -> None:
+            if fail:
+                raise InstallationError(f"cannot install {name}")
+            req.install_succeeded = True
+
+        req.install.side_effect = install
+        return req
+
+    def _install(
+        self, requirements: list[mock.Mock], levels: list[list[mock.Mock]]
+    ) -> list[str]:
+        installed = install_given_reqs(
+            cast(list[InstallRequirement], requirements),
+            root=None,
+            home=None,
+            prefix=None,
+            warn_script_location=False,
+            use_user_site=False,
+            pycompile=False,
+            progress_bar="off",
+            levels=cast(list[list[InstallRequirement]], levels),
+            install_jobs=2,
+        )
+        return [result.name for result in installed]
+
+    def test_install_levels(self) -> None:
+        a, b, c = self._req("a"), self._req("b"), self._req("c")
+        assert self._install([a, b, c], [[a, b], [c]]) == ["a", "b", "c"]
+        for req in (a, b, c):
+            req.install.assert_called_once()
+            req.uninstall.return_value.commit.assert_called_once_with()
+            req.uninstall.return_value.rollback.assert_not_called()
+
+    def test_install_levels_failure(self) -> None:
+        a, b, c = self._req("a"), self._req("b", fail=True), self._req("c")
+        with pytest.raises(InstallationError, match="cannot install b"):
+            self._install([a, b, c], [[a, b], [c]])
+        a.uninstall.return_value.commit.assert_called_once_with()
+        b.uninstall.return_value.rollback.assert_called_once_with()
+        b.uninstall.return_value.commit.assert_not_called()
+        c.uninstall.assert_not_called()
+        c.install.assert_not_called()
+
+    def test_install_failure_compiles_installed(self, tmp_path: Path) -> None:
+        source = tmp_path / "a.py"
+        source.write_text("x = 1\n")
+        record = tmp_path / "RECORD"
+        record.write_text("a.py,,\n")
+        a, b = self._req("a"), self._req("b", fail=True)
+
+        def install_a(**kwargs: Any) -> None:
+            kwargs["bytecode_compiler"].add(
+                os.fspath(record), os.fspath(tmp_path), [os.fspath(source)]
+            )
+            a.install_succeeded = True
+
+        a.install.side_effect = install_a
+        with pytest.raises(InstallationError, match="cannot install b"):
+            install_given_reqs(
+                cast(list[InstallRequirement], [a, b]),
+                root=None,
+                home=None,
+                prefix=None,
+                warn_script_location=False,
+                use_user_site=False,
+                pycompile=True,
+                progress_bar="off",
+            )
+        # a stays installed, so it is byte-compiled all the same.
+        assert os.path.exists(importlib.util.cache_from_source(os.fspath(source)))
+        assert "__pycache__/a." in record.read_text()
+
+
 @pytest.mark.parametrize(
     "req_str, expected",
     [
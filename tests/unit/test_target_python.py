@@ -126,3 +126,17 @@ class TestTargetPython:
         }
         actual = target_python.get_unsorted_tags()
         assert actual == {Tag("py2", "none", "any"), Tag("py3", "none", "any")}
+
+    def test_get_tag_priorities(self) -> None:
+        target_python = TargetPython(py_version_info=None)
+        target_python._valid_tags = [
+            Tag("py3", "none", "TEST"),
+            Tag("py3", "none", "any"),
+        ]
+        actual = target_python.get_tag_priorities()
+        assert actual == {
+            Tag("py3", "none", "TEST"): 0,
+            Tag("py3", "none", "any"): 1,
+        }
+        # The same mapping is returned every time.
+        assert target_python.get_tag_priorities() is actual
@@ -42,6 +42,7 @@ from pip._internal.utils.misc import (
     normalize_path,
     normalize_version_info,
     parse_netloc,
+    parse_size,
     redact_auth_from_requirement,
     redact_auth_from_url,
     redact_netloc,
@@ -1024,3 +1025,24 @@ def test_format_size(size: int, expected: str) -> None:
 )
 def test_tabulate(rows: list[tuple[str]], table: list[str], sizes: list[int]) -> None:
     assert tabulate(rows) == (table, sizes)
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("123", 123),
+        ("123 bytes", 123),
+        ("1.2 kB", 1200),
+        ("20kb", 20000),
+        ("1234.6 MB", 1234600000),
+        ("2 GB", 2000000000),
+    ],
+)
+def test_parse_size(value: str, expected: int) -> None:
+    assert parse_size(value) == expected
+
+
+@pytest.mark.parametrize("value", ["", "MB", "-1 MB", "12 TB", "1 kBytes"])
+def test_parse_size_invalid(value: str) -> None:
+    with pytest.raises(ValueError):
+        parse_size(value)
@@ -1,10 +1,15 @@
 import os
 from pathlib import Path
 
+import pytest
+
+from pip._internal.utils import filesystem
 from pip._internal.utils.filesystem import (
     _subdirs_without_generic,
+    clone_or_copy_file,
     subdirs_without_files,
     subdirs_without_wheels,
+    write_file_atomically,
 )
 
 
@@ -223,3 +228,42 @@ class TestSubdirsWithoutWheels:
         # All directories should be yielded since none have wheels
         assert len(result) == 4  # test_dir, a, a/b, c
         assert test_dir in result
+
+
+class TestCloneOrCopyFile:
+    def make_source(self, tmp_path: Path) -> Path:
+        src = tmp_path / "src"
+        src.write_text("contents")
+        src.chmod(0o755)
+        return src
+
+    def test_copy(self, tmp_path: Path) -> None:
+        src = self.make_source(tmp_path)
+        dest = tmp_path / "dest"
+        clone_or_copy_file(str(src), str(dest))
+        assert dest.read_text() == "contents"
+        assert not os.path.samefile(src, dest)
+        assert dest.stat().st_mode == src.stat().st_mode
+
+        # Modifying the copy leaves the source alone.
+        dest.write_text("changed")
+        assert src.read_text() == "contents"
+
+    def test_copy_when_clone_fails(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(filesystem, "_reflink", lambda src, dest: False)
+        src = self.make_source(tmp_path)
+        dest = tmp_path / "dest"
+        clone_or_copy_file(str(src), str(dest))
+        assert dest.read_text() == "contents"
+        assert dest.stat().st_mode == src.stat().st_mode
+
+
+def test_write_file_atomically(tmp_path: Path) -> None:
+    path = tmp_path / "a" / "b" / "file"
+    write_file_atomically(str(path), b"first")
+    write_file_atomically(str(path), b"second")
+    assert path.read_bytes() == b"second"
+    # No temporary file is left behind.
+    assert os.listdir(path.parent) == ["file"]
@@ -17,6 +17,7 @@ import pytest
 from pip._vendor.packaging.requirements import Requirement
 from pip._vendor.packaging.utils import canonicalize_name
 
+from pip._internal.cache import UnpackedWheelStore
 from pip._internal.exceptions import InstallationError
 from pip._internal.locations import get_scheme
 from pip._internal.models.direct_url import (
@@ -344,6 +345,123 @@ class TestInstallUnpackedWheel:
         requested_path = os.path.join(self.dest_dist_info, "REQUESTED")
         assert os.path.isfile(requested_path)
 
+    def read_record(self) -> str:
+        with open(os.path.join(self.dest_dist_info, "RECORD")) as f:
+            return f.read()
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_deferred_bytecode_compilation(
+        self, data: TestData, tmpdir: Path, jobs: int
+    ) -> None:
+        (tmpdir / "inline").mkdir()
+        (tmpdir / "deferred").mkdir()
+        self.prep(data, tmpdir / "inline")
+        wheel.install_wheel(
+            self.name,
+            self.wheelpath,
+            scheme=self.scheme,
+            req_description=str(self.req),
+        )
+        expected_record = self.read_record()
+        assert "sample/__pycache__/__init__." in expected_record
+
+        self.prep(data, tmpdir / "deferred")
+        compiler = wheel.BytecodeCompiler(jobs=jobs)
+        wheel.install_wheel(
+            self.name,
+            self.wheelpath,
+            scheme=self.scheme,
+            req_description=str(self.req),
+            bytecode_compiler=compiler,
+        )
+        pycache = os.path.join(self.scheme.purelib, "sample", "__pycache__")
+        assert not os.path.exists(pycache)
+        assert "__pycache__" not in self.read_record()
+
+        compiler.compile()
+        assert os.listdir(pycache)
+        assert self.read_record() == expected_record
+
+    def test_deferred_bytecode_compilation_disabled(
+        self, data: TestData, tmpdir: Path
+    ) -> None:
+        self.prep(data, tmpdir)
+        compiler = wheel.BytecodeCompiler()
+        wheel.install_wheel(
+            self.name,
+            self.wheelpath,
+            scheme=self.scheme,
+            req_description=str(self.req),
+            pycompile=False,
+            bytecode_compiler=compiler,
+        )
+        compiler.compile()
+        assert "__pycache__" not in self.read_record()
+
+    def test_install_from_wheel_store(self, data: TestData, tmpdir: Path) -> None:
+        self.prep(data, tmpdir)
+        store = UnpackedWheelStore(os.path.join(tmpdir, "cache"))
+        wheel.install_wheel(
+            self.name,
+            self.wheelpath,
+            scheme=self.scheme,
+            req_description=str(self.req),
+            wheel_store=store,
+        )
+        self.assert_installed(0o644)
+
+        unpacked = store.get_path_for_wheel(self.wheelpath)
+        installed = os.path.join(self.scheme.purelib, "sample", "__init__.py")
+        stored = os.path.join(unpacked, "sample", "__init__.py")
+        with open(stored, "rb") as f:
+            stored_contents = f.read()
+        # Editing an installed file leaves the store unchanged.
+        with open(installed, "ab") as f:
+            f.write(b"# edited\n")
+        with open(stored, "rb") as f:
+            assert f.read() == stored_contents
+        # Generated files never write through to the store.
+        assert not os.path.samefile(
+            os.path.join(self.dest_dist_info, "RECORD"),
+            os.path.join(unpacked, "sample-1.2.0.dist-info", "RECORD"),
+        )
+
+    def test_install_script_from_wheel_store(self, tmpdir: Path) -> None:
+        wheel_path = os.fspath(
+            make_wheel(
+                "sample",
+                "1.2.0",
+                extra_data_files={"scripts/sample": "#!python\nprint('hi')\n"},
+            ).save_to_dir(tmpdir)
+        )
+        scheme = Scheme(
+            purelib=os.path.join(tmpdir, "lib"),
+            platlib=os.path.join(tmpdir, "lib"),
+            headers=os.path.join(tmpdir, "headers"),
+            scripts=os.path.join(tmpdir, "bin"),
+            data=os.path.join(tmpdir, "data"),
+        )
+        store = UnpackedWheelStore(os.path.join(tmpdir, "cache"))
+        wheel.install_wheel(
+            "sample",
+            wheel_path,
+            scheme=scheme,
+            req_description="sample",
+            wheel_store=store,
+        )
+
+        # Scripts have their shebang rewritten, so they cannot be linked.
+        with open(os.path.join(tmpdir, "bin", "sample")) as f:
+            assert f.readline() != "#!python\n"
+        stored_script = os.path.join(
+            store.get_path_for_wheel(wheel_path),
+            "sample-1.2.0.data",
+            "scripts",
+            "sample",
+        )
+        with open(stored_script) as f:
+            assert f.readline() == "#!python\n"
+
     def test_std_install_with_direct_url(self, data: TestData, tmpdir: Path) -> None:
         """Test that install_wheel creates direct_url.json metadata when
         provided with a direct_url argument. Also test that the RECORDS
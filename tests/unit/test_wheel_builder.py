@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import os
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import cast
+from unittest.mock import Mock
 
 import pytest
 
@@ -80,3 +82,37 @@ def test_should_not_cache_local_directory(tmpdir: Path, name: str) -> None:
     project_dir.mkdir()
     req = ReqMock(link=Link(path_to_url(str(project_dir))))
     assert not wheel_builder._should_cache(cast(InstallRequirement, req))
+
+
+@pytest.mark.parametrize("jobs", [1, 3])
+def test_build_all(monkeypatch: pytest.MonkeyPatch, jobs: int) -> None:
+    build_times = {"slow": 0.2, "failing": 0.1, "fast": 0}
+
+    def fake_build_one(
+        req: InstallRequirement, output_dir: str, verify: bool, editable: bool
+    ) -> str | None:
+        assert req.name
+        time.sleep(build_times[req.name])
+        if req.name == "failing":
+            return None
+        return os.path.join(output_dir, f"{req.name}-1.0-py3-none-any.whl")
+
+    monkeypatch.setattr(wheel_builder, "_build_one", fake_build_one)
+    monkeypatch.setattr(
+        wheel_builder, "_get_cache_dir", lambda req, wheel_cache: "/cache"
+    )
+    reqs = [cast(InstallRequirement, ReqMock(name=name)) for name in build_times]
+
+    results = list(
+        wheel_builder._build_all(
+            reqs, Mock(), verify=True, allow_editables=False, jobs=jobs
+        )
+    )
+
+    # The results are in the order of the requirements, whatever the order
+    # the builds finished in.
+    assert results == [
+        (reqs[0], "/cache", os.path.join("/cache", "slow-1.0-py3-none-any.whl")),
+        (reqs[1], "/cache", None),
+        (reqs[2], "/cache", os.path.join("/cache", "fast-1.0-py3-none-any.whl")),
+    ]
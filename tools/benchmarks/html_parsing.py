@@ -0,0 +1,82 @@
+"""Compare the two ways pip extracts links from HTML simple repository pages.
+
+Run from the root of the repository, e.g.::
+
+    python tools/benchmarks/html_parsing.py --files 20000
+
+HTMLParser is what pip falls back to for pages with unusual markup, the fast
+path is used for pages made only of the markup simple repositories serve.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+from pip._internal.index.collector import (
+    HTMLLinkParser,
+    _find_simple_start_tags,
+)
+
+
+def make_page(files: int) -> str:
+    lines = [
+        "<!DOCTYPE html>",
+        "<html>",
+        '<head><meta name="pypi:repository-version" content="1.1">',
+        "<title>Links for example</title></head>",
+        "<body>",
+        "<h1>Links for example</h1>",
+    ]
+    for i in range(files):
+        filename = f"example-{i // 20}.{i % 20}-cp312-cp312-manylinux_2_17_x86_64.whl"
+        lines.append(
+            f'<a href="https://files.example.com/packages/{i:06x}/{filename}'
+            f'#sha256={i:064x}" data-requires-python="&gt;=3.9" '
+            f'data-dist-info-metadata="sha256={i:064x}" '
+            f'data-core-metadata="sha256={i:064x}">{filename}</a><br />'
+        )
+    lines += ["</body>", "</html>", ""]
+    return "\n".join(lines)
+
+
+def parse_with_html_parser(text: str) -> list[dict[str, str | None]]:
+    parser = HTMLLinkParser("https://example.com/simple/example/")
+    parser.feed(text)
+    return parser.anchors
+
+
+def parse_with_fast_path(text: str) -> list[dict[str, str | None]]:
+    start_tags = _find_simple_start_tags(text)
+    assert start_tags is not None, "the page should not need HTMLParser"
+    parser = HTMLLinkParser("https://example.com/simple/example/")
+    for tag, attrs in start_tags:
+        parser.handle_starttag(tag, attrs)
+    return parser.anchors
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--files", type=int, default=10000)
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    text = make_page(args.files)
+    assert parse_with_fast_path(text) == parse_with_html_parser(text)
+    print(f"{args.files} links, {len(text) / 1024 / 1024:.1f} MiB of HTML")
+
+    results = {}
+    for func in (parse_with_html_parser, parse_with_fast_path):
+        timer = timeit.Timer(lambda: func(text))  # noqa: B023
+        results[func.__name__] = min(timer.repeat(repeat=args.repeat, number=1))
+        print(f"{func.__name__:>24}: {results[func.__name__] * 1000:8.1f} ms")
+    speedup = results["parse_with_html_parser"] / results["parse_with_fast_path"]
+    print(f"{'speedup':>24}: {speedup:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
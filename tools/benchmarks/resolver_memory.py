@@ -0,0 +1,154 @@
+"""Measure the peak memory use of pip resolving many synthetic projects.
+
+Run from the root of the repository, e.g.::
+
+    python tools/benchmarks/resolver_memory.py --projects 1000
+
+This generates a local simple repository in which each project depends on the
+next few ones, and the newest version of every tenth project can't be used,
+so that the resolver has to reject candidates. ``pip install --dry-run``
+resolves the first project in a subprocess, whose peak RSS is reported.
+Several ``--src`` directories can be given to compare checkouts of pip.
+
+Only works on Unix, where the resource module is available.
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import hashlib
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import zipfile
+
+# Runs pip from the given source directory and reports its peak RSS in KiB
+# (ru_maxrss is in bytes on macOS).
+RUNNER = """
+import resource, sys
+src, args = sys.argv[1], sys.argv[2:]
+sys.path.insert(0, src)
+from pip._internal.cli.main import main
+status = main(args)
+peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+if sys.platform == "darwin":
+    peak //= 1024
+print(peak)
+sys.exit(status)
+"""
+
+
+def project_name(index: int) -> str:
+    return f"project{index:05d}"
+
+
+def make_wheel(directory: str, name: str, version: str, requires: list[str]) -> str:
+    filename = f"{name}-{version}-py3-none-any.whl"
+    dist_info = f"{name}-{version}.dist-info"
+    files = {
+        f"{name}/__init__.py": "",
+        f"{dist_info}/METADATA": "".join(
+            [
+                "Metadata-Version: 2.1\n",
+                f"Name: {name}\n",
+                f"Version: {version}\n",
+                "Requires-Python: >=3.9\n",
+            ]
+            + [f"Requires-Dist: {requirement}\n" for requirement in requires]
+        ),
+        f"{dist_info}/WHEEL": (
+            "Wheel-Version: 1.0\nGenerator: bench\n"
+            "Root-Is-Purelib: true\nTag: py3-none-any\n"
+        ),
+    }
+    record = []
+    for path, content in files.items():
+        digest = hashlib.sha256(content.encode()).digest()
+        encoded = base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+        record.append(f"{path},sha256={encoded},{len(content)}\n")
+    record.append(f"{dist_info}/RECORD,,\n")
+    files[f"{dist_info}/RECORD"] = "".join(record)
+    with zipfile.ZipFile(os.path.join(directory, filename), "w") as zf:
+        for path, content in files.items():
+            zf.writestr(path, content)
+    return filename
+
+
+def make_repository(root: str, projects: int, versions: int, deps: int) -> str:
+    simple = os.path.join(root, "simple")
+    for i in range(projects):
+        name = project_name(i)
+        directory = os.path.join(simple, name)
+        os.makedirs(directory)
+        requires = [
+            f"{project_name(j)}>=1.0" for j in range(i + 1, min(i + 1 + deps, projects))
+        ]
+        anchors = []
+        for v in range(1, versions + 1):
+            version = f"{v}.0"
+            version_requires = list(requires)
+            if i % 10 == 0 and v == versions and i + 1 < projects:
+                # No version satisfies this, so the candidate is rejected.
+                version_requires.append(f"{project_name(i + 1)}>{versions}.0")
+            filename = make_wheel(directory, name, version, version_requires)
+            anchors.append(
+                f'<a href="{filename}" data-requires-python="&gt;=3.9">'
+                f"{filename}</a><br />"
+            )
+        with open(os.path.join(directory, "index.html"), "w") as f:
+            f.write("<html><body>\n" + "\n".join(anchors) + "\n</body></html>\n")
+    return simple
+
+
+def measure(src: str, index_dir: str) -> tuple[int, float]:
+    args = [
+        "install",
+        "--dry-run",
+        "--ignore-installed",
+        "--isolated",
+        "--no-cache-dir",
+        "--disable-pip-version-check",
+        "--quiet",
+        "--index-url",
+        "file://" + index_dir,
+        project_name(0),
+    ]
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", RUNNER, os.path.abspath(src), *args],
+        stdout=subprocess.PIPE,
+        text=True,
+        check=True,
+    )
+    return int(result.stdout.split()[-1]), time.perf_counter() - start
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--projects", type=int, default=1000)
+    arg_parser.add_argument("--versions", type=int, default=5)
+    arg_parser.add_argument("--deps", type=int, default=3)
+    arg_parser.add_argument(
+        "--src",
+        action="append",
+        help="pip source directory to measure (default: src)",
+    )
+    args = arg_parser.parse_args()
+    sources = args.src or [os.path.join(os.path.dirname(__file__), "..", "..", "src")]
+
+    with tempfile.TemporaryDirectory() as root:
+        index_dir = make_repository(root, args.projects, args.versions, args.deps)
+        print(
+            f"{args.projects} projects, {args.versions} versions each, "
+            f"{args.deps} dependencies per version"
+        )
+        for src in sources:
+            peak, elapsed = measure(src, index_dir)
+            print(f"{src}: peak RSS {peak / 1024:.1f} MiB in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Time how long pip takes to evaluate and rank the wheels of a large project.
+
+Run from the root of the repository, e.g.::
+
+    python tools/benchmarks/wheel_evaluation.py --files 10000
+
+The project has one page of wheel links, compatible with the running Python.
+Every link is evaluated as `PackageFinder.find_all_candidates()` does, then
+the applicable candidates are ranked for several specifiers, as the resolver
+does when it looks the project up again. The first pass starts with empty
+caches; the later ones show what is gained by sharing parsed filenames and
+tag priorities. Several ``--src`` directories can be given to compare
+checkouts of pip.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+
+def run(files: int, lookups: int, repeat: int) -> None:
+    from pip._vendor.packaging.specifiers import SpecifierSet
+    from pip._vendor.packaging.utils import canonicalize_name
+
+    from pip._internal.index.package_finder import CandidateEvaluator, LinkEvaluator
+    from pip._internal.models.candidate import InstallationCandidate
+    from pip._internal.models.link import Link
+    from pip._internal.models.target_python import TargetPython
+
+    target_python = TargetPython()
+    supported = target_python.get_sorted_tags()
+    tags = [supported[i * (len(supported) - 1) // 4] for i in range(5)]
+    links = []
+    for i in range(files):
+        tag = tags[i % len(tags)]
+        version = f"{i // (10 * len(tags))}.{i // len(tags) % 10}"
+        filename = f"example-{version}-{tag}.whl"
+        links.append(Link(f"https://files.example.com/{i:06x}/{filename}"))
+
+    for attempt in range(repeat):
+        start = time.perf_counter()
+        link_evaluator = LinkEvaluator(
+            project_name="example",
+            canonical_name=canonicalize_name("example"),
+            formats=frozenset(["binary"]),
+            target_python=target_python,
+            allow_yanked=True,
+        )
+        candidates = []
+        for link in links:
+            _, version = link_evaluator.evaluate_link(link)
+            candidates.append(InstallationCandidate("example", version, link))
+        evaluated = time.perf_counter()
+        for lookup in range(lookups):
+            evaluator = CandidateEvaluator.create(
+                "example",
+                target_python=target_python,
+                specifier=SpecifierSet(f">={lookup}"),
+            )
+            result = evaluator.compute_best_candidate(candidates)
+            assert len(result.applicable_candidates) > 0
+        ranked = time.perf_counter()
+        label = "cold" if attempt == 0 else "warm"
+        print(
+            f"  {label}: evaluate {(evaluated - start) * 1000:7.1f} ms, "
+            f"rank {(ranked - evaluated) * 1000:7.1f} ms"
+        )
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--files", type=int, default=10000)
+    arg_parser.add_argument("--lookups", type=int, default=5)
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    arg_parser.add_argument(
+        "--src",
+        action="append",
+        help="pip source directory to measure (default: src)",
+    )
+    arg_parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = arg_parser.parse_args()
+
+    if args.worker is not None:
+        sys.path.insert(0, args.worker)
+        run(args.files, args.lookups, args.repeat)
+        return
+
+    sources = args.src or [os.path.join(os.path.dirname(__file__), "..", "..", "src")]
+    print(f"{args.files} wheel links, ranked for {args.lookups} specifiers")
+    for src in sources:
+        print(f"{src}:", flush=True)
+        # Each checkout is measured in a fresh interpreter, with cold caches.
+        subprocess.run(
+            [
+                sys.executable,
+                __file__,
+                "--worker",
+                os.path.abspath(src),
+                "--files",
+                str(args.files),
+                "--lookups",
+                str(args.lookups),
+                "--repeat",
+                str(args.repeat),
+            ],
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Summarize a profile written by ``pip install --resolver-profile``.
+
+Run from the root of the repository, e.g.::
+
+    python tools/summarize_resolver_profile.py profile.json --top 20
+
+Besides the summary pip logs with ``-v``, this lists the rounds that took
+the longest, and the conflicts pip backtracked on most often.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from collections import Counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from pip._internal.resolution.resolvelib.profiler import (
+    PROFILE_VERSION,
+    summarize_profile,
+)
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("profile")
+    arg_parser.add_argument("--top", type=int, default=10)
+    args = arg_parser.parse_args()
+
+    with open(args.profile, encoding="utf-8") as f:
+        data = json.load(f)
+    if data.get("version") != PROFILE_VERSION:
+        sys.exit(f"Unsupported profile version: {data.get('version')!r}")
+
+    for line in summarize_profile(data, top=args.top):
+        print(line)
+
+    rounds = [r for r in data["rounds"] if r["seconds"] is not None]
+    slowest = sorted(rounds, key=lambda r: r["seconds"], reverse=True)
+    print("Slowest rounds:")
+    for r in slowest[: args.top]:
+        outcome = r["pinned"] or f"{len(r['rejected'])} candidates rejected"
+        print(f"  #{r['round']}: {r['seconds']:.2f}s on {r['chosen']} ({outcome})")
+
+    causes = Counter(cause for r in data["rounds"] for cause in r["backtrack_causes"])
+    if causes:
+        print("Most frequent causes of backtracking:")
+        for cause, count in causes.most_common(args.top):
+            print(f"  {count:>5} {cause}")
+
+
+if __name__ == "__main__":
+    main()